@@ -0,0 +1,63 @@
+"""Compare the JSON codecs on a full ThermIQ-MQTT data frame.
+
+Run from the repository root:
+
+    python benchmarks/bench_codec.py
+
+Reports the time per frame to parse a 120 register frame when the MQTT
+payload is first decoded to str (as done before the bytes fast path) and
+when the raw bytes are parsed directly, and to encode a single register
+write, for every codec available in this interpreter.
+"""
+
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(
+    0,
+    os.path.join(os.path.dirname(__file__), "..", "custom_components", "thermiq_mqtt"),
+)
+
+from thermiq_core.codec import CODEC_JSON, CODEC_ORJSON, JsonCodec, OrjsonCodec, orjson
+
+
+def make_frame(registers=120):
+    """Return a decimal format ThermIQ-MQTT data frame as str."""
+    frame = {
+        "Client_Name": "ThermIQ_room2",
+        "app_info": "ThermIQ-room2 v2.10",
+        "time": "2024-01-01 12:00:00",
+        "timestamp": 1704106800,
+        "rssi": -61,
+        "INDR_T": 21.5,
+        "EVU": 0,
+    }
+    for reg in range(registers):
+        frame["d" + format(reg, "03d")] = (reg * 37) % 200
+    return json.dumps(frame)
+
+
+def bench(number=20000):
+    raw = make_frame().encode()
+    codecs = [JsonCodec()]
+    if orjson is not None:
+        codecs.append(OrjsonCodec())
+    else:
+        print(f"{CODEC_ORJSON} not installed, only {CODEC_JSON} is measured")
+
+    print(f"frame: {len(raw)} bytes, {number} runs")
+    print(f"{'codec':8} {'decode+loads':>14} {'loads(bytes)':>14} {'dumps':>8}  [us]")
+    for codec in codecs:
+        t_str = timeit.timeit(lambda: codec.loads(raw.decode()), number=number)
+        t_bytes = timeit.timeit(lambda: codec.loads(raw), number=number)
+        t_dumps = timeit.timeit(lambda: codec.dumps({"d050": 21}), number=number)
+        print(
+            f"{codec.name:8} {t_str / number * 1e6:14.2f} "
+            f"{t_bytes / number * 1e6:14.2f} {t_dumps / number * 1e6:8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    bench()
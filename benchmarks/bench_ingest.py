@@ -0,0 +1,282 @@
+"""Replay recorded ThermIQ-MQTT data frames through the full ingest path.
+
+Run from the repository root, with the packages of requirements_test.txt
+installed (no broker or network is needed):
+
+    python benchmarks/bench_ingest.py [--rounds 50] [--codec json] [--json]
+
+The frames in benchmarks/frames are fed to HeatPump.message_received one at
+a time, each processed by the event loop before the next arrives, with the
+sensor, binary_sensor, input_number and input_select entities of a
+heatpump listening. A minimal fake hass counts the bus events fired, the
+service calls scheduled and the entity state writes.
+
+Reported per frame, after a warm up pass that refreshes every entity:
+
+    us        time from message_received until the frame is dispatched
+    alloc     peak KiB allocated while a frame is processed (tracemalloc)
+    blocks    memory blocks still allocated after a frame, leaks show here
+    events    bus events fired
+    services  service calls scheduled
+    writes    entity state writes
+
+The frame sets and rounds are fixed, so the output of two commits can be
+compared directly. Use --json to keep a result for later.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+import types
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from custom_components.thermiq_mqtt import (
+    binary_sensor,
+    input_number,
+    input_select,
+    sensor,
+)
+from custom_components.thermiq_mqtt.const import (
+    CONF_ENTITY_PLATFORM,
+    CONF_ID,
+    CONF_JSON_CODEC,
+    CONF_LANGUAGE,
+    CONF_MQTT_DBG,
+    CONF_MQTT_HEX,
+    CONF_MQTT_NODE,
+    DOMAIN,
+    PLATFORM_INPUT_NUMBER,
+    PLATFORM_INPUT_SELECT,
+)
+from custom_components.thermiq_mqtt.heatpump import HeatPump
+
+FRAMES_DIR = os.path.join(os.path.dirname(__file__), "frames")
+FRAME_SETS = [("decimal", False), ("hex", True)]
+MQTT_NODE = "ThermIQ/room2"
+
+
+class FakeBus:
+    """Event bus counting the events fired."""
+
+    def __init__(self):
+        self.fired = 0
+
+    def fire(self, event_type, event_data=None):
+        self.fired += 1
+
+    def async_fire(self, event_type, event_data=None):
+        self.fired += 1
+
+    def async_listen(self, event_type, listener):
+        return lambda: None
+
+
+class FakeServices:
+    """Service registry counting the calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def async_call(self, domain, service, service_data=None, **kwargs):
+        self.calls += 1
+
+
+class FakeHass:
+    """The parts of HomeAssistant used while ingesting frames."""
+
+    def __init__(self, loop):
+        self.loop = loop
+        self.bus = FakeBus()
+        self.services = FakeServices()
+        self.data = {}
+        self.config = types.SimpleNamespace(
+            path=lambda *parts: os.path.join(FRAMES_DIR, *parts)
+        )
+
+    def async_create_task(self, target, *args, **kwargs):
+        return self.loop.create_task(target)
+
+    def async_add_executor_job(self, target, *args):
+        return self.loop.run_in_executor(None, target, *args)
+
+
+class FakePlatform:
+    """Entity platform of the input_number and input_select entities."""
+
+    def __init__(self, hass, counter):
+        self.hass = hass
+        self.counter = counter
+
+    async def async_add_entities(self, entities, update_before_add=False):
+        await add_entities(self.hass, entities, self.counter)
+
+
+class WriteCounter:
+    """Counter of entity state writes."""
+
+    def __init__(self):
+        self.writes = 0
+
+    def write(self):
+        self.writes += 1
+
+
+async def add_entities(hass, entities, counter):
+    """Add entities to the heatpump without a state machine."""
+    for entity in entities:
+        entity.hass = hass
+        entity.async_write_ha_state = counter.write
+        await entity.async_added_to_hass()
+
+
+def make_hass(loop):
+    """Return a fake hass with the entity platforms, and its write counter."""
+    hass = FakeHass(loop)
+    counter = WriteCounter()
+    hass.data[DOMAIN] = types.SimpleNamespace(worker=None, _heatpumps={})
+    platform_ = FakePlatform(hass, counter)
+    hass.data[CONF_ENTITY_PLATFORM] = {
+        PLATFORM_INPUT_NUMBER: [platform_],
+        PLATFORM_INPUT_SELECT: [platform_],
+    }
+    return hass, counter
+
+
+async def add_heatpump(
+    hass, counter, pump_id="vp1", node=MQTT_NODE, hex_format=False, codec="json"
+):
+    """Return a configured heatpump with all its entities listening."""
+    entry = types.SimpleNamespace(
+        data={
+            CONF_ID: pump_id,
+            CONF_MQTT_NODE: node,
+            CONF_LANGUAGE: "en",
+            CONF_MQTT_HEX: hex_format,
+            CONF_MQTT_DBG: False,
+            CONF_JSON_CODEC: codec,
+        }
+    )
+    heatpump = HeatPump(hass, entry)
+    await heatpump.update_config(entry)
+    hass.data[DOMAIN]._heatpumps[pump_id] = heatpump
+    for module in (sensor, binary_sensor):
+        added = []
+        await module.async_setup_entry(
+            hass, entry, lambda entities, *args: added.extend(entities)
+        )
+        await add_entities(hass, added, counter)
+    await input_number.setup_input_numbers(heatpump)
+    await input_select.setup_input_select(heatpump)
+    return heatpump
+
+
+async def setup(loop, hex_format, codec):
+    """Return a fake hass, a configured heatpump and its write counter."""
+    hass, counter = make_hass(loop)
+    heatpump = await add_heatpump(hass, counter, hex_format=hex_format, codec=codec)
+    return hass, heatpump, counter
+
+
+def load_frames(name):
+    """Return the MQTT messages of a frame set, payloads as received (bytes)."""
+    topic = MQTT_NODE + "/data"
+    with open(os.path.join(FRAMES_DIR, name + ".jsonl"), "rb") as file:
+        return [
+            types.SimpleNamespace(topic=topic, payload=line.strip())
+            for line in file
+            if line.strip()
+        ]
+
+
+async def feed(heatpump, messages):
+    """Hand messages over one at a time, letting the loop process each."""
+    for message in messages:
+        heatpump.message_received(message)
+        await asyncio.sleep(0)
+
+
+async def measure(name, hex_format, rounds, codec):
+    """Replay a frame set and return the results per frame."""
+    loop = asyncio.get_running_loop()
+    hass, heatpump, counter = await setup(loop, hex_format, codec)
+    messages = load_frames(name)
+    await feed(heatpump, messages)
+
+    events, services, writes = hass.bus.fired, hass.services.calls, counter.writes
+    start = time.perf_counter()
+    for _ in range(rounds):
+        await feed(heatpump, messages)
+    elapsed = time.perf_counter() - start
+    frames = rounds * len(messages)
+    events = hass.bus.fired - events
+    services = hass.services.calls - services
+    writes = counter.writes - writes
+
+    peak = 0
+    blocks = sys.getallocatedblocks()
+    tracemalloc.start()
+    for message in messages:
+        tracemalloc.reset_peak()
+        current = tracemalloc.get_traced_memory()[0]
+        await feed(heatpump, [message])
+        peak += tracemalloc.get_traced_memory()[1] - current
+    tracemalloc.stop()
+    blocks = sys.getallocatedblocks() - blocks
+
+    return {
+        "frames": name,
+        "count": len(messages),
+        "us": elapsed / frames * 1e6,
+        "alloc": peak / len(messages) / 1024,
+        "blocks": blocks / len(messages),
+        "events": events / frames,
+        "services": services / frames,
+        "writes": writes / frames,
+        "coalesced": heatpump.frame_stats["coalesced"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--codec", default="json", help="auto, json or orjson")
+    parser.add_argument("--json", action="store_true", help="print JSON results")
+    args = parser.parse_args()
+
+    results = [
+        asyncio.run(measure(name, hex_format, args.rounds, args.codec))
+        for name, hex_format in FRAME_SETS
+    ]
+    if args.json:
+        print(
+            json.dumps({"rounds": args.rounds, "codec": args.codec, "results": results})
+        )
+        return
+
+    print(
+        f"python {platform.python_version()}, codec {args.codec}, "
+        f"{args.rounds} rounds"
+    )
+    print(
+        f"{'frames':8} {'count':>5} {'us':>8} {'alloc':>7} {'blocks':>7} "
+        f"{'events':>7} {'services':>8} {'writes':>7}"
+    )
+    for result in results:
+        print(
+            f"{result['frames']:8} {result['count']:5} {result['us']:8.1f} "
+            f"{result['alloc']:7.1f} {result['blocks']:7.1f} "
+            f"{result['events']:7.2f} {result['services']:8.2f} "
+            f"{result['writes']:7.2f}"
+        )
+        if result["coalesced"]:
+            print(f"  {result['coalesced']} frames coalesced, timing is not valid")
+
+
+if __name__ == "__main__":
+    main()
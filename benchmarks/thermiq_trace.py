@@ -0,0 +1,220 @@
+"""Record and replay ThermIQ-MQTT traffic.
+
+Record the data, write and set topics of a node from a broker (needs
+paho-mqtt):
+
+    python benchmarks/thermiq_trace.py record ThermIQ/room2 room2.trace.gz \\
+        --host localhost --seconds 3600
+
+A heatpump in Home Assistant records the same traffic with the
+thermiq_mqtt.record service, the trace is written to the config directory.
+
+Replay the data frames of a trace through the ingest path of heatpumps on
+the fake hass of bench_ingest.py (needs the packages in
+requirements_test.txt), or publish them to a broker:
+
+    python benchmarks/thermiq_trace.py replay room2.trace.gz --speed 10 --fanout 20
+    python benchmarks/thermiq_trace.py replay room2.trace.gz --broker localhost
+
+--speed is 1 for the recorded pace, N for N times faster and max to feed
+the frames back to back. --fanout K replays the trace for K synthetic
+heatpumps, with nodes <node>-1 ... <node>-K. Recorded writes are counted
+but never replayed, so a real heatpump is not written to.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+import types
+
+sys.path.insert(
+    0,
+    os.path.join(os.path.dirname(__file__), "..", "custom_components", "thermiq_mqtt"),
+)
+
+from thermiq_core.trace import TRACE_TOPICS, TraceWriter, append_trace, read_trace
+
+# Records kept in memory before they are appended to the trace
+FLUSH_RECORDS = 100
+
+
+def mqtt_client(host, port):
+    """Return a connected paho-mqtt client with its network loop running."""
+    try:
+        from paho.mqtt import client as paho
+    except ImportError:
+        sys.exit("paho-mqtt is needed to talk to a broker: pip install paho-mqtt")
+    try:
+        client = paho.Client(paho.CallbackAPIVersion.VERSION2)
+    except AttributeError:
+        # paho-mqtt 1.x
+        client = paho.Client()
+    client.connect(host, port)
+    client.loop_start()
+    return client
+
+
+def split_host(host):
+    """Return (host, port) of host[:port]."""
+    host, _, port = host.partition(":")
+    return host, int(port or 1883)
+
+
+def record(args):
+    """Record the traffic of a node from a broker."""
+    writer = TraceWriter(args.node)
+    prefix = args.node + "/"
+
+    def on_message(client, userdata, message):
+        writer.record(message.topic[len(prefix) :], message.payload)
+
+    client = mqtt_client(*split_host(args.host))
+    client.on_message = on_message
+    for topic in TRACE_TOPICS:
+        client.subscribe(prefix + topic)
+    print(f"Recording {prefix}{{{','.join(TRACE_TOPICS)}}} to {args.trace}")
+    end = time.monotonic() + args.seconds
+    try:
+        while time.monotonic() < end:
+            time.sleep(1)
+            if len(writer) >= FLUSH_RECORDS:
+                append_trace(args.trace, writer.header, writer.take())
+    except KeyboardInterrupt:
+        pass
+    client.loop_stop()
+    client.disconnect()
+    append_trace(args.trace, writer.header, writer.take())
+    print(f"Recorded {writer.count} messages")
+
+
+def fanout_nodes(node, fanout):
+    """Return the nodes to replay a trace of node for."""
+    if fanout <= 1:
+        return [node]
+    return [f"{node}-{index}" for index in range(1, fanout + 1)]
+
+
+async def paced(records, speed):
+    """Yield the records of a trace at speed times the recorded pace.
+
+    Also yields how many seconds the record is behind its schedule.
+    """
+    start = time.monotonic()
+    for elapsed, topic, payload in records:
+        lag = 0.0
+        if speed is not None:
+            lag = time.monotonic() - start - elapsed / speed
+            if lag < 0:
+                await asyncio.sleep(-lag)
+                lag = 0.0
+        yield topic, payload, lag
+
+
+async def replay_fake_hass(header, records, nodes, speed, codec):
+    """Replay data frames through heatpumps on the fake hass."""
+    from bench_ingest import add_heatpump, make_hass
+
+    hass, counter = make_hass(asyncio.get_running_loop())
+    heatpumps = []
+    for index, node in enumerate(nodes, 1):
+        heatpumps.append(
+            (
+                node + "/data",
+                await add_heatpump(hass, counter, f"vp{index}", node, codec=codec),
+            )
+        )
+
+    frames = writes = 0
+    max_lag = 0.0
+    start = time.perf_counter()
+    async for topic, payload, lag in paced(records, speed):
+        if topic != "data":
+            writes += 1
+            continue
+        payload = payload.encode()
+        for data_topic, heatpump in heatpumps:
+            heatpump.message_received(
+                types.SimpleNamespace(topic=data_topic, payload=payload)
+            )
+        await asyncio.sleep(0)
+        frames += 1
+        max_lag = max(max_lag, lag)
+    elapsed = time.perf_counter() - start
+
+    stats = {}
+    for _, heatpump in heatpumps:
+        for key, value in heatpump.frame_stats.items():
+            stats[key] = stats.get(key, 0) + value
+    summary = f"{frames} frames x {len(heatpumps)} heatpumps in {elapsed:.2f} s"
+    if speed is None:
+        delivered = frames * len(heatpumps)
+        summary += f", {elapsed / max(delivered, 1) * 1e6:.1f} us per frame"
+    print(f"{summary}, max lag {max_lag * 1000:.0f} ms")
+    print(
+        f"frames {stats}, state writes {counter.writes}, "
+        f"bus events {hass.bus.fired}, recorded writes skipped {writes}"
+    )
+
+
+async def replay_broker(header, records, nodes, speed, host):
+    """Publish data frames to the data topics of nodes on a broker."""
+    client = mqtt_client(*split_host(host))
+    frames = 0
+    max_lag = 0.0
+    start = time.perf_counter()
+    async for topic, payload, lag in paced(records, speed):
+        if topic != "data":
+            continue
+        for node in nodes:
+            client.publish(node + "/data", payload)
+        frames += 1
+        max_lag = max(max_lag, lag)
+    elapsed = time.perf_counter() - start
+    client.loop_stop()
+    client.disconnect()
+    print(
+        f"Published {frames} frames x {len(nodes)} nodes in {elapsed:.2f} s, "
+        f"max lag {max_lag * 1000:.0f} ms"
+    )
+
+
+def replay(args):
+    """Replay a trace."""
+    header, records = read_trace(args.trace)
+    speed = None if args.speed == "max" else float(args.speed)
+    if speed is not None and speed <= 0:
+        sys.exit("--speed must be positive or max")
+    nodes = fanout_nodes(header["node"], args.fanout)
+    if args.broker:
+        asyncio.run(replay_broker(header, records, nodes, speed, args.broker))
+    else:
+        asyncio.run(replay_fake_hass(header, records, nodes, speed, args.codec))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    parser_record = commands.add_parser("record", help="record from a broker")
+    parser_record.add_argument("node", help="MQTT node, e.g. ThermIQ/room2")
+    parser_record.add_argument("trace", help="trace file to append to")
+    parser_record.add_argument("--host", default="localhost", help="broker host[:port]")
+    parser_record.add_argument("--seconds", type=float, default=3600)
+    parser_record.set_defaults(run=record)
+
+    parser_replay = commands.add_parser("replay", help="replay a trace")
+    parser_replay.add_argument("trace")
+    parser_replay.add_argument("--speed", default="1", help="1, N or max")
+    parser_replay.add_argument("--fanout", type=int, default=1)
+    parser_replay.add_argument("--broker", help="publish to broker host[:port]")
+    parser_replay.add_argument("--codec", default="json", help="auto, json or orjson")
+    parser_replay.set_defaults(run=replay)
+
+    args = parser.parse_args()
+    args.run(args)
+
+
+if __name__ == "__main__":
+    main()
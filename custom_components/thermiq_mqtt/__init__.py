@@ -1,15 +1,26 @@
 """Component for ThermIQ-MQTT support."""
 import logging
+import time
 from builtins import property
 
+import voluptuous as vol
+
+from homeassistant.components import mqtt
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, Platform
-from homeassistant.core import HomeAssistant, Event
+from homeassistant.core import HomeAssistant, Event, ServiceCall
+import homeassistant.helpers.config_validation as cv
 
 from .const import (
     DOMAIN,
     CONF_ID,
+    ATTR_DURATION,
+    ATTR_FRAMES,
+    DEFAULT_PROFILE_FRAMES,
+    DEFAULT_RECORD_DURATION,
+    SERVICE_PROFILE,
+    SERVICE_RECORD,
 )
 
 # from .automation import setup_automations
@@ -30,12 +41,61 @@ PLATFORMS = [
     "binary_sensor",
 ]
 
+RECORD_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_ID): cv.string,
+        vol.Optional(ATTR_DURATION, default=DEFAULT_RECORD_DURATION): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
+    }
+)
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_ID): cv.string,
+        vol.Optional(ATTR_FRAMES, default=DEFAULT_PROFILE_FRAMES): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
+    }
+)
+
+
+def worker_service(hass, handler):
+    """Return a service handler calling handler of the current worker.
+
+    The worker is removed with the last entry and a new one is created with
+    the next, so it is looked up when the service is called.
+    """
+
+    @callback
+    def async_handle(call: ServiceCall):
+        worker = hass.data.get(DOMAIN)
+        if worker is None:
+            _LOGGER.error("No heatpump [%s]", call.data[CONF_ID])
+            return
+        getattr(worker, handler)(call)
+
+    return async_handle
+
+
 async def async_setup(hass, config):
     """Set up HASL integration"""
     _LOGGER.info("Set up ThermIQ-MQTT integration")
 
     if DOMAIN not in hass.data:
         worker = hass.data.setdefault(DOMAIN, ThermIQWorker(hass))
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_RECORD,
+            worker_service(hass, "async_handle_record"),
+            schema=RECORD_SCHEMA,
+        )
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_PROFILE,
+            worker_service(hass, "async_handle_profile"),
+            schema=PROFILE_SCHEMA,
+        )
     return True
 
 
@@ -64,7 +124,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         """Event handler for when HA has started."""
         await hass.async_create_task(setup_input_numbers(heatpump))
         await hass.async_create_task(setup_input_select(heatpump))
-        await hass.async_create_task(heatpump.setup_mqtt())
+        await hass.async_create_task(worker.async_setup_mqtt(heatpump))
 
     # Load the platforms for heatpump
     hass.async_create_task(
@@ -106,6 +166,10 @@ class ThermIQWorker:
         self._heatpumps = {}
         self._fetch_callback_listener = None
         self._worker = True
+        # Data topic -> message callback of the heatpumps using a shared subscription
+        self._routes = {}
+        # Wildcard topic -> [unsubscribe, number of routes]
+        self._shared = {}
 
     @property
     def worker(self):
@@ -132,12 +196,93 @@ class ThermIQWorker:
             f"{DOMAIN}_changed",
             {"action": "remove", "heatpump": config_entry.data[CONF_ID]},
         )
-        self._heatpumps.pop(config_entry.data[CONF_ID])
+        heatpump = self._heatpumps.pop(config_entry.data[CONF_ID])
+        heatpump.async_shutdown()
+        if heatpump.unsubscribe_callback is not None:
+            heatpump.unsubscribe_callback()
+            heatpump.unsubscribe_callback = None
 
     async def update_heatpump_entry(self, config_entry: ConfigEntry):
         heatpump = self._heatpumps[config_entry.data[CONF_ID]]
         await heatpump.update_config(config_entry)
-        await self._hass.async_create_task(heatpump.setup_mqtt())
+        await self._hass.async_create_task(self.async_setup_mqtt(heatpump))
+
+    @callback
+    def async_handle_record(self, call: ServiceCall):
+        """Record the MQTT traffic of a heatpump to a trace in the config directory."""
+        heatpump = self._heatpumps.get(call.data[CONF_ID])
+        if heatpump is None:
+            _LOGGER.error("No heatpump [%s] to record", call.data[CONF_ID])
+            return
+        stamp = time.strftime("%Y%m%d_%H%M%S")
+        path = self._hass.config.path(f"{DOMAIN}_{call.data[CONF_ID]}_{stamp}.trace.gz")
+        heatpump.async_start_recording(path, call.data[ATTR_DURATION])
+
+    @callback
+    def async_handle_profile(self, call: ServiceCall):
+        """Profile the next frames of a heatpump to a pstats file in the config directory."""
+        heatpump = self._heatpumps.get(call.data[CONF_ID])
+        if heatpump is None:
+            _LOGGER.error("No heatpump [%s] to profile", call.data[CONF_ID])
+            return
+        stamp = time.strftime("%Y%m%d_%H%M%S")
+        path = self._hass.config.path(f"{DOMAIN}_{call.data[CONF_ID]}_{stamp}.pstats")
+        heatpump.async_start_profile(path, call.data[ATTR_FRAMES])
+
+    async def async_setup_mqtt(self, heatpump):
+        """Subscribe heatpump to its data topic."""
+        if heatpump.shared_subscription:
+            await heatpump.setup_mqtt(self.async_subscribe_shared)
+        else:
+            await heatpump.setup_mqtt()
+
+    async def async_subscribe_shared(self, topic, msg_callback, encoding=None):
+        """Route topic to msg_callback through a shared wildcard subscription.
+
+        Works like mqtt.async_subscribe. The wildcard replaces the node level,
+        ThermIQ/+/data for ThermIQ/room2/data, and is subscribed once for all
+        heatpumps using it, see shared_topic(). Returns a function that removes
+        the route.
+        """
+        wildcard = shared_topic(topic)
+        self._routes[topic] = msg_callback
+        shared = self._shared.get(wildcard)
+        if shared is None:
+            shared = self._shared[wildcard] = [None, 0]
+            shared[0] = await mqtt.async_subscribe(
+                self._hass, wildcard, self._async_route_message, encoding=encoding
+            )
+        shared[1] += 1
+
+        @callback
+        def remove_route():
+            if self._routes.get(topic) is msg_callback:
+                del self._routes[topic]
+            shared[1] -= 1
+            if shared[1] == 0 and self._shared.get(wildcard) is shared:
+                del self._shared[wildcard]
+                shared[0]()
+
+        return remove_route
+
+    @callback
+    def _async_route_message(self, message):
+        """Pass a message of a shared subscription on to its heatpump."""
+        msg_callback = self._routes.get(message.topic)
+        if msg_callback is not None:
+            msg_callback(message)
 
     def is_idle(self) -> bool:
         return not bool(self._heatpumps)
+
+
+def shared_topic(topic):
+    """Return the wildcard topic shared by all nodes, ThermIQ/+/data.
+
+    A node without a prefix, ThermIQ/data, keeps its own topic, since +/data
+    would match the data topic of every other device.
+    """
+    levels = topic.split("/")
+    if len(levels) > 2:
+        levels[-2] = "+"
+    return "/".join(levels)
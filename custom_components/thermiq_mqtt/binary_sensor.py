@@ -26,18 +26,18 @@ from homeassistant.const import (
 from .const import (
     DOMAIN,
     CONF_ID,
+    PLATFORM_BINARY_SENSOR,
 )
 
-from .heatpump.thermiq_regs import (
+from .thermiq_core.thermiq_regs import (
     FIELD_BITMASK,
     FIELD_MAXVALUE,
     FIELD_MINVALUE,
     FIELD_REGNUM,
     FIELD_REGTYPE,
     FIELD_UNIT,
-    id_names,
-    reg_id,
 )
+from .thermiq_core.registers import BY_PLATFORM
 
 
 from functools import cached_property
@@ -64,30 +64,31 @@ async def async_setup_entry(
     heatpump = hass.data[DOMAIN]._heatpumps[config_entry.data[CONF_ID]]
     entities = []
 
-    for key in reg_id:
-        if reg_id[key][1] in [
-            "binary_sensor",
-        ]:
-            device_id = key
-            if key in id_names:
-                friendly_name = id_names[key][heatpump._langid]
-            else:
-                friendly_name = None
-            vp_reg = reg_id[key][FIELD_REGNUM]
-            vp_type = reg_id[key][FIELD_REGTYPE]
-            bitmask = reg_id[key][FIELD_BITMASK]
-
-            entities.append(
-                HeatPumpBinarySensor(
-                    hass,
-                    heatpump,
-                    device_id,
-                    vp_reg,
-                    friendly_name,
-                    bitmask,
-                )
+    for spec in BY_PLATFORM[PLATFORM_BINARY_SENSOR]:
+        key = spec.name
+        if not heatpump.entity_selected(key):
+            continue
+        device_id = key
+        friendly_name = heatpump.friendly_name(key)
+
+        entities.append(
+            HeatPumpBinarySensor(
+                hass,
+                heatpump,
+                device_id,
+                spec.register,
+                friendly_name,
+                spec.bitmask,
             )
-    async_add_entities(entities)
+        )
+    if heatpump.lazy_entities:
+        # Add a sensor when its register is received the first time
+        heatpump.async_add_entities_when_seen(
+            [(entity._idx, entity) for entity in entities],
+            lambda group: async_add_entities(group, True),
+        )
+    else:
+        async_add_entities(entities)
 
 
 class HeatPumpBinarySensor(BinarySensorEntity):
@@ -117,12 +118,6 @@ class HeatPumpBinarySensor(BinarySensorEntity):
         # ???
         self._sorter = int("0x" + vp_reg[1:], 0) * 65536 + int(bitmask)
 
-        # Listen for the ThermIQ rec event indicating new data
-        hass.bus.async_listen(
-            heatpump._domain + "_" + heatpump._id + "_msg_rec_event",
-            self._async_update_event,
-        )
-
         # Is this needed
         self._attr_device_info = {
             ATTR_IDENTIFIERS: {(heatpump._id, "ThermIQ-MQTT")},
@@ -172,28 +167,32 @@ class HeatPumpBinarySensor(BinarySensorEntity):
         """Update the new state of the sensor."""
 
         _LOGGER.debug("update: " + self._idx)
-        reg_state = self._hpstate.get_value(self._vp_reg)
-        if self._state is None:
+        reg_state = self._hpstate.get(self._vp_reg)
+        if reg_state is None:
             _LOGGER.warning("Could not get data for %s", self._idx)
         else:
             self._state = (int(reg_state) & self._bitmask) > 0
 
-    async def _async_update_event(self, event):
-        """Update the new state of the sensor."""
+    async def async_added_to_hass(self):
+        """Listen for new data in the register bit of the sensor."""
+        self.async_on_remove(
+            self._heatpump.async_add_bit_listener(
+                self._vp_reg, self._bitmask, self._async_update_register
+            )
+        )
+        # Only changed bits are dispatched, read the bit if it was received
+        if self._hpstate["mqtt_counter"] > 0:
+            reg_state = self._hpstate.get(self._vp_reg)
+            if reg_state is not None:
+                self._async_update_register((int(reg_state) & self._bitmask) > 0)
 
-        _LOGGER.debug("event: " + self._idx)
-        reg_state = self._hpstate[self._vp_reg]
-        if reg_state is None:
-            _LOGGER.debug("Could not get data for %s", self._idx)
-            self._state = None
-            bool_state = None
-        else:
-            bool_state = (int(reg_state) & self._bitmask) > 0
+    @callback
+    def _async_update_register(self, bool_state):
+        """Update the new state of the sensor."""
 
         if self._state != bool_state:
             self._state = bool_state
-            self.async_schedule_update_ha_state()
-            _LOGGER.debug("async_update_ha: %s", str(bool_state))
+            self._heatpump.async_schedule_write(self)
 
     @property
     def device_class(self):
@@ -14,8 +14,40 @@ from .const import (
     CONF_MQTT_HEX,
     CONF_MQTT_DBG,
     CONF_LANGUAGE,
+    CONF_JSON_CODEC,
+    CONF_WRITE_BATCH,
+    CONF_WRITE_ACK_FRAMES,
+    CONF_WRITE_ACK_TIMEOUT,
+    CONF_WRITE_RETRIES,
+    CONF_WRITE_DEBOUNCE,
+    CONF_WRITE_MIN_INTERVAL,
+    CONF_FRAME_INTERVAL,
+    CONF_DEADBANDS,
+    CONF_ENTITIES,
+    CONF_LAZY_ENTITIES,
+    CONF_PROFILE,
+    CONF_SHARED_SUBSCRIPTION,
+    CONF_STATISTICS,
+    DEFAULT_JSON_CODEC,
+    DEFAULT_WRITE_BATCH,
+    DEFAULT_WRITE_ACK_FRAMES,
+    DEFAULT_WRITE_ACK_TIMEOUT,
+    DEFAULT_WRITE_RETRIES,
+    DEFAULT_WRITE_DEBOUNCE,
+    DEFAULT_WRITE_MIN_INTERVAL,
+    DEFAULT_FRAME_INTERVAL,
+    DEFAULT_DEADBANDS,
+    DEFAULT_ENTITIES,
+    DEFAULT_LAZY_ENTITIES,
+    DEFAULT_PROFILE,
+    DEFAULT_SHARED_SUBSCRIPTION,
+    DEFAULT_STATISTICS,
     AVAILABLE_LANGUAGES,
 )
+from .thermiq_core.codec import AVAILABLE_CODECS
+from .thermiq_core.deadband import parse_deadbands
+from .thermiq_core.profiles import AVAILABLE_PROFILES
+from .thermiq_core.selection import parse_selection
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -57,6 +89,53 @@ class DomainConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 ),
                 vol.Required(CONF_MQTT_HEX, default=False): cv.boolean,
                 vol.Required(CONF_MQTT_DBG, default=False): cv.boolean,
+                vol.Required(
+                    CONF_JSON_CODEC, default=DEFAULT_JSON_CODEC
+                ): selector.SelectSelector(
+                    selector.SelectSelectorConfig(
+                        options=AVAILABLE_CODECS,
+                        mode=selector.SelectSelectorMode.DROPDOWN,
+                    ),
+                ),
+                vol.Required(
+                    CONF_WRITE_BATCH, default=DEFAULT_WRITE_BATCH
+                ): cv.positive_int,
+                vol.Required(
+                    CONF_WRITE_ACK_FRAMES, default=DEFAULT_WRITE_ACK_FRAMES
+                ): cv.positive_int,
+                vol.Required(
+                    CONF_WRITE_ACK_TIMEOUT, default=DEFAULT_WRITE_ACK_TIMEOUT
+                ): cv.positive_int,
+                vol.Required(
+                    CONF_WRITE_RETRIES, default=DEFAULT_WRITE_RETRIES
+                ): cv.positive_int,
+                vol.Required(
+                    CONF_WRITE_DEBOUNCE, default=DEFAULT_WRITE_DEBOUNCE
+                ): cv.positive_int,
+                vol.Required(
+                    CONF_WRITE_MIN_INTERVAL, default=DEFAULT_WRITE_MIN_INTERVAL
+                ): cv.positive_int,
+                vol.Required(
+                    CONF_FRAME_INTERVAL, default=DEFAULT_FRAME_INTERVAL
+                ): cv.positive_int,
+                vol.Optional(CONF_DEADBANDS, default=DEFAULT_DEADBANDS): cv.string,
+                vol.Optional(CONF_ENTITIES, default=DEFAULT_ENTITIES): cv.string,
+                vol.Required(
+                    CONF_LAZY_ENTITIES, default=DEFAULT_LAZY_ENTITIES
+                ): cv.boolean,
+                vol.Required(
+                    CONF_PROFILE, default=DEFAULT_PROFILE
+                ): selector.SelectSelector(
+                    selector.SelectSelectorConfig(
+                        options=AVAILABLE_PROFILES,
+                        custom_value=True,
+                        mode=selector.SelectSelectorMode.DROPDOWN,
+                    ),
+                ),
+                vol.Required(
+                    CONF_SHARED_SUBSCRIPTION, default=DEFAULT_SHARED_SUBSCRIPTION
+                ): cv.boolean,
+                vol.Required(CONF_STATISTICS, default=DEFAULT_STATISTICS): cv.boolean,
             }
         )
 
@@ -84,6 +163,64 @@ class DomainConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     vol.Required(
                         CONF_MQTT_DBG, default=user_input[CONF_MQTT_DBG]
                     ): cv.boolean,
+                    vol.Required(
+                        CONF_JSON_CODEC, default=user_input[CONF_JSON_CODEC]
+                    ): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=AVAILABLE_CODECS,
+                            mode=selector.SelectSelectorMode.DROPDOWN,
+                        ),
+                    ),
+                    vol.Required(
+                        CONF_WRITE_BATCH, default=user_input[CONF_WRITE_BATCH]
+                    ): cv.positive_int,
+                    vol.Required(
+                        CONF_WRITE_ACK_FRAMES, default=user_input[CONF_WRITE_ACK_FRAMES]
+                    ): cv.positive_int,
+                    vol.Required(
+                        CONF_WRITE_ACK_TIMEOUT,
+                        default=user_input[CONF_WRITE_ACK_TIMEOUT],
+                    ): cv.positive_int,
+                    vol.Required(
+                        CONF_WRITE_RETRIES, default=user_input[CONF_WRITE_RETRIES]
+                    ): cv.positive_int,
+                    vol.Required(
+                        CONF_WRITE_DEBOUNCE, default=user_input[CONF_WRITE_DEBOUNCE]
+                    ): cv.positive_int,
+                    vol.Required(
+                        CONF_WRITE_MIN_INTERVAL,
+                        default=user_input[CONF_WRITE_MIN_INTERVAL],
+                    ): cv.positive_int,
+                    vol.Required(
+                        CONF_FRAME_INTERVAL, default=user_input[CONF_FRAME_INTERVAL]
+                    ): cv.positive_int,
+                    vol.Optional(
+                        CONF_DEADBANDS,
+                        default=user_input.get(CONF_DEADBANDS, DEFAULT_DEADBANDS),
+                    ): cv.string,
+                    vol.Optional(
+                        CONF_ENTITIES,
+                        default=user_input.get(CONF_ENTITIES, DEFAULT_ENTITIES),
+                    ): cv.string,
+                    vol.Required(
+                        CONF_LAZY_ENTITIES, default=user_input[CONF_LAZY_ENTITIES]
+                    ): cv.boolean,
+                    vol.Required(
+                        CONF_PROFILE, default=user_input[CONF_PROFILE]
+                    ): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=AVAILABLE_PROFILES,
+                            custom_value=True,
+                            mode=selector.SelectSelectorMode.DROPDOWN,
+                        ),
+                    ),
+                    vol.Required(
+                        CONF_SHARED_SUBSCRIPTION,
+                        default=user_input[CONF_SHARED_SUBSCRIPTION],
+                    ): cv.boolean,
+                    vol.Required(
+                        CONF_STATISTICS, default=user_input[CONF_STATISTICS]
+                    ): cv.boolean,
                 }
             )
 
@@ -123,6 +260,26 @@ class DomainConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     errors={"base": "invalid_language"},
                 )
 
+            try:
+                parse_deadbands(user_input.get(CONF_DEADBANDS, DEFAULT_DEADBANDS))
+
+            except ValueError:
+                return self.async_show_form(
+                    step_id="user",
+                    data_schema=error_schema,
+                    errors={"base": "invalid_deadbands"},
+                )
+
+            try:
+                parse_selection(user_input.get(CONF_ENTITIES, DEFAULT_ENTITIES))
+
+            except ValueError:
+                return self.async_show_form(
+                    step_id="user",
+                    data_schema=error_schema,
+                    errors={"base": "invalid_entities"},
+                )
+
             try:
 
                 return self.async_create_entry(
@@ -133,6 +290,22 @@ class DomainConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         CONF_LANGUAGE: user_input[CONF_LANGUAGE],
                         CONF_MQTT_HEX: user_input[CONF_MQTT_HEX],
                         CONF_MQTT_DBG: user_input[CONF_MQTT_DBG],
+                        CONF_JSON_CODEC: user_input[CONF_JSON_CODEC],
+                        CONF_WRITE_BATCH: user_input[CONF_WRITE_BATCH],
+                        CONF_WRITE_ACK_FRAMES: user_input[CONF_WRITE_ACK_FRAMES],
+                        CONF_WRITE_ACK_TIMEOUT: user_input[CONF_WRITE_ACK_TIMEOUT],
+                        CONF_WRITE_RETRIES: user_input[CONF_WRITE_RETRIES],
+                        CONF_WRITE_DEBOUNCE: user_input[CONF_WRITE_DEBOUNCE],
+                        CONF_WRITE_MIN_INTERVAL: user_input[CONF_WRITE_MIN_INTERVAL],
+                        CONF_FRAME_INTERVAL: user_input[CONF_FRAME_INTERVAL],
+                        CONF_DEADBANDS: user_input.get(
+                            CONF_DEADBANDS, DEFAULT_DEADBANDS
+                        ),
+                        CONF_ENTITIES: user_input.get(CONF_ENTITIES, DEFAULT_ENTITIES),
+                        CONF_LAZY_ENTITIES: user_input[CONF_LAZY_ENTITIES],
+                        CONF_PROFILE: user_input[CONF_PROFILE],
+                        CONF_SHARED_SUBSCRIPTION: user_input[CONF_SHARED_SUBSCRIPTION],
+                        CONF_STATISTICS: user_input[CONF_STATISTICS],
                     },
                     options={},
                 )
@@ -188,6 +361,97 @@ class OptionsFlow(config_entries.OptionsFlow):
                 vol.Required(
                     CONF_MQTT_DBG, default=self.config_entry.data.get(CONF_MQTT_DBG)
                 ): cv.boolean,
+                vol.Required(
+                    CONF_JSON_CODEC,
+                    default=self.config_entry.data.get(
+                        CONF_JSON_CODEC, DEFAULT_JSON_CODEC
+                    ),
+                ): selector.SelectSelector(
+                    selector.SelectSelectorConfig(
+                        options=AVAILABLE_CODECS,
+                        mode=selector.SelectSelectorMode.DROPDOWN,
+                    ),
+                ),
+                vol.Required(
+                    CONF_WRITE_BATCH,
+                    default=self.config_entry.data.get(
+                        CONF_WRITE_BATCH, DEFAULT_WRITE_BATCH
+                    ),
+                ): cv.positive_int,
+                vol.Required(
+                    CONF_WRITE_ACK_FRAMES,
+                    default=self.config_entry.data.get(
+                        CONF_WRITE_ACK_FRAMES, DEFAULT_WRITE_ACK_FRAMES
+                    ),
+                ): cv.positive_int,
+                vol.Required(
+                    CONF_WRITE_ACK_TIMEOUT,
+                    default=self.config_entry.data.get(
+                        CONF_WRITE_ACK_TIMEOUT, DEFAULT_WRITE_ACK_TIMEOUT
+                    ),
+                ): cv.positive_int,
+                vol.Required(
+                    CONF_WRITE_RETRIES,
+                    default=self.config_entry.data.get(
+                        CONF_WRITE_RETRIES, DEFAULT_WRITE_RETRIES
+                    ),
+                ): cv.positive_int,
+                vol.Required(
+                    CONF_WRITE_DEBOUNCE,
+                    default=self.config_entry.data.get(
+                        CONF_WRITE_DEBOUNCE, DEFAULT_WRITE_DEBOUNCE
+                    ),
+                ): cv.positive_int,
+                vol.Required(
+                    CONF_WRITE_MIN_INTERVAL,
+                    default=self.config_entry.data.get(
+                        CONF_WRITE_MIN_INTERVAL, DEFAULT_WRITE_MIN_INTERVAL
+                    ),
+                ): cv.positive_int,
+                vol.Required(
+                    CONF_FRAME_INTERVAL,
+                    default=self.config_entry.data.get(
+                        CONF_FRAME_INTERVAL, DEFAULT_FRAME_INTERVAL
+                    ),
+                ): cv.positive_int,
+                vol.Optional(
+                    CONF_DEADBANDS,
+                    default=self.config_entry.data.get(
+                        CONF_DEADBANDS, DEFAULT_DEADBANDS
+                    ),
+                ): cv.string,
+                vol.Optional(
+                    CONF_ENTITIES,
+                    default=self.config_entry.data.get(CONF_ENTITIES, DEFAULT_ENTITIES),
+                ): cv.string,
+                vol.Required(
+                    CONF_LAZY_ENTITIES,
+                    default=self.config_entry.data.get(
+                        CONF_LAZY_ENTITIES, DEFAULT_LAZY_ENTITIES
+                    ),
+                ): cv.boolean,
+                vol.Required(
+                    CONF_PROFILE,
+                    default=self.config_entry.data.get(CONF_PROFILE, DEFAULT_PROFILE),
+                ): selector.SelectSelector(
+                    selector.SelectSelectorConfig(
+                        options=AVAILABLE_PROFILES,
+                        custom_value=True,
+                        mode=selector.SelectSelectorMode.DROPDOWN,
+                    ),
+                ),
+                vol.Required(
+                    CONF_SHARED_SUBSCRIPTION,
+                    default=self.config_entry.data.get(
+                        CONF_SHARED_SUBSCRIPTION, DEFAULT_SHARED_SUBSCRIPTION
+                    ),
+                ): cv.boolean,
+                vol.Required(
+                    CONF_STATISTICS,
+                    default=self.config_entry.data.get(
+                        CONF_STATISTICS, DEFAULT_STATISTICS
+                    ),
+                ): cv.boolean,
             }
         )
 
@@ -213,6 +477,64 @@ class OptionsFlow(config_entries.OptionsFlow):
                     vol.Required(
                         CONF_MQTT_DBG, default=user_input[CONF_MQTT_DBG]
                     ): cv.boolean,
+                    vol.Required(
+                        CONF_JSON_CODEC, default=user_input[CONF_JSON_CODEC]
+                    ): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=AVAILABLE_CODECS,
+                            mode=selector.SelectSelectorMode.DROPDOWN,
+                        ),
+                    ),
+                    vol.Required(
+                        CONF_WRITE_BATCH, default=user_input[CONF_WRITE_BATCH]
+                    ): cv.positive_int,
+                    vol.Required(
+                        CONF_WRITE_ACK_FRAMES, default=user_input[CONF_WRITE_ACK_FRAMES]
+                    ): cv.positive_int,
+                    vol.Required(
+                        CONF_WRITE_ACK_TIMEOUT,
+                        default=user_input[CONF_WRITE_ACK_TIMEOUT],
+                    ): cv.positive_int,
+                    vol.Required(
+                        CONF_WRITE_RETRIES, default=user_input[CONF_WRITE_RETRIES]
+                    ): cv.positive_int,
+                    vol.Required(
+                        CONF_WRITE_DEBOUNCE, default=user_input[CONF_WRITE_DEBOUNCE]
+                    ): cv.positive_int,
+                    vol.Required(
+                        CONF_WRITE_MIN_INTERVAL,
+                        default=user_input[CONF_WRITE_MIN_INTERVAL],
+                    ): cv.positive_int,
+                    vol.Required(
+                        CONF_FRAME_INTERVAL, default=user_input[CONF_FRAME_INTERVAL]
+                    ): cv.positive_int,
+                    vol.Optional(
+                        CONF_DEADBANDS,
+                        default=user_input.get(CONF_DEADBANDS, DEFAULT_DEADBANDS),
+                    ): cv.string,
+                    vol.Optional(
+                        CONF_ENTITIES,
+                        default=user_input.get(CONF_ENTITIES, DEFAULT_ENTITIES),
+                    ): cv.string,
+                    vol.Required(
+                        CONF_LAZY_ENTITIES, default=user_input[CONF_LAZY_ENTITIES]
+                    ): cv.boolean,
+                    vol.Required(
+                        CONF_PROFILE, default=user_input[CONF_PROFILE]
+                    ): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=AVAILABLE_PROFILES,
+                            custom_value=True,
+                            mode=selector.SelectSelectorMode.DROPDOWN,
+                        ),
+                    ),
+                    vol.Required(
+                        CONF_SHARED_SUBSCRIPTION,
+                        default=user_input[CONF_SHARED_SUBSCRIPTION],
+                    ): cv.boolean,
+                    vol.Required(
+                        CONF_STATISTICS, default=user_input[CONF_STATISTICS]
+                    ): cv.boolean,
                 }
             )
 
@@ -251,6 +573,26 @@ class OptionsFlow(config_entries.OptionsFlow):
                     errors={"base": "invalid_language"},
                 )
 
+            try:
+                parse_deadbands(user_input.get(CONF_DEADBANDS, DEFAULT_DEADBANDS))
+
+            except ValueError:
+                return self.async_show_form(
+                    step_id="user",
+                    data_schema=error_schema,
+                    errors={"base": "invalid_deadbands"},
+                )
+
+            try:
+                parse_selection(user_input.get(CONF_ENTITIES, DEFAULT_ENTITIES))
+
+            except ValueError:
+                return self.async_show_form(
+                    step_id="user",
+                    data_schema=error_schema,
+                    errors={"base": "invalid_entities"},
+                )
+
             try:
                 data = {
                     CONF_ID: id_name,
@@ -258,6 +600,20 @@ class OptionsFlow(config_entries.OptionsFlow):
                     CONF_LANGUAGE: user_input[CONF_LANGUAGE],
                     CONF_MQTT_HEX: user_input[CONF_MQTT_HEX],
                     CONF_MQTT_DBG: user_input[CONF_MQTT_DBG],
+                    CONF_JSON_CODEC: user_input[CONF_JSON_CODEC],
+                    CONF_WRITE_BATCH: user_input[CONF_WRITE_BATCH],
+                    CONF_WRITE_ACK_FRAMES: user_input[CONF_WRITE_ACK_FRAMES],
+                    CONF_WRITE_ACK_TIMEOUT: user_input[CONF_WRITE_ACK_TIMEOUT],
+                    CONF_WRITE_RETRIES: user_input[CONF_WRITE_RETRIES],
+                    CONF_WRITE_DEBOUNCE: user_input[CONF_WRITE_DEBOUNCE],
+                    CONF_WRITE_MIN_INTERVAL: user_input[CONF_WRITE_MIN_INTERVAL],
+                    CONF_FRAME_INTERVAL: user_input[CONF_FRAME_INTERVAL],
+                    CONF_DEADBANDS: user_input.get(CONF_DEADBANDS, DEFAULT_DEADBANDS),
+                    CONF_ENTITIES: user_input.get(CONF_ENTITIES, DEFAULT_ENTITIES),
+                    CONF_LAZY_ENTITIES: user_input[CONF_LAZY_ENTITIES],
+                    CONF_PROFILE: user_input[CONF_PROFILE],
+                    CONF_SHARED_SUBSCRIPTION: user_input[CONF_SHARED_SUBSCRIPTION],
+                    CONF_STATISTICS: user_input[CONF_STATISTICS],
                 }
 
                 self.hass.config_entries.async_update_entry(
@@ -9,14 +9,50 @@ CONF_MQTT_NODE = "mqtt_node"
 CONF_MQTT_DBG = "thermiq_dbg"
 CONF_MQTT_HEX = "hexformat"
 CONF_LANGUAGE = "language"
+CONF_JSON_CODEC = "json_codec"
+CONF_WRITE_BATCH = "write_batch_ms"
+CONF_WRITE_ACK_FRAMES = "write_ack_frames"
+CONF_WRITE_ACK_TIMEOUT = "write_ack_timeout"
+CONF_WRITE_RETRIES = "write_retries"
+CONF_WRITE_DEBOUNCE = "write_debounce_ms"
+CONF_WRITE_MIN_INTERVAL = "write_min_interval"
+CONF_FRAME_INTERVAL = "frame_interval"
+CONF_DEADBANDS = "deadbands"
+CONF_ENTITIES = "entities"
+CONF_LAZY_ENTITIES = "lazy_entities"
+CONF_PROFILE = "profile"
+CONF_SHARED_SUBSCRIPTION = "shared_subscription"
+CONF_STATISTICS = "statistics"
 DEFAULT_NODE = "ThermIQ/ThermIQ-mqtt"
 CONF_DATA = "data_msg"
 DEFAULT_DATA = "/data"
 CONF_CMD = "cmd_msg"
 DEFAULT_CMD = "/write"
 DEFAULT_DBG = False
+DEFAULT_JSON_CODEC = "auto"
+DEFAULT_WRITE_BATCH = 0
+DEFAULT_WRITE_ACK_FRAMES = 3
+DEFAULT_WRITE_ACK_TIMEOUT = 120
+DEFAULT_WRITE_RETRIES = 1
+DEFAULT_WRITE_DEBOUNCE = 500
+DEFAULT_WRITE_MIN_INTERVAL = 2
+DEFAULT_FRAME_INTERVAL = 0
+DEFAULT_DEADBANDS = ""
+DEFAULT_ENTITIES = ""
+DEFAULT_LAZY_ENTITIES = False
+DEFAULT_PROFILE = "full"
+DEFAULT_SHARED_SUBSCRIPTION = False
+DEFAULT_STATISTICS = False
 AVAILABLE_LANGUAGES = ["en", "se", "fi", "no", "de"]
 
+# Services
+SERVICE_RECORD = "record"
+SERVICE_PROFILE = "profile"
+ATTR_DURATION = "duration"
+ATTR_FRAMES = "frames"
+DEFAULT_RECORD_DURATION = 600
+DEFAULT_PROFILE_FRAMES = 20
+
 
 PLATFORM_AUTOMATION = "automation"
 PLATFORM_BINARY_SENSOR = "binary_sensor"
@@ -25,4 +61,5 @@ PLATFORM_INPUT_BOOLEAN = "input_boolean"
 PLATFORM_INPUT_NUMBER = "input_number"
 PLATFORM_INPUT_SELECT = "input_select"
 PLATFORM_INPUT_TEXT = "input_text"
+PLATFORM_SENSOR = "sensor"
 CONF_ENTITY_PLATFORM = "entity_platform"
@@ -0,0 +1,27 @@
+"""Diagnostics support for ThermIQ-MQTT."""
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_ID, DOMAIN
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict:
+    """Return the configuration and runtime metrics of a heatpump."""
+    heatpump = hass.data[DOMAIN].heatpumps.get(entry.data[CONF_ID])
+    diagnostics = {"config": dict(entry.data)}
+    if heatpump is not None:
+        diagnostics.update(
+            {
+                "profile": heatpump.profile,
+                "recording": heatpump.recording,
+                "profiling": heatpump.profiling,
+                "metrics": heatpump.metrics,
+                "writes": heatpump.write_stats,
+                "statistics": heatpump.statistic_ids,
+                "recent_frames": heatpump.recent_frames,
+            }
+        )
+    return diagnostics
@@ -1,6 +1,9 @@
-import logging, json
+import logging
+import time
+from datetime import timedelta
 
 from collections.abc import Callable, Coroutine
+from functools import partial
 import attr
 
 from homeassistant.config_entries import ConfigEntry
@@ -21,9 +24,12 @@ from homeassistant.components.input_select import (
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_OPTION,
+    UnitOfTemperature,
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.components import mqtt
+from homeassistant.helpers.event import async_call_later, async_track_utc_time_change
+from homeassistant.util import slugify
 
 
 from ..const import (
@@ -33,23 +39,71 @@ from ..const import (
     CONF_MQTT_HEX,
     CONF_MQTT_DBG,
     CONF_LANGUAGE,
+    CONF_JSON_CODEC,
+    CONF_WRITE_BATCH,
+    CONF_WRITE_ACK_FRAMES,
+    CONF_WRITE_ACK_TIMEOUT,
+    CONF_WRITE_RETRIES,
+    CONF_WRITE_DEBOUNCE,
+    CONF_WRITE_MIN_INTERVAL,
+    CONF_FRAME_INTERVAL,
+    CONF_DEADBANDS,
+    CONF_ENTITIES,
+    CONF_LAZY_ENTITIES,
+    CONF_PROFILE,
+    CONF_SHARED_SUBSCRIPTION,
+    CONF_STATISTICS,
+    DEFAULT_JSON_CODEC,
+    DEFAULT_WRITE_BATCH,
+    DEFAULT_WRITE_ACK_FRAMES,
+    DEFAULT_WRITE_ACK_TIMEOUT,
+    DEFAULT_WRITE_RETRIES,
+    DEFAULT_WRITE_DEBOUNCE,
+    DEFAULT_WRITE_MIN_INTERVAL,
+    DEFAULT_FRAME_INTERVAL,
+    DEFAULT_DEADBANDS,
+    DEFAULT_ENTITIES,
+    DEFAULT_LAZY_ENTITIES,
+    DEFAULT_PROFILE,
+    DEFAULT_SHARED_SUBSCRIPTION,
+    DEFAULT_STATISTICS,
     AVAILABLE_LANGUAGES,
 )
-
-# import ThermIQ register defines
-from .thermiq_regs import (
-    FIELD_BITMASK,
-    FIELD_MAXVALUE,
-    FIELD_MINVALUE,
-    FIELD_REGNUM,
-    FIELD_REGTYPE,
-    FIELD_UNIT,
-    id_names,
-    reg_id,
+from ..thermiq_core.codec import get_codec
+from ..thermiq_core.deadband import Deadband, deadband_table, parse_deadbands
+from ..thermiq_core.decoder import FrameDecoder, flipped_bits, is_thermiq_frame
+from ..thermiq_core.encoder import WriteEncoder
+from ..thermiq_core.history import (
+    FRAME_INVALID_JSON,
+    FRAME_OK,
+    FRAME_REJECTED,
+    FrameHistory,
+)
+from ..thermiq_core.metrics import IngestMetrics
+from ..thermiq_core.names import get_names
+from ..thermiq_core.profiler import FrameProfiler
+from ..thermiq_core.profiles import (
+    BUILTIN_PROFILES,
+    OPT_REGISTER,
+    OPT_REGISTER_DEC,
+    PROFILE_AUTO,
+    PROFILE_FULL,
+    PROFILES_FILE,
+    auto_profile,
+    excluded_registers,
+    load_user_profiles,
 )
+from ..thermiq_core.registers import REGISTER_NAMES, REGISTERS
+from ..thermiq_core.selection import parse_selection
+from ..thermiq_core.statistics import STATISTICS_REGISTERS, WindowStatistics
+from ..thermiq_core.trace import TraceWriter, append_trace
+from ..thermiq_core.writes import WRITE_EXPIRED, WRITE_RETRY, WriteTracker
 
 _LOGGER = logging.getLogger(__name__)
 
+# Records of a trace kept in memory before they are appended to its file
+TRACE_FLUSH = 500
+
 
 class HeatPump:
 
@@ -61,226 +115,708 @@ class HeatPump:
 
     # ###
     @callback
-    async def message_received(self, message):
-        """Handle new MQTT messages."""
-        _LOGGER.debug("%s: message.payload:[%s]", self._id, message.payload)
-        try:
-            json_dict = json.loads(message.payload)
-            if json_dict["Client_Name"][:8] == "ThermIQ_":
-                for k in json_dict.keys():
-                    kstore = k.lower()
-                    dstore = k
-                    # # Make INDR_T, EVU and timestamp appear as normal register
-                    # if kstore == "indr_t":
-                    #     kstore = "rf0"
-                    # if kstore == "timestamp":
-                    #     kstore = "rf1"
-                    # if kstore == "evu":
-                    #     kstore = "rf2"
-                    # # Create hex notation if incoming register is decimal format
-                    if k[0] == "d":
-                        reg = int(k[1:])
-                        kstore = "r" + format(reg, "02x")
-                        dstore = "d" + format(reg, "03d")
-                        if len(kstore) != 3:
-                            kstore = k
-                    # Create decimal notation if incoming register is hex format
-                    if k[0] == "r" and len(k) == 3:
-                        reg = int(k[1:], 16)
-                        dstore = "d" + format(reg, "03d")
-
-                    _LOGGER.debug(
-                        "[%s] [%s] [%s] [%s]", self._id, kstore, json_dict[k], dstore
-                    )
-
-                    # Internal mapping of ThermIQ_MQTT regs, used to create update events
-                    self._hpstate[kstore] = json_dict[k]
-                    # hass.states.async_set(DOMAIN+"." +kstore, json_dict[k])
-
-                    # Map incomming registers to named settings based on id_reg (thermiq_regs)
-                    if kstore in self._id_reg:
-                        # r01 and r03 should be combined with respective decimal part r02 and r04
-                        # i.e thermiq_mqtt_vp1.outdoor_t
-                        if kstore != "r01" and kstore != "r03":
-                            # self._hass.states.async_set(
-                            #     self._domain
-                            #     + "_"
-                            #     + self._id
-                            #     + "."
-                            #     + self._id_reg[kstore],
-                            #     json_dict[k],
-                            # )
-                            ## Set the corresponding input_number/input_select if applicable, incomming message always rules over UI settings
-                            if reg_id[self._id_reg[kstore]][1] in [
-                                "temperature_input",
-                                "time_input",
-                                "sensor_input",
-                                "generated_input",
-                            ]:
-                                context = {
-                                    INP_ATTR_VALUE: json_dict[k],
-                                    ATTR_ENTITY_ID: "input_number."
-                                    + self._domain
-                                    + "_"
-                                    + self._id
-                                    + "_"
-                                    + self._id_reg[kstore],
-                                }
-                                self._hass.async_create_task(
-                                    self._hass.services.async_call(
-                                        NUMBER_DOMAIN,
-                                        NUMBER_SERVICE_SET_VALUE,
-                                        context,
-                                        blocking=False,
-                                    )
-                                )
-                            if reg_id[self._id_reg[kstore]][1] == "select_input":
-                                mode = f"mode{json_dict[k]}"
-
-                                context = {
-                                    ATTR_OPTION: f"{json_dict[k]} - "
-                                    + id_names[mode][self._langid],
-                                    ATTR_ENTITY_ID: "input_select."
-                                    + self._domain
-                                    + "_"
-                                    + self._id
-                                    + "_"
-                                    + self._id_reg[kstore],
-                                }
-                                self._hass.async_create_task(
-                                    self._hass.services.async_call(
-                                        SELECT_DOMAIN,
-                                        SELECT_SERVICE_SET_OPTION,
-                                        context,
-                                        blocking=False,
-                                    )
-                                )
-
-                # Do some post processing of data received
-                self._hpstate["r01"] = self._hpstate["r01"] + self._hpstate["r02"] / 10
-
-                # self._hass.states.async_set(
-                #     self._domain + "_" + self._id + "." + self._id_reg["r01"],
-                #     self._hpstate["r01"],
-                # )
-
-                self._hpstate["r03"] = self._hpstate["r03"] + self._hpstate["r04"] / 10
-                # self._hass.states.async_set(
-                #     self._domain + "_" + self._id + "." + self._id_reg["r03"],
-                #     self._hpstate["r03"],
-                # )
-
-                self._hpstate["mqtt_counter"] += 1
-
-                if "time" in json_dict:
-                    self._hpstate["time_str"] = json_dict["time"]
-                    # self._hass.states.async_set(
-                    #     self._domain + "_" + self._id + ".time_str", json_dict["time"]
-                    # )
-                elif "Time" in json_dict:
-                    self._hpstate["time_str"] = json_dict["Time"]
-                    # self._hass.states.async_set(
-                    #     self._domain + "_" + self._id + ".time_str", json_dict["Time"]
-                    # )
-
-                if "vp_read" in json_dict:
-                    self._hpstate["communication_status"] = json_dict["vp_read"]
-
-                    # self._hass.states.async_set(
-                    #     self._domain
-                    #     + "_"
-                    #     + self._id
-                    #     + ".heatpump_communication_status",
-                    #     json_dict["vp_read"],
-                    # )
-                else:
-                    self._hpstate["communication_status"] = "Ok"
-                    # self._hass.states.async_set(
-                    #     self._domain
-                    #     + "_"
-                    #     + self._id
-                    #     + ".heatpump_communication_status",
-                    #     "ok",
-                    # )
-
-                if "app_info" in json_dict:
-                    self._hpstate["app_info"] = json_dict["app_info"]
-
-
-                self._hass.bus.fire(
-                    self._domain + "_" + self._id + "_msg_rec_event", {}
-                )
+    def message_received(self, message):
+        """Handle new MQTT messages.
+
+        The message is kept in a one slot buffer and processed from the event
+        loop. A frame not processed yet is replaced by a newer one, so a slow
+        loop never builds up a backlog of frames.
+        """
+        metrics = self._metrics
+        metrics.frames_received += 1
+        now = time.monotonic()
+        metrics.received_rate.add(now)
+        if self._trace is not None:
+            self._trace.record("data", message.payload)
+            if len(self._trace) >= TRACE_FLUSH:
+                self._flush_trace(self._trace)
+        if self._pending_payload is not None:
+            metrics.frames_coalesced += 1
+        self._pending_payload = message.payload
+        if self._process_scheduled:
+            return
+        self._process_scheduled = True
+        delay = 0
+        if self._frame_interval > 0:
+            delay = self._last_processed + self._frame_interval - now
+        if delay > 0:
+            self._cancel_process = async_call_later(
+                self._hass, delay, self._async_process_pending
+            )
+        else:
+            self._hass.loop.call_soon(self._async_process_pending)
 
-            else:
-                _LOGGER.error("JSON result was not from ThermIQ-mqtt")
+    @callback
+    def _async_process_pending(self, _now=None):
+        """Process the newest frame received."""
+        self._process_scheduled = False
+        self._cancel_process = None
+        payload = self._pending_payload
+        self._pending_payload = None
+        if payload is None:
+            return
+        self._last_processed = time.monotonic()
+        profiler = self._profiler
+        if profiler is None:
+            self.process_frame(payload)
+            return
+        with profiler:
+            self.process_frame(payload)
+        if profiler.frame_done():
+            self._finish_profile()
+
+    def process_frame(self, payload):
+        """Decode a ThermIQ-MQTT data frame and notify the changed registers.
+
+        The frame is kept in the frame history instead of being logged, see
+        recent_frames.
+        """
+        decoder = self._decoder
+        metrics = self._metrics
+        # ThermIQ-MQTT republishes the full register set, skip repeated frames
+        if decoder.is_repeat(payload):
+            metrics.frames_dropped += 1
+            if self._writes:
+                # Nothing was decoded, the state can hold a write not applied yet
+                self._check_writes(decoded=False)
+            return
+        start = time.perf_counter()
+        try:
+            json_dict = decoder.loads(payload)
         except ValueError:
+            metrics.json_errors += 1
+            self._history.add(time.time(), payload, FRAME_INVALID_JSON)
             _LOGGER.error("MQTT payload could not be parsed as JSON")
-            _LOGGER.debug("Erroneous JSON: %s", message.payload)
+            _LOGGER.debug("Erroneous JSON: %s", payload)
+            return
+        if not is_thermiq_frame(json_dict):
+            metrics.rejected_frames += 1
+            self._history.add(time.time(), payload, FRAME_REJECTED)
+            _LOGGER.error("JSON result was not from ThermIQ-mqtt")
+            return
+
+        metrics.frames_processed += 1
+        if self._profile_pending:
+            self._resolve_profile(json_dict)
+        # Registers changed by this frame, mapped to their previous value
+        changed = decoder.apply(json_dict, payload)
+        decoded = time.perf_counter()
+        decode_us = (decoded - start) * 1e6
+        metrics.decode_time.add(decode_us)
+        if self._statistics is not None:
+            self._statistics.update(changed, self._hpstate, decoded)
+        metrics.processed_rate.add(time.monotonic())
+
+        # Only the registers changed by this frame are passed on
+        self._changed = changed
+        self._dispatch(changed)
+        if self._when_seen:
+            self._run_when_seen(changed)
+        dispatch_us = (time.perf_counter() - decoded) * 1e6
+        metrics.dispatch_time.add(dispatch_us)
+        self._history.add(
+            time.time(), payload, FRAME_OK, changed, decode_us, dispatch_us
+        )
+
+        self._hass.bus.fire(self._domain + "_" + self._id + "_msg_rec_event", {})
+
+        if self._writes:
+            self._check_writes()
 
     def __init__(self, hass, entry: ConfigEntry):
         self._hass = hass
         self._entry = entry
-        self._hpstate = {}
+        self._decoder = FrameDecoder()
+        self._hpstate = self._decoder.state
+        self._encoder = WriteEncoder()
         self._domain = DOMAIN
         self._id = entry.data[CONF_ID]
-        self._id_reg = {}
+        self._id_reg = REGISTER_NAMES
         self.unsubscribe_callback = None
+        self._select_options = {}
+        self._names = {}
+        self._listeners = {}
+        self._write_batch_window = 0
+        self._frame_interval = 0
+        self._deadbands = {}
+        self._entities = None
+        self._entity_config = None
+        self._lazy_entities = False
+        self._when_seen = {}
+        self._profiles = BUILTIN_PROFILES
+        self._profile = PROFILE_FULL
+        self._profile_auto = False
+        self._profile_pending = False
+        self._shared_subscription = False
+        self._excluded = frozenset()
+        self._pending_payload = None
+        self._process_scheduled = False
+        self._cancel_process = None
+        self._last_processed = 0
+        self._metrics = IngestMetrics()
+        self._history = FrameHistory()
+        self._writes = WriteTracker()
+        self._write_debounce = 0
+        self._write_min_interval = 0
+        self._debounced = {}
+        self._debounce_timers = {}
+        self._last_write = {}
+        self._write_batches = {}
+        self._cancel_write_flush = None
+        self._cancel_write_timeout = None
+        self._bit_listeners = {}
+        self._codec = get_codec()
+        self._dispatching = False
+        self._pending_writes = {}
+        self._state_writes = 0
+        self._changed = {}
+        self._trace = None
+        self._trace_path = None
+        self._cancel_trace = None
+        self._trace_append = None
+        self._profiler = None
+        self._profile_path = None
+        self._statistics = None
+        self._statistic_meta = {}
+        self._cancel_statistics = None
+
+    @callback
+    def async_add_register_listener(
+        self, register, update: Callable[[], None]
+    ) -> Callable[[], None]:
+        """Call update when register changes.
+
+        Returns a function that removes the listener.
+        """
+        listeners = self._listeners.setdefault(register, [])
+        listeners.append(update)
+
+        @callback
+        def remove_listener():
+            listeners.remove(update)
+
+        return remove_listener
+
+    @callback
+    def async_add_bit_listener(
+        self, register, bitmask, update: Callable[[bool], None]
+    ) -> Callable[[], None]:
+        """Call update with the new bit state when bitmask of register flips.
 
+        Returns a function that removes the listener.
+        """
+        bits = self._bit_listeners.setdefault(register, {})
+        listeners = bits.setdefault(bitmask, [])
+        listeners.append(update)
 
-        # Create reverse lookup dictionary (id_reg->reg_number)
+        @callback
+        def remove_listener():
+            listeners.remove(update)
 
-        for k, v in reg_id.items():
-            self._id_reg[v[0]] = k
-            self._hpstate[v[0]] = -1
+        return remove_listener
 
-    async def setup_mqtt(self):
+    @callback
+    def async_set_register(self, register, value):
+        """Set a register locally and notify its listeners if it changed."""
+        old = self._hpstate.get(register)
+        if old != value:
+            self._hpstate[register] = value
+            self._dispatch({register: old})
+
+    @callback
+    def async_schedule_write(self, entity):
+        """Write the state of entity, batched with the rest of the frame."""
+        if self._dispatching:
+            self._pending_writes[entity] = None
+        else:
+            self._metrics.state_writes += 1
+            entity.async_write_ha_state()
+
+    def _dispatch(self, changed):
+        """Notify the listeners of changed registers and commit their states."""
+        self._dispatching = True
+        try:
+            self._notify(changed)
+        finally:
+            self._dispatching = False
+            self._commit()
+
+    def _commit(self):
+        """Write the states of all entities changed by the last dispatch."""
+        pending = self._pending_writes
+        self._pending_writes = {}
+        for entity in pending:
+            entity.async_write_ha_state()
+        self._state_writes = len(pending)
+        self._metrics.state_writes += len(pending)
+
+    def _notify(self, changed):
+        """Notify the listeners of changed registers."""
+        hpstate = self._hpstate
+        listeners = self._listeners
+        bit_listeners = self._bit_listeners
+        notified = 0
+        for register, old in changed.items():
+            if register in listeners:
+                notified += len(listeners[register])
+                for update in listeners[register]:
+                    update()
+            if register in bit_listeners:
+                # Expand the bitfield register once, only flipped bits are notified
+                new = hpstate.get(register)
+                if not isinstance(new, int):
+                    new = 0
+                flipped = flipped_bits(old, new)
+                for bitmask, updates in bit_listeners[register].items():
+                    if flipped & bitmask:
+                        is_on = (new & bitmask) != 0
+                        notified += len(updates)
+                        for update in updates:
+                            update(is_on)
+        self._metrics.entities_notified += notified
+
+    def _build_select_options(self):
+        """Precompile the input_select option for each mode value."""
+        self._select_options = {}
+        mode = 0
+        while f"mode{mode}" in self._names:
+            self._select_options[mode] = f"{mode} - " + self._names[f"mode{mode}"]
+            mode += 1
+
+    async def setup_mqtt(self, subscribe=None):
+        """Subscribe to the data topic.
+
+        subscribe replaces mqtt.async_subscribe, the worker passes its shared
+        subscription here.
+        """
         self._hpstate["time_str"] = self._data_topic
-        self.unsubscribe_callback = await mqtt.async_subscribe(
-            self._hass,
+        if subscribe is None:
+            subscribe = partial(mqtt.async_subscribe, self._hass)
+        self.unsubscribe_callback = await subscribe(
             self._data_topic,
             self.message_received,
+            encoding=None,
         )
 
     async def update_config(self, entry):
         if self.unsubscribe_callback is not None:
             self.unsubscribe_callback()
+            self.unsubscribe_callback = None
         lang = entry.data[CONF_LANGUAGE]
         self._langid = AVAILABLE_LANGUAGES.index(lang)
+        # Importing the names of a language reads a module from disk
+        self._names = await self._hass.async_add_executor_job(get_names, lang)
+        self._build_select_options()
         self._dbg = entry.data[CONF_MQTT_DBG]
         self._mqtt_base = entry.data[CONF_MQTT_NODE] + "/"
         self._hexFormat = entry.data[CONF_MQTT_HEX]
+        # Pending writes go to the old topics before they change
+        self._async_flush_debounced()
+        self._async_flush_writes()
+        self._write_debounce = (
+            entry.data.get(CONF_WRITE_DEBOUNCE, DEFAULT_WRITE_DEBOUNCE) / 1000
+        )
+        self._write_min_interval = entry.data.get(
+            CONF_WRITE_MIN_INTERVAL, DEFAULT_WRITE_MIN_INTERVAL
+        )
+        self._write_batch_window = (
+            entry.data.get(CONF_WRITE_BATCH, DEFAULT_WRITE_BATCH) / 1000
+        )
+        self._writes.max_frames = entry.data.get(
+            CONF_WRITE_ACK_FRAMES, DEFAULT_WRITE_ACK_FRAMES
+        )
+        self._writes.timeout = entry.data.get(
+            CONF_WRITE_ACK_TIMEOUT, DEFAULT_WRITE_ACK_TIMEOUT
+        )
+        self._writes.retries = entry.data.get(CONF_WRITE_RETRIES, DEFAULT_WRITE_RETRIES)
+        self._codec = get_codec(entry.data.get(CONF_JSON_CODEC, DEFAULT_JSON_CODEC))
+        self._decoder.codec = self._codec
+        self._encoder = WriteEncoder(self._mqtt_base, self._hexFormat, self._codec)
+        self._node = entry.data[CONF_MQTT_NODE]
         self._data_topic = self._mqtt_base + "data"
-        self._cmd_topic = self._mqtt_base + "write"
-        self._set_topic = self._mqtt_base + "set"
-        self._hpstate["mqtt_counter"] = 0
+        self._shared_subscription = entry.data.get(
+            CONF_SHARED_SUBSCRIPTION, DEFAULT_SHARED_SUBSCRIPTION
+        )
+        self._decoder.reset()
+        self._frame_interval = entry.data.get(
+            CONF_FRAME_INTERVAL, DEFAULT_FRAME_INTERVAL
+        )
+        try:
+            overrides = parse_deadbands(
+                entry.data.get(CONF_DEADBANDS, DEFAULT_DEADBANDS)
+            )
+        except ValueError as err:
+            _LOGGER.error("Invalid deadbands, using defaults: %s", err)
+            overrides = None
+        self._deadbands = {
+            name: Deadband(band, hysteresis)
+            for name, (band, hysteresis) in deadband_table(overrides).items()
+        }
+        profiles = await self._hass.async_add_executor_job(
+            load_user_profiles, self._hass.config.path(PROFILES_FILE)
+        )
+        self._profiles = {**BUILTIN_PROFILES, **profiles}
+        profile = entry.data.get(CONF_PROFILE, DEFAULT_PROFILE)
+        self._profile_pending = profile == PROFILE_AUTO
+        if profile not in self._profiles and profile != PROFILE_AUTO:
+            _LOGGER.error("%s: unknown register profile [%s]", self._id, profile)
+            profile = PROFILE_FULL
+        if not self._profile_pending:
+            self._set_profile(profile, excluded_registers(self._profiles[profile]))
+        entity_config = (
+            entry.data.get(CONF_ENTITIES, DEFAULT_ENTITIES),
+            entry.data.get(CONF_LAZY_ENTITIES, DEFAULT_LAZY_ENTITIES),
+            profile,
+        )
+        if self._entity_config is None:
+            try:
+                self._entities = parse_selection(entity_config[0])
+            except ValueError as err:
+                _LOGGER.error("Invalid entity selection, adding all: %s", err)
+            self._lazy_entities = entity_config[1]
+            # Entities wait for the auto profile to be chosen
+            self._profile_auto = self._profile_pending
+            self._entity_config = entity_config
+        elif entity_config != self._entity_config:
+            _LOGGER.warning(
+                "%s: changed entity selection is used after a restart", self._id
+            )
+        self._setup_statistics(entry.data.get(CONF_STATISTICS, DEFAULT_STATISTICS))
+        if self._cancel_process is not None:
+            # Process a frame held back by the rate cap right away
+            self._cancel_process()
+            self._cancel_process = None
+            self._hass.loop.call_soon(self._async_process_pending)
 
         # Provide some debug info
         _LOGGER.debug(
             f"INFO: {self._domain}_{self._id} mqtt_node: [{entry.data[CONF_MQTT_NODE]}]"
         )
-        
+
         if self._dbg is True:
             self._mqtt_base = self._mqtt_base + "dbg_"
             _LOGGER.error("INFO: MQTT Debug write enabled")
 
         _LOGGER.debug("Language[%s]", self._langid)
- 
+
         if self._hexFormat == True:
             _LOGGER.debug("INFO: Using HEX format")
 
+        _LOGGER.debug("JSON codec[%s]", self._codec.name)
 
+    def _setup_statistics(self, enabled):
+        """Aggregate the measured registers into hourly statistics if enabled.
 
+        The statistics are imported as external statistics of the recorder,
+        the sensors of the registers get no state class so the recorder does
+        not compile statistics from their states as well.
+        """
+        if not enabled:
+            self.async_stop_statistics()
+            return
+        if "recorder" not in self._hass.config.components:
+            _LOGGER.warning("%s: statistics need the recorder, not enabled", self._id)
+            self.async_stop_statistics()
+            return
+        # The recorder is only imported when it is used
+        from homeassistant.components.recorder.models import StatisticMetaData
+
+        self._statistic_meta = {}
+        for spec in STATISTICS_REGISTERS:
+            if not self.entity_selected(spec.name):
+                continue
+            if spec.type == "temperature":
+                unit = UnitOfTemperature.CELSIUS
+            else:
+                unit = spec.unit or None
+            self._statistic_meta[spec.register] = StatisticMetaData(
+                has_mean=True,
+                has_sum=False,
+                name=f"{self._id} {self.friendly_name(spec.name)}",
+                source=DOMAIN,
+                statistic_id=f"{DOMAIN}:{slugify(f'{self._id}_{spec.name}')}",
+                unit_of_measurement=unit,
+            )
+        if self._statistics is not None:
+            # The registers only change after a restart, keep the current hour
+            return
+        # Registers hold -1 until the first frame
+        state = self._hpstate if self._metrics.frames_processed else {}
+        self._statistics = WindowStatistics(
+            self._statistic_meta, state, time.perf_counter()
+        )
+        self._cancel_statistics = async_track_utc_time_change(
+            self._hass, self._async_import_statistics, minute=0, second=0
+        )
+
+    @callback
+    def async_stop_statistics(self):
+        """Stop aggregating statistics, the current hour is not imported."""
+        if self._cancel_statistics is not None:
+            self._cancel_statistics()
+            self._cancel_statistics = None
+        self._statistics = None
+        self._statistic_meta = {}
 
+    @callback
+    def _async_import_statistics(self, now):
+        """Import the statistics of the hour that ended at now."""
+        from homeassistant.components.recorder.models import StatisticData
+        from homeassistant.components.recorder.statistics import (
+            async_add_external_statistics,
+        )
+
+        start = now.replace(minute=0, second=0, microsecond=0) - timedelta(hours=1)
+        hour = self._statistics.close(time.perf_counter())
+        for register, (mean, low, high) in hour.items():
+            async_add_external_statistics(
+                self._hass,
+                self._statistic_meta[register],
+                [StatisticData(start=start, mean=mean, min=low, max=high)],
+            )
+
+    def imports_statistics(self, register):
+        """Return True if the statistics of register are imported."""
+        return self._statistics is not None and register in self._statistics
+
+    @property
+    def statistic_ids(self):
+        """The ids of the imported statistics."""
+        return [meta["statistic_id"] for meta in self._statistic_meta.values()]
 
     async def async_reset(self):
         """Reset this heatpump to default state."""
         # unsubscribe here
         return True
 
+    @callback
+    def async_shutdown(self):
+        """Cancel the timers of this heatpump and write the rest of its trace."""
+        if self._cancel_process is not None:
+            self._cancel_process()
+            self._cancel_process = None
+        self._pending_payload = None
+        if self._cancel_write_flush is not None:
+            self._cancel_write_flush()
+            self._cancel_write_flush = None
+        if self._cancel_write_timeout is not None:
+            self._cancel_write_timeout()
+            self._cancel_write_timeout = None
+        for cancel in self._debounce_timers.values():
+            cancel()
+        self._debounce_timers = {}
+        self._debounced = {}
+        self.async_stop_recording()
+        self.async_stop_statistics()
+
+    @callback
+    def async_start_recording(self, path, duration):
+        """Record the MQTT traffic of this heatpump to a trace for duration seconds."""
+        if self._trace is not None:
+            self.async_stop_recording()
+        _LOGGER.info("%s: recording MQTT traffic to %s", self._id, path)
+        self._trace = TraceWriter(self._node)
+        self._trace_path = path
+        self._cancel_trace = async_call_later(
+            self._hass, duration, self.async_stop_recording
+        )
+
+    @callback
+    def async_stop_recording(self, _now=None):
+        """Stop recording and write the rest of the trace."""
+        trace = self._trace
+        if trace is None:
+            return
+        if self._cancel_trace is not None:
+            self._cancel_trace()
+            self._cancel_trace = None
+        self._trace = None
+        self._flush_trace(trace)
+        _LOGGER.info(
+            "%s: recorded %s messages to %s", self._id, trace.count, self._trace_path
+        )
+
+    @property
+    def recording(self):
+        """MQTT traffic is being recorded."""
+        return self._trace is not None
+
+    def _flush_trace(self, trace):
+        """Append the records kept by trace to its file in the executor.
+
+        Each append waits for the previous one, so the header is written once
+        and the records stay in order.
+        """
+        self._trace_append = self._hass.async_create_task(
+            self._async_append_trace(
+                self._trace_append, self._trace_path, trace.header, trace.take()
+            )
+        )
+
+    async def _async_append_trace(self, previous, path, header, records):
+        """Append records to the trace in path once previous is done."""
+        if previous is not None:
+            await previous
+        try:
+            await self._hass.async_add_executor_job(append_trace, path, header, records)
+        except OSError as err:
+            _LOGGER.error("%s: could not write trace %s: %s", self._id, path, err)
+
+    @callback
+    def async_start_profile(self, path, frames):
+        """Profile the processing of the next frames and the writes meanwhile."""
+        profiler = FrameProfiler(frames)
+        try:
+            # Fails when another profiler is active in the event loop thread
+            with profiler:
+                pass
+        except ValueError as err:
+            _LOGGER.error("%s: could not start profiling: %s", self._id, err)
+            return
+        _LOGGER.info("%s: profiling the next %s frames to %s", self._id, frames, path)
+        self._profiler = profiler
+        self._profile_path = path
+
+    def _finish_profile(self):
+        """Stop profiling and write the stats in the executor."""
+        profiler = self._profiler
+        self._profiler = None
+        self._hass.async_add_executor_job(profiler.write, self._profile_path)
+        _LOGGER.info(
+            "%s: profiled %s frames to %s", self._id, profiler.count, self._profile_path
+        )
+
+    @property
+    def profiling(self):
+        """Frames are being profiled."""
+        return self._profiler is not None
+
     @property
     def hpstate(self):
         return self._hpstate
 
+    def select_option(self, value):
+        """Return the input_select option for a mode value, None if unknown."""
+        return self._select_options.get(value)
+
+    def entity_selected(self, name):
+        """Return True if reg_id name should get an entity."""
+        if name in self._excluded:
+            return False
+        return self._entities is None or name in self._entities
+
+    def friendly_name(self, name):
+        """Return the name of reg_id name in the configured language."""
+        return self._names.get(name)
+
+    @property
+    def select_options(self):
+        """Return the input_select options of the modes."""
+        return list(self._select_options.values())
+
+    @property
+    def lazy_entities(self):
+        """Entities are added when their register first appears in a frame."""
+        return self._lazy_entities or self._profile_auto
+
+    @property
+    def shared_subscription(self):
+        """Data frames are received through the worker's shared subscription."""
+        return self._shared_subscription
+
+    @property
+    def profile(self):
+        """Name of the register profile in use."""
+        return self._profile
+
+    def _set_profile(self, name, excluded):
+        """Use a register profile, its excluded registers are not decoded."""
+        if name != self._profile or excluded != self._excluded:
+            _LOGGER.info("%s: using register profile [%s]", self._id, name)
+        self._profile = name
+        self._excluded = excluded
+        self._decoder.set_excluded(excluded)
+
+    def _resolve_profile(self, json_dict):
+        """Choose the auto profile from the first data frame."""
+        self._profile_pending = False
+        options = json_dict.get(OPT_REGISTER, json_dict.get(OPT_REGISTER_DEC))
+        self._set_profile(
+            *auto_profile(self._profiles, json_dict.get("app_info"), options)
+        )
+
+    @callback
+    def async_call_when_seen(self, register, action: Callable[[], None]):
+        """Call action once, when register is received in a data frame."""
+        if self._hpstate["mqtt_counter"] > 0:
+            action()
+        else:
+            self._when_seen.setdefault(register, []).append(action)
+
+    @callback
+    def async_add_entities_when_seen(self, entities, add: Callable[[list], None]):
+        """Add (reg_id name, entity) pairs with add when their register is received.
+
+        The selection is checked again when they are added, after the auto
+        profile has been chosen.
+        """
+        by_register = {}
+        for name, entity in entities:
+            register = REGISTERS[name].register
+            by_register.setdefault(register, []).append((name, entity))
+        for register, group in by_register.items():
+            self.async_call_when_seen(
+                register, partial(self._async_add_selected, group, add)
+            )
+
+    @callback
+    def _async_add_selected(self, group, add: Callable[[list], None]):
+        """Add the entities of group still selected."""
+        entities = [entity for name, entity in group if self.entity_selected(name)]
+        if entities:
+            add(entities)
+
+    def _run_when_seen(self, changed):
+        """Run the actions waiting for registers received in this frame."""
+        for register in changed.keys() & self._when_seen.keys():
+            for action in self._when_seen.pop(register):
+                action()
+
+    def deadband(self, name):
+        """Return the value filter of the sensor for reg_id name, if any."""
+        return self._deadbands.get(name)
+
+    @property
+    def frame_stats(self):
+        """Counters of frames received, processed, coalesced and dropped."""
+        metrics = self._metrics
+        return {
+            "received": metrics.frames_received,
+            "processed": metrics.frames_processed,
+            "coalesced": metrics.frames_coalesced,
+            "dropped": metrics.frames_dropped,
+        }
+
+    @property
+    def recent_frames(self):
+        """The last frames with their changes as [old, new] and timings."""
+        return self._history.as_list(self._hpstate)
+
+    @property
+    def metrics(self):
+        """Runtime counters, rates and timing histograms of the ingest path."""
+        return self._metrics.as_dict(time.monotonic())
+
+    @property
+    def state_writes(self):
+        """Number of entity state writes caused by the last dispatch."""
+        return self._state_writes
+
+    @property
+    def changed(self):
+        """Registers changed by the last frame, mapped to their previous value."""
+        return self._changed
+
     def get_value(self, item):
         """Get value for sensor."""
         res = self._hpstate.get(item)
@@ -303,49 +839,167 @@ class HeatPump:
 
     async def send_mqtt_reg(self, register_id, value, bitmask) -> None:
         """Service to send a message."""
+        if self._profiler is not None:
+            with self._profiler:
+                self._send_mqtt_reg(register_id, value, bitmask)
+        else:
+            self._send_mqtt_reg(register_id, value, bitmask)
 
-        register = reg_id[register_id][0]
+    def _send_mqtt_reg(self, register_id, value, bitmask):
+        """Encode a register write and send it."""
+        try:
+            register, topic, key, value = self._encoder.encode(
+                register_id, value, bitmask
+            )
+        except ValueError as err:
+            _LOGGER.error("No MQTT message sent due to %s", err)
+            return
         _LOGGER.debug("register:[%s]", register)
 
-        if not (isinstance(value, int) or isinstance(value, float)) or value is None:
-            _LOGGER.error("No MQTT message sent due to missing value:[%s]", value)
+        self._writes.add(register, topic, key, value, time.monotonic())
+        self._send(topic, key, value)
+        self._async_arm_write_timeout()
+
+    def _send(self, topic, key, value):
+        """Publish a register write, or add it to the batch of its topic."""
+        if self._write_batch_window > 0:
+            # Merge with other writes to the same topic, later values win
+            batch = self._write_batches.setdefault(topic, {})
+            batch[key] = value
+            if self._cancel_write_flush is None:
+                self._cancel_write_flush = async_call_later(
+                    self._hass, self._write_batch_window, self._async_flush_writes
+                )
             return
 
-        if bitmask is None:
-            bitmask = 0xFFFF
-
-        ## check the bitmask
-        # value = value | bitmask
-        if register_id == "room_sensor_set_t":
-            value = float(value)
-        else:
-            value = int(value) & int(bitmask)
+        self._publish(topic, {key: value})
 
-        if not (register in self._id_reg):
-            _LOGGER.error("No MQTT message sent due to unknown register:[%s]", register)
+    @callback
+    def async_request_write(self, register_id, value):
+        """Send a value set from the UI once it has settled.
+
+        Only the last value requested within the debounce delay is sent, and
+        writes to the same register are spaced by the minimum write interval.
+        """
+        self._debounced[register_id] = value
+        cancel = self._debounce_timers.pop(register_id, None)
+        if cancel is not None:
+            cancel()
+        delay = self._write_debounce
+        last = self._last_write.get(register_id)
+        if last is not None:
+            delay = max(delay, last + self._write_min_interval - time.monotonic())
+        if delay <= 0:
+            self._async_send_debounced(register_id)
             return
+        self._debounce_timers[register_id] = async_call_later(
+            self._hass, delay, partial(self._async_send_debounced, register_id)
+        )
 
-        # Lets use the decimal register notation in the MQTT message towards ThermIQ-MQTT to improve human readability
-
-        if register == "indr_t":
-            topic = self._set_topic
-            payload = json.dumps({"INDR_T": value})
-        elif register == "evu":
-            topic = self._set_topic
-            payload = json.dumps({"EVU": value})
-        elif self._hexFormat:
-            # dreg = "d" + format(int(register[1:], 16), "03d")
-            topic = self._cmd_topic
-            payload = json.dumps({register: value})
-        else:
-            dreg = "d" + format(int(register[1:], 16), "03d")
-            topic = self._cmd_topic
-            payload = json.dumps({dreg: value})
+    @callback
+    def _async_send_debounced(self, register_id, _now=None):
+        """Send the last value requested for register_id."""
+        self._debounce_timers.pop(register_id, None)
+        value = self._debounced.pop(register_id)
+        self._last_write[register_id] = time.monotonic()
+        self._hass.async_create_task(self.send_mqtt_reg(register_id, value, 0xFFFF))
 
+    @callback
+    def _async_flush_debounced(self):
+        """Send all values still waiting for their debounce delay.
+
+        The values are encoded right away, with the topics and format in use
+        before the config changes.
+        """
+        for cancel in self._debounce_timers.values():
+            cancel()
+        self._debounce_timers = {}
+        debounced = self._debounced
+        self._debounced = {}
+        now = time.monotonic()
+        for register_id, value in debounced.items():
+            self._last_write[register_id] = now
+            self._send_mqtt_reg(register_id, value, 0xFFFF)
+
+    def _check_writes(self, decoded=True, frame=True):
+        """Confirm, retry or expire pending writes against the received state."""
+        for result, write, latency in self._writes.check(
+            self._hpstate if decoded else None, time.monotonic(), frame
+        ):
+            if result == WRITE_RETRY:
+                _LOGGER.debug(
+                    "Write of [%s] not confirmed, retry %s", write.key, write.retries
+                )
+                self._send(write.topic, write.key, write.value)
+                continue
+            if result == WRITE_EXPIRED:
+                _LOGGER.warning(
+                    "%s: write of %s=%s was not applied by the heatpump",
+                    self._id,
+                    write.key,
+                    write.value,
+                )
+            self._hass.bus.async_fire(
+                f"{self._domain}_{self._id}_write_event",
+                {
+                    "register": self._id_reg.get(write.register),
+                    "value": write.value,
+                    "result": result,
+                    "latency": round(latency, 3),
+                    "retries": write.retries,
+                },
+            )
+        self._async_arm_write_timeout()
+
+    @callback
+    def _async_arm_write_timeout(self):
+        """Check the pending writes when the first one times out.
+
+        Writes then expire even when the heatpump sends no more frames.
+        """
+        if self._cancel_write_timeout is not None:
+            self._cancel_write_timeout()
+            self._cancel_write_timeout = None
+        deadline = self._writes.deadline()
+        if deadline is not None:
+            self._cancel_write_timeout = async_call_later(
+                self._hass,
+                max(deadline - time.monotonic(), 0),
+                self._async_write_timeout,
+            )
+
+    @callback
+    def _async_write_timeout(self, _now):
+        """Retry or expire the writes that timed out."""
+        self._cancel_write_timeout = None
+        self._check_writes(decoded=False, frame=False)
+
+    @property
+    def write_stats(self):
+        """Counters and last write-to-apply latency of register writes."""
+        return self._writes.stats()
+
+    @callback
+    def _async_flush_writes(self, _now=None):
+        """Publish the writes gathered in the batch window, one message per topic."""
+        if self._cancel_write_flush is not None:
+            self._cancel_write_flush()
+            self._cancel_write_flush = None
+        batches = self._write_batches
+        self._write_batches = {}
+        for topic, batch in batches.items():
+            self._publish(topic, batch)
+
+    def _publish(self, topic, message):
+        """Publish a register write message to ThermIQ-MQTT."""
+        payload = self._encoder.dumps(message)
+        self._metrics.mqtt_publishes += 1
+        if self._trace is not None:
+            self._trace.record(topic.rpartition("/")[2], payload)
+            if len(self._trace) >= TRACE_FLUSH:
+                self._flush_trace(self._trace)
         _LOGGER.debug("topic:[%s]", topic)
         _LOGGER.debug("payload:[%s]", payload)
         self._hass.async_create_task(
-            mqtt.async_publish(
-                self._hass, topic, payload, qos=2, retain=False
-            )
+            mqtt.async_publish(self._hass, topic, payload, qos=2, retain=False)
         )
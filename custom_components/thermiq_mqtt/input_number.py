@@ -18,20 +18,20 @@ from homeassistant.const import (
     CONF_UNIT_OF_MEASUREMENT,
     UnitOfTemperature,
 )
+from homeassistant.core import callback
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_platform import EntityPlatform
 
 from .heatpump import HeatPump
-from .heatpump.thermiq_regs import (
+from .thermiq_core.thermiq_regs import (
     FIELD_BITMASK,
     FIELD_MAXVALUE,
     FIELD_MINVALUE,
     FIELD_REGNUM,
     FIELD_REGTYPE,
     FIELD_UNIT,
-    id_names,
-    reg_id,
 )
+from .thermiq_core.registers import BY_PLATFORM, REGISTERS
 
 from .const import CONF_ENTITY_PLATFORM, PLATFORM_INPUT_NUMBER
 
@@ -55,6 +55,34 @@ class CustomInputNumber(InputNumber):
     async def async_get_last_state(self):
         pass
 
+    async def async_added_to_hass(self):
+        """Follow the register value received from the heatpump."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.heatpump.async_add_register_listener(
+                self.reg, self._async_sync_register
+            )
+        )
+        if self.heatpump._hpstate["mqtt_counter"] > 0:
+            self._async_sync_register()
+
+    @callback
+    def _async_sync_register(self):
+        """Update in place from the register, the heatpump rules over UI settings."""
+        value = self.heatpump._hpstate[self.reg]
+        if not isinstance(value, (int, float)):
+            return
+        value = float(value)
+        if value == self._current_value:
+            return
+        if value < self._minimum or value > self._maximum:
+            _LOGGER.debug(
+                "Value %s out of range for %s, not shown", value, self.entity_id
+            )
+            return
+        self._current_value = value
+        self.heatpump.async_schedule_write(self)
+
     async def async_set_value(self, value):
         _LOGGER.debug("inp %s", self.entity_id)
         # We require that we have values from the hp before allowing updates from GUI
@@ -62,13 +90,9 @@ class CustomInputNumber(InputNumber):
         # is value updated by GUI?
         if self.heatpump._hpstate["mqtt_counter"] > 0:
             if value != self.heatpump._hpstate[self.reg]:
-                self.heatpump._hpstate[self.reg] = value
-                self.heatpump._hass.bus.fire(
-                    # This will reload all sensor entities in this heatpump
-                    f"{self.heatpump._domain}_{self.heatpump._id}_msg_rec_event",
-                    {},
-                )
-                await self.heatpump.send_mqtt_reg(self.reg_id, value, 0xFFFF)
+                # This will update the sensor entities of this register
+                self.heatpump.async_set_register(self.reg, value)
+                self.heatpump.async_request_write(self.reg_id, value)
 
 
 async def setup_input_numbers(heatpump) -> None:
@@ -84,37 +108,38 @@ async def update_input_numbers(heatpump) -> None:
     to_add: List[CustomInputNumber] = []
     entity_list = []
 
-    for key in reg_id:
-        if reg_id[key][1] in [
-            "temperature_input",
-            "time_input",
-            "sensor_input",
-            "generated_input",
-        ]:
-            inp = create_input_number_entity(heatpump, key)
-            to_add.append(inp)
-            entity_list.append(
-                f"{PLATFORM}.{heatpump._domain}_{heatpump._id}" + "_" + key
-            )
-
-    await platform.async_add_entities(to_add)
+    for spec in BY_PLATFORM[PLATFORM]:
+        key = spec.name
+        if not heatpump.entity_selected(key):
+            continue
+        inp = create_input_number_entity(heatpump, key)
+        to_add.append(inp)
+        entity_list.append(f"{PLATFORM}.{heatpump._domain}_{heatpump._id}" + "_" + key)
+
+    if heatpump.lazy_entities:
+        heatpump.async_add_entities_when_seen(
+            [(entity.reg_id, entity) for entity in to_add],
+            lambda group: heatpump._hass.async_create_task(
+                platform.async_add_entities(group)
+            ),
+        )
+    else:
+        await platform.async_add_entities(to_add)
 
 
 def create_input_number_entity(heatpump, name) -> CustomInputNumber:
     """Create a CustomInputNumber instance."""
 
     entity_id = f"{heatpump._domain}_{heatpump._id}_{name}"
-    if name in id_names:
-        friendly_name = id_names[name][heatpump._langid]
-    else:
-        friendly_name = None
+    friendly_name = heatpump.friendly_name(name)
+    spec = REGISTERS[name]
     input_step = 1
-    if reg_id[name][0] == "indr_t":
+    if spec.register == "indr_t":
         input_step = 0.1
     icon = None
     unit = None
-    if (reg_id[name][1] in ["temperature_input",]) or (
-        reg_id[name][2]
+    if (spec.type in ["temperature_input",]) or (
+        spec.unit
         in [
             "C",
         ]
@@ -122,15 +147,15 @@ def create_input_number_entity(heatpump, name) -> CustomInputNumber:
         icon = "mdi:temperature-celsius"
         unit = UnitOfTemperature.CELSIUS
     else:
-        unit = reg_id[name][2]
+        unit = spec.unit
         icon = "mdi:gauge"
     # "mdi:thermometer" ,"mdi:oil-temperature", "mdi:gauge", "mdi:speedometer", "mdi:alert"
 
     config = {
         CONF_ID: entity_id,
         CONF_NAME: friendly_name,
-        CONF_MIN: reg_id[name][3],
-        CONF_MAX: reg_id[name][4],
+        CONF_MIN: spec.min_value,
+        CONF_MAX: spec.max_value,
         CONF_STEP: input_step,
         CONF_ICON: icon,
         CONF_MODE: MODE_BOX,
@@ -139,7 +164,7 @@ def create_input_number_entity(heatpump, name) -> CustomInputNumber:
     }
 
     entity = CustomInputNumber.from_yaml(config)
-    entity.reg = reg_id[name][0]
+    entity.reg = spec.register
     entity.reg_id = name
     entity.heatpump = heatpump
     # Bitmask is all bits
@@ -13,20 +13,20 @@ from homeassistant.const import (
     CONF_ID,
     CONF_NAME,
 )
+from homeassistant.core import callback
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_platform import EntityPlatform
 
 from .heatpump import HeatPump
-from .heatpump.thermiq_regs import (
+from .thermiq_core.thermiq_regs import (
     FIELD_BITMASK,
     FIELD_MAXVALUE,
     FIELD_MINVALUE,
     FIELD_REGNUM,
     FIELD_REGTYPE,
     FIELD_UNIT,
-    id_names,
-    reg_id,
 )
+from .thermiq_core.registers import BY_PLATFORM, REGISTERS
 
 from .const import CONF_ENTITY_PLATFORM, PLATFORM_INPUT_SELECT
 
@@ -47,6 +47,32 @@ class CustomInputSelect(InputSelect):
     async def async_get_last_state(self):
         pass
 
+    async def async_added_to_hass(self):
+        """Follow the register value received from the heatpump."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.heatpump.async_add_register_listener(
+                self.reg, self._async_sync_register
+            )
+        )
+        if self.heatpump._hpstate["mqtt_counter"] > 0:
+            self._async_sync_register()
+
+    @callback
+    def _async_sync_register(self):
+        """Update in place from the register, the heatpump rules over UI settings."""
+        option = self.heatpump.select_option(self.heatpump._hpstate[self.reg])
+        if option is None:
+            _LOGGER.debug(
+                "Unknown mode [%s] for %s",
+                self.heatpump._hpstate[self.reg],
+                self.entity_id,
+            )
+            return
+        if option != self._attr_current_option:
+            self._attr_current_option = option
+            self.heatpump.async_schedule_write(self)
+
     async def async_select_option(self, option: str) -> None:
         _LOGGER.debug("inp %s", self.entity_id)
         # We require that we have values from the hp before allowing updates from GUI
@@ -56,13 +82,9 @@ class CustomInputSelect(InputSelect):
         	# Using first char in description as value to write is a kludge
             value = int(option[0])
             if value != self.heatpump._hpstate[self.reg]:
-                self.heatpump._hpstate[self.reg] = value
-                self.heatpump._hass.bus.fire(
-                    # This will reload all sensor entities in this heatpump
-                    f"{self.heatpump._domain}_{self.heatpump._id}_msg_rec_event",
-                    {},
-                )
-                await self.heatpump.send_mqtt_reg(self.reg_id, value, 0xFFFF)
+                # This will update the sensor entities of this register
+                self.heatpump.async_set_register(self.reg, value)
+                self.heatpump.async_request_write(self.reg_id, value)
 
 
 async def setup_input_select(heatpump) -> None:
@@ -78,45 +100,42 @@ async def update_input_select(heatpump) -> None:
     to_add: List[CustomInputSelect] = []
     entity_list = []
 
-    for key in reg_id:
-        if reg_id[key][1] in [
-            "select_input",
-        ]:
-            inp = create_input_select_entity(heatpump, key)
-            to_add.append(inp)
-            entity_list.append(
-                f"{PLATFORM}.{heatpump._domain}_{heatpump._id}" + "_" + key
-            )
-
-    await platform.async_add_entities(to_add)
+    for spec in BY_PLATFORM[PLATFORM]:
+        key = spec.name
+        if not heatpump.entity_selected(key):
+            continue
+        inp = create_input_select_entity(heatpump, key)
+        to_add.append(inp)
+        entity_list.append(f"{PLATFORM}.{heatpump._domain}_{heatpump._id}" + "_" + key)
+
+    if heatpump.lazy_entities:
+        heatpump.async_add_entities_when_seen(
+            [(entity.reg_id, entity) for entity in to_add],
+            lambda group: heatpump._hass.async_create_task(
+                platform.async_add_entities(group)
+            ),
+        )
+    else:
+        await platform.async_add_entities(to_add)
 
 
 def create_input_select_entity(heatpump, name) -> CustomInputSelect:
     """Create a CustomInputNumber instance."""
 
     entity_id = f"{heatpump._domain}_{heatpump._id}_{name}"
-    if name in id_names:
-        friendly_name = id_names[name][heatpump._langid]
-    else:
-        friendly_name = None
+    friendly_name = heatpump.friendly_name(name)
     icon = None
 
     config = {
         CONF_ID: entity_id,
         CONF_NAME: friendly_name,
-        CONF_OPTIONS: [
-            "0 - " + id_names["mode0"][heatpump._langid],
-            "1 - " + id_names["mode1"][heatpump._langid],
-            "2 - " + id_names["mode2"][heatpump._langid],
-            "3 - " + id_names["mode3"][heatpump._langid],
-            "4 - " + id_names["mode4"][heatpump._langid],
-        ],
+        CONF_OPTIONS: heatpump.select_options,
         CONF_ICON: icon,
         CONF_INITIAL: None,
     }
 
     entity = CustomInputSelect.from_yaml(config)
-    entity.reg = reg_id[name][0]
+    entity.reg = REGISTERS[name].register
     entity.reg_id = name
     entity.heatpump = heatpump
     # Bitmask is all bits
@@ -8,9 +8,10 @@ from homeassistant.const import (
     ATTR_MANUFACTURER,
     ATTR_MODEL,
     ATTR_NAME,
+    EntityCategory,
 )
 from homeassistant.helpers.device_registry import DeviceEntryType
-from datetime import datetime
+from datetime import datetime, timedelta
 from homeassistant.helpers.entity import Entity, async_generate_entity_id
 
 from homeassistant.const import (
@@ -24,21 +25,96 @@ from homeassistant.components.sensor import SensorDeviceClass
 from .const import (
     DOMAIN,
     CONF_ID,
+    PLATFORM_SENSOR,
 )
 
-from .heatpump.thermiq_regs import (
+from .thermiq_core.thermiq_regs import (
     FIELD_BITMASK,
     FIELD_MAXVALUE,
     FIELD_MINVALUE,
     FIELD_REGNUM,
     FIELD_REGTYPE,
     FIELD_UNIT,
-    id_names,
-    reg_id,
 )
+from .thermiq_core.registers import BY_PLATFORM
 
 _LOGGER = logging.getLogger(__name__)
 
+# Polling interval of the diagnostic metric sensors
+SCAN_INTERVAL = timedelta(seconds=60)
+
+# Diagnostic sensors of the ingest metrics: key, name, unit, state class, value
+METRIC_SENSORS = [
+    (
+        "frames_received_rate",
+        "Frames received",
+        "frames/s",
+        SensorStateClass.MEASUREMENT,
+        lambda metrics: round(metrics["received_per_s"], 3),
+    ),
+    (
+        "frames_processed_rate",
+        "Frames processed",
+        "frames/s",
+        SensorStateClass.MEASUREMENT,
+        lambda metrics: round(metrics["processed_per_s"], 3),
+    ),
+    (
+        "frame_decode_time",
+        "Frame decode time",
+        "µs",
+        SensorStateClass.MEASUREMENT,
+        lambda metrics: _round(metrics["decode_time_us"]["mean"]),
+    ),
+    (
+        "frame_dispatch_time",
+        "Frame dispatch time",
+        "µs",
+        SensorStateClass.MEASUREMENT,
+        lambda metrics: _round(metrics["dispatch_time_us"]["mean"]),
+    ),
+    (
+        "entities_notified",
+        "Entities notified",
+        None,
+        SensorStateClass.TOTAL_INCREASING,
+        lambda metrics: metrics["entities_notified"],
+    ),
+    (
+        "state_writes",
+        "State writes",
+        None,
+        SensorStateClass.TOTAL_INCREASING,
+        lambda metrics: metrics["state_writes"],
+    ),
+    (
+        "mqtt_publishes",
+        "MQTT publishes",
+        None,
+        SensorStateClass.TOTAL_INCREASING,
+        lambda metrics: metrics["mqtt_publishes"],
+    ),
+    (
+        "json_errors",
+        "JSON errors",
+        None,
+        SensorStateClass.TOTAL_INCREASING,
+        lambda metrics: metrics["json_errors"],
+    ),
+    (
+        "rejected_frames",
+        "Rejected frames",
+        None,
+        SensorStateClass.TOTAL_INCREASING,
+        lambda metrics: metrics["rejected_frames"],
+    ),
+]
+
+
+def _round(value):
+    """Round a mean time, None if nothing was measured yet."""
+    return None if value is None else round(value, 1)
+
 
 async def async_setup_entry(
     hass, config_entry, async_add_entities, discovery_info=None
@@ -59,41 +135,36 @@ async def async_setup_entry(
     heatpump = hass.data[DOMAIN]._heatpumps[config_entry.data[CONF_ID]]
     entities = []
 
-    for key in reg_id:
-        if reg_id[key][1] in [
-            "temperature",
-            "temperature_input",
-            "time_input",
-            "sensor",
-            "sensor_input",
-            "generated_input",
-            "time",
-            "select_input",
-            "sensor_language",
-            "sensor_boolean",
-            "generated_sensor",
-        ]:
-            device_id = key
-            if key in id_names:
-                friendly_name = id_names[key][heatpump._langid]
-            else:
-                friendly_name = None
-            vp_reg = reg_id[key][0]
-            vp_type = reg_id[key][1]
-            vp_unit = reg_id[key][2]
-
-            entities.append(
-                HeatPumpSensor(
-                    hass,
-                    heatpump,
-                    device_id,
-                    vp_reg,
-                    friendly_name,
-                    vp_type,
-                    vp_unit,
-                )
+    for spec in BY_PLATFORM[PLATFORM_SENSOR]:
+        key = spec.name
+        if not heatpump.entity_selected(key):
+            continue
+        device_id = key
+        friendly_name = heatpump.friendly_name(key)
+
+        entities.append(
+            HeatPumpSensor(
+                hass,
+                heatpump,
+                device_id,
+                spec.register,
+                friendly_name,
+                spec.type,
+                spec.unit,
             )
-    async_add_entities(entities)
+        )
+    if heatpump.lazy_entities:
+        # Add a sensor when its register is received the first time
+        heatpump.async_add_entities_when_seen(
+            [(entity._idx, entity) for entity in entities],
+            lambda group: async_add_entities(group, True),
+        )
+    else:
+        async_add_entities(entities)
+
+    async_add_entities(
+        [HeatPumpMetricSensor(heatpump, *metric) for metric in METRIC_SENSORS], True
+    )
 
 
 class HeatPumpSensor(SensorEntity):
@@ -108,7 +179,6 @@ class HeatPumpSensor(SensorEntity):
 
         # self._attr_native_value = state
         # self._attr_native_unit_of_measurement = unit_of_measurement
-        self._attr_state_class = SensorStateClass.MEASUREMENT
 
         # set HA instance attributes directly (mostly don't use property)
         # self._attr_unique_id
@@ -145,12 +215,6 @@ class HeatPumpSensor(SensorEntity):
         # self.device_class [temperature, voltage,
         #self.state_class= measurement
 
-        # Listen for the ThermIQ rec event indicating new data
-        hass.bus.async_listen(
-            heatpump._domain + "_" + heatpump._id + "_msg_rec_event",
-            self._async_update_event,
-        )
-
         # Is this needed
         self._attr_device_info = {
             ATTR_IDENTIFIERS: {(heatpump._id, "ThermIQ-MQTT")},
@@ -175,6 +239,13 @@ class HeatPumpSensor(SensorEntity):
         """Return the state of the sensor."""
         return self._state
 
+    @property
+    def state_class(self):
+        """Measurement, unless the heatpump imports the statistics itself."""
+        if self._heatpump.imports_statistics(self._vp_reg):
+            return None
+        return SensorStateClass.MEASUREMENT
+
     @property
     def vp_reg(self):
         """Return the device class of the sensor."""
@@ -195,23 +266,61 @@ class HeatPumpSensor(SensorEntity):
         """Update the new state of the sensor."""
 
         _LOGGER.debug("update: " + self._idx)
-        self._state = self._hpstate.get_value(self._vp_reg)
+        self._state = self._hpstate.get(self._vp_reg)
         if self._state is None:
             _LOGGER.warning("Could not get data for %s", self._idx)
 
-    async def _async_update_event(self, event):
+    async def async_added_to_hass(self):
+        """Listen for new data in the register of the sensor."""
+        self.async_on_remove(
+            self._heatpump.async_add_register_listener(
+                self._vp_reg, self._async_update_register
+            )
+        )
+        # Only changes are dispatched, read the register if it was received
+        if self._hpstate["mqtt_counter"] > 0:
+            self._async_update_register()
+
+    @callback
+    def _async_update_register(self):
         """Update the new state of the sensor."""
 
-        _LOGGER.debug("event: " + self._idx)
         state = self._hpstate[self._vp_reg]
         if state is None:
             _LOGGER.debug("Could not get data for %s", self._idx)
         if self._state != state:
+            deadband = self._heatpump.deadband(self._idx)
+            if deadband is not None and not deadband.accept(state):
+                return
             self._state = state
-            self.async_schedule_update_ha_state()
-            _LOGGER.debug("async_update_ha: %s", str(state))
+            self._heatpump.async_schedule_write(self)
 
     @property
     def device_class(self):
         """Return the class of this device."""
         return f"{DOMAIN}_HeatPumpSensor"
+
+
+class HeatPumpMetricSensor(SensorEntity):
+    """Diagnostic sensor of the runtime metrics of a heatpump."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:chart-line"
+
+    def __init__(self, heatpump, key, name, unit, state_class, value):
+        self._heatpump = heatpump
+        self._value = value
+        self.entity_id = f"sensor.{heatpump._domain}_{heatpump._id}_metric_{key}"
+        self._attr_name = f"{heatpump._id} {name}"
+        self._attr_native_unit_of_measurement = unit
+        self._attr_state_class = state_class
+        self._attr_device_info = {
+            ATTR_IDENTIFIERS: {(heatpump._id, "ThermIQ-MQTT")},
+            ATTR_MANUFACTURER: "ThermIQ",
+            ATTR_MODEL: "v1.0",
+            "entry_type": DeviceEntryType.SERVICE,
+        }
+
+    async def async_update(self):
+        """Read the metric, polled every SCAN_INTERVAL."""
+        self._attr_native_value = self._value(self._heatpump.metrics)
@@ -0,0 +1,24 @@
+"""ThermIQ-MQTT frame decoding and register write encoding.
+
+Plain Python without Home Assistant imports, only relative imports are used
+inside the package. HeatPump in heatpump/ adapts it to Home Assistant, other
+programs put custom_components/thermiq_mqtt on sys.path and import
+thermiq_core directly.
+"""
+
+from .codec import get_codec
+from .decoder import FrameDecoder, is_thermiq_frame
+from .encoder import WriteEncoder
+from .registers import REGISTERS
+from .state import HeatPumpState
+from .writes import WriteTracker
+
+__all__ = [
+    "FrameDecoder",
+    "HeatPumpState",
+    "REGISTERS",
+    "WriteEncoder",
+    "WriteTracker",
+    "get_codec",
+    "is_thermiq_frame",
+]
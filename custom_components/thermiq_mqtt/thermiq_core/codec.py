@@ -0,0 +1,52 @@
+"""JSON codecs for ThermIQ-MQTT payloads."""
+
+import json
+import logging
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_LOGGER = logging.getLogger(__name__)
+
+CODEC_AUTO = "auto"
+CODEC_JSON = "json"
+CODEC_ORJSON = "orjson"
+AVAILABLE_CODECS = [CODEC_AUTO, CODEC_JSON, CODEC_ORJSON]
+
+
+class JsonCodec:
+    """Codec using the stdlib json module.
+
+    loads accepts both bytes and str payloads, so MQTT messages can be
+    handed over without decoding them to str first.
+    """
+
+    name = CODEC_JSON
+    loads = staticmethod(json.loads)
+    dumps = staticmethod(json.dumps)
+
+
+class OrjsonCodec(JsonCodec):
+    """Codec using orjson, dumps returns bytes."""
+
+    name = CODEC_ORJSON
+
+    if orjson is not None:
+        loads = staticmethod(orjson.loads)
+        dumps = staticmethod(orjson.dumps)
+
+
+def get_codec(name=CODEC_AUTO) -> JsonCodec:
+    """Return the codec for name, auto prefers orjson when installed."""
+    if name not in AVAILABLE_CODECS:
+        _LOGGER.error("Unknown JSON codec [%s], using %s", name, CODEC_JSON)
+        return JsonCodec()
+    if name == CODEC_JSON:
+        return JsonCodec()
+    if orjson is None:
+        if name == CODEC_ORJSON:
+            _LOGGER.warning("orjson is not installed, using %s", CODEC_JSON)
+        return JsonCodec()
+    return OrjsonCodec()
@@ -0,0 +1,110 @@
+"""Deadband and hysteresis filtering of sensor values."""
+
+from .registers import REGISTERS
+
+# Default (deadband, hysteresis) for sensors, looked up by unit first and
+# then by register type. Decimal parts of a temperature wrap from 9 to 0
+# and are never filtered.
+DEFAULT_DEADBAND_BY_UNIT = {
+    "0.1C": (0, 0),
+}
+DEFAULT_DEADBAND_BY_TYPE = {
+    "temperature": (0.2, 0.1),
+}
+
+# Register types with numeric values, only these can have a deadband
+NUMERIC_TYPES = (
+    "temperature",
+    "temperature_input",
+    "time",
+    "time_input",
+    "sensor",
+    "sensor_input",
+    "generated_input",
+)
+
+# Tolerance for decimal temperatures like 21.5 - 21.3 = 0.19999999999999929
+_EPSILON = 1e-9
+
+
+class Deadband:
+    """Filter for the values of one sensor.
+
+    A value is accepted when it differs at least band from the last accepted
+    value. When the value turns in the opposite direction of the last change
+    it also has to move hysteresis further, so a value flipping between two
+    readings is reported once.
+    """
+
+    __slots__ = ("band", "hysteresis", "value", "rising")
+
+    def __init__(self, band, hysteresis=0):
+        self.band = band
+        self.hysteresis = hysteresis
+        self.value = None
+        self.rising = None
+
+    def accept(self, value):
+        """Return True if value should be written to the state machine.
+
+        Values that are not numbers are always accepted.
+        """
+        if not isinstance(value, (int, float)):
+            self.value = None
+            self.rising = None
+            return True
+        if self.value is None:
+            self.value = value
+            self.rising = None
+            return True
+        delta = value - self.value
+        if delta == 0:
+            return False
+        rising = delta > 0
+        limit = self.band
+        if self.rising is not None and rising != self.rising:
+            limit += self.hysteresis
+        if abs(delta) + _EPSILON < limit:
+            return False
+        self.value = value
+        self.rising = rising
+        return True
+
+
+def parse_deadbands(text):
+    """Parse overrides like "indoor_t=0.3/0.1, boiler_t=1".
+
+    Returns a dict of reg_id name to (deadband, hysteresis). Raises
+    ValueError for an unknown or non numeric register, or a malformed entry.
+    """
+    overrides = {}
+    for item in text.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        name, _, values = item.partition("=")
+        name = name.strip()
+        if name not in REGISTERS:
+            raise ValueError(f"Unknown register {name}")
+        if REGISTERS[name].type not in NUMERIC_TYPES:
+            raise ValueError(f"Register {name} is not numeric")
+        band, _, hysteresis = values.partition("/")
+        band = float(band)
+        hysteresis = float(hysteresis) if hysteresis.strip() else 0
+        if band < 0 or hysteresis < 0:
+            raise ValueError(f"Negative deadband for {name}")
+        overrides[name] = (band, hysteresis)
+    return overrides
+
+
+def deadband_table(overrides=None):
+    """Return the (deadband, hysteresis) of every filtered reg_id name."""
+    table = {}
+    for name, spec in REGISTERS.items():
+        default = DEFAULT_DEADBAND_BY_UNIT.get(spec.unit)
+        if default is None:
+            default = DEFAULT_DEADBAND_BY_TYPE.get(spec.type, (0, 0))
+        table[name] = default
+    if overrides:
+        table.update(overrides)
+    return {name: limits for name, limits in table.items() if any(limits)}
@@ -0,0 +1,189 @@
+"""Decoding of ThermIQ-MQTT data frames into a register state."""
+
+import logging
+
+from .codec import get_codec
+from .registers import BY_REGISTER, REGISTER_NAMES
+from .state import REGISTER_SLOTS, HeatPumpState, register_value
+
+_LOGGER = logging.getLogger(__name__)
+
+# Decode entry of a register excluded by the register profile
+SKIP_ENTRY = (None, None, None, None)
+
+# Value of every register until it is received
+UNSET_VALUE = -1
+
+# Registers combined with their decimal part after a frame is decoded
+COMBINED_REGS = [
+    ("r01", "r02"),
+    ("r03", "r04"),
+]
+
+
+def flipped_bits(old, new):
+    """Return the bits of a bitfield register that changed from old to new.
+
+    All bits are returned when old is no previous word, like UNSET_VALUE
+    before the first frame.
+    """
+    if isinstance(old, int) and old >= 0 and old != new:
+        return old ^ new
+    return -1
+
+
+def is_thermiq_frame(json_dict):
+    """Return True if a decoded payload was sent by ThermIQ-MQTT."""
+    return isinstance(json_dict, dict) and str(
+        json_dict.get("Client_Name", "")
+    ).startswith("ThermIQ_")
+
+
+class FrameDecoder:
+    """Decoder of the data frames of one heatpump.
+
+    apply() stores the registers of a frame in state and returns the keys
+    it changed, mapped to their previous value. Both the hex (rXX) and the
+    decimal (dNNN) register keys are understood.
+    """
+
+    def __init__(self, state=None, codec=None, excluded=frozenset()):
+        self.state = HeatPumpState() if state is None else state
+        self.codec = get_codec() if codec is None else codec
+        self.excluded = excluded
+        self.last_payload = None
+        self._raw = {}
+        for register in BY_REGISTER:
+            self.state[register] = UNSET_VALUE
+        self.reset()
+        self._build_decode_table()
+
+    def reset(self):
+        """Refresh every register with the next frame."""
+        self.state["mqtt_counter"] = 0
+        self.last_payload = None
+
+    def set_excluded(self, excluded):
+        """Skip the registers whose reg_id names are all in excluded."""
+        self.excluded = excluded
+        self._build_decode_table()
+
+    def is_repeat(self, payload):
+        """Return True if payload is the same as the last frame applied."""
+        return payload == self.last_payload
+
+    def loads(self, payload):
+        """Parse a payload, raises ValueError if it is not JSON."""
+        return self.codec.loads(payload)
+
+    def apply(self, json_dict, payload=None):
+        """Store a parsed ThermIQ frame and return the keys it changed."""
+        self.last_payload = payload
+        hpstate = self.state
+        registers = hpstate.registers
+        fields = hpstate.fields
+        decode = self._decode
+        raw = self._raw
+        recombine = set()
+        # The first frame after a reset refreshes everything
+        changed = {}
+        full = hpstate["mqtt_counter"] == 0
+        for k, value in json_dict.items():
+            entry = decode.get(k)
+            if entry is None:
+                entry = self._decode_key(k)
+            elif entry is SKIP_ENTRY:
+                continue
+            kstore, _, combine, slot = entry
+
+            # r01 and r03 should be combined with respective decimal part r02 and r04
+            if combine is not None and kstore == combine[0]:
+                if full or raw.get(kstore) != value:
+                    raw[kstore] = value
+                    recombine.add(combine)
+                continue
+
+            if slot is None:
+                old = fields.get(kstore)
+                if not full and old == value:
+                    continue
+                fields[kstore] = value
+            else:
+                old = registers[slot]
+                if not full and old == value:
+                    continue
+                try:
+                    registers[slot] = value
+                except TypeError:
+                    _LOGGER.error("Value [%s] of [%s] is not a number", value, k)
+                    continue
+                old = register_value(old)
+            changed[kstore] = old
+            if combine is not None:
+                recombine.add(combine)
+
+        # Do some post processing of data received
+        for kstore, decimal in recombine:
+            self._store(
+                kstore, raw.get(kstore, 0) + hpstate[decimal] / 10, changed, full
+            )
+
+        changed["mqtt_counter"] = hpstate["mqtt_counter"]
+        hpstate["mqtt_counter"] += 1
+
+        if "time" in json_dict:
+            self._store("time_str", json_dict["time"], changed, full)
+        elif "Time" in json_dict:
+            self._store("time_str", json_dict["Time"], changed, full)
+
+        self._store(
+            "communication_status", json_dict.get("vp_read", "Ok"), changed, full
+        )
+        return changed
+
+    def _store(self, key, value, changed, full=False):
+        """Store a generated value and record it in changed if it differs."""
+        old = self.state.get(key)
+        self.state[key] = value
+        if full or old != value:
+            changed[key] = old
+
+    def _build_decode_table(self):
+        """Precompile the wire key -> decode entry table from reg_id.
+
+        Both the hex (rXX) and the decimal (dNNN) spelling of every register
+        is added, so decoding a frame is a single dict lookup per key.
+        """
+        self._decode = {}
+        excluded = self.excluded
+        for register, specs in BY_REGISTER.items():
+            if excluded and all(spec.name in excluded for spec in specs):
+                entry = SKIP_ENTRY
+            else:
+                entry = self._make_decode_entry(register)
+            if register[0] == "r" and len(register) == 3:
+                self._decode[register] = entry
+                self._decode["d" + format(int(register[1:], 16), "03d")] = entry
+            else:
+                self._decode[register] = entry
+                self._decode[register.upper()] = entry
+
+    def _make_decode_entry(self, kstore):
+        """Create the decode entry for a normalized register key."""
+        combine = None
+        for combined in COMBINED_REGS:
+            if kstore in combined:
+                combine = combined
+        return (kstore, REGISTER_NAMES.get(kstore), combine, REGISTER_SLOTS.get(kstore))
+
+    def _decode_key(self, k):
+        """Decode a wire key not in the precompiled table and remember it."""
+        kstore = k.lower()
+        # Create hex notation if incoming register is decimal format
+        if kstore[0] == "d" and kstore[1:].isdigit():
+            reg = int(kstore[1:])
+            if reg < 256:
+                kstore = "r" + format(reg, "02x")
+        entry = self._make_decode_entry(kstore)
+        self._decode[k] = entry
+        return entry
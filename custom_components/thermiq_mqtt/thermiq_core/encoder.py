@@ -0,0 +1,60 @@
+"""Encoding of register writes into ThermIQ-MQTT messages."""
+
+from .codec import get_codec
+from .registers import REGISTER_NAMES, REGISTERS
+
+# Registers written through the set topic, with their message key
+SET_KEYS = {
+    "indr_t": "INDR_T",
+    "evu": "EVU",
+}
+
+
+class WriteEncoder:
+    """Encoder of register writes for the topics below mqtt_base.
+
+    Registers are written as dNNN, the decimal register notation is easier
+    for humans to read, or as rXX when hex_format is set.
+    """
+
+    def __init__(self, mqtt_base="", hex_format=False, codec=None):
+        self.write_topic = mqtt_base + "write"
+        self.set_topic = mqtt_base + "set"
+        self.hex_format = hex_format
+        self.codec = get_codec() if codec is None else codec
+
+    def encode(self, register_id, value, bitmask=None):
+        """Return (register, topic, key, value) of a write to reg_id name register_id.
+
+        Raises ValueError for a missing value or an unknown register.
+        """
+        register = REGISTERS[register_id].register
+
+        if not isinstance(value, (int, float)):
+            raise ValueError(f"missing value:[{value}]")
+
+        if bitmask is None:
+            bitmask = 0xFFFF
+
+        if register_id == "room_sensor_set_t":
+            value = float(value)
+        else:
+            value = int(value) & int(bitmask)
+
+        if register not in REGISTER_NAMES:
+            raise ValueError(f"unknown register:[{register}]")
+
+        if register in SET_KEYS:
+            return register, self.set_topic, SET_KEYS[register], value
+        if self.hex_format:
+            return register, self.write_topic, register, value
+        return (
+            register,
+            self.write_topic,
+            "d" + format(int(register[1:], 16), "03d"),
+            value,
+        )
+
+    def dumps(self, message):
+        """Serialize a dict of message key -> value."""
+        return self.codec.dumps(message)
@@ -0,0 +1,63 @@
+"""Ring buffer of the last frames of a heatpump, for diagnostics."""
+
+from collections import deque
+
+FRAME_HISTORY_SIZE = 20
+
+FRAME_OK = "ok"
+FRAME_REJECTED = "rejected"
+FRAME_INVALID_JSON = "invalid_json"
+
+
+class FrameHistory:
+    """The last frames received, with their changes and timings.
+
+    add() only stores references: the payload as received and the changed
+    dict of the frame, which the decoder never reuses. The new values of
+    the changed registers are worked out when the history is read.
+    """
+
+    def __init__(self, size=FRAME_HISTORY_SIZE):
+        self._frames = deque(maxlen=size)
+
+    def __len__(self):
+        return len(self._frames)
+
+    def add(
+        self, when, payload, result, changed=None, decode_us=None, dispatch_us=None
+    ):
+        """Store a frame received at wall clock time when."""
+        self._frames.append((when, payload, result, changed, decode_us, dispatch_us))
+
+    def as_list(self, state):
+        """Return the frames as plain data, oldest first.
+
+        The changes of a frame are [old, new] pairs. A new value is the old
+        value of the next frame changing the same key, or the value in state
+        for the last one.
+        """
+        frames = []
+        later = {}
+        for when, payload, result, changed, decode_us, dispatch_us in reversed(
+            self._frames
+        ):
+            changes = None
+            if changed is not None:
+                changes = {}
+                for key, old in changed.items():
+                    changes[key] = [old, later[key] if key in later else state.get(key)]
+                    later[key] = old
+            if isinstance(payload, (bytes, bytearray)):
+                payload = payload.decode("utf-8", "replace")
+            frames.append(
+                {
+                    "time": when,
+                    "result": result,
+                    "payload": payload,
+                    "changes": changes,
+                    "decode_us": decode_us,
+                    "dispatch_us": dispatch_us,
+                }
+            )
+        frames.reverse()
+        return frames
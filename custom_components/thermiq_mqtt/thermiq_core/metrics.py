@@ -0,0 +1,145 @@
+"""Cheap runtime counters and histograms of the ingest path."""
+
+from bisect import bisect_left
+from math import exp
+
+# Upper bounds of the decode and dispatch time buckets, in microseconds
+TIME_BUCKETS = (50, 100, 200, 500, 1000, 2000, 5000, 10000, 50000)
+
+# Seconds the frame rates are averaged over
+RATE_WINDOW = 60.0
+
+
+class Histogram:
+    """Counts of values in fixed buckets, with their total.
+
+    Adding a value is a bisect and two additions, quantiles are the upper
+    bound of the bucket they fall in.
+    """
+
+    __slots__ = ("bounds", "counts", "count", "total")
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def add(self, value):
+        """Add a value."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+
+    @property
+    def mean(self):
+        """Mean of the values added, None if there are none."""
+        if not self.count:
+            return None
+        return self.total / self.count
+
+    def quantile(self, fraction):
+        """Upper bound of the bucket holding the quantile, None if empty.
+
+        Values above the last bound are reported as the last bound.
+        """
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return self.bounds[-1]
+
+    def as_dict(self):
+        """Return the histogram as plain data."""
+        buckets = {
+            f"<={bound}": count for bound, count in zip(self.bounds, self.counts)
+        }
+        buckets[f">{self.bounds[-1]}"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "buckets": buckets,
+        }
+
+
+class EventRate:
+    """Events per second, exponentially averaged over window seconds."""
+
+    __slots__ = ("window", "_rate", "_last")
+
+    def __init__(self, window=RATE_WINDOW):
+        self.window = window
+        self._rate = 0.0
+        self._last = None
+
+    def add(self, now):
+        """Count an event at time now."""
+        if self._last is not None:
+            self._rate *= exp((self._last - now) / self.window)
+        self._rate += 1 / self.window
+        self._last = now
+
+    def rate(self, now):
+        """Return the rate at time now."""
+        if self._last is None:
+            return 0.0
+        return self._rate * exp((self._last - now) / self.window)
+
+
+class IngestMetrics:
+    """Counters of one heatpump's frames, decoding, notifications and writes."""
+
+    __slots__ = (
+        "frames_received",
+        "frames_processed",
+        "frames_coalesced",
+        "frames_dropped",
+        "json_errors",
+        "rejected_frames",
+        "entities_notified",
+        "state_writes",
+        "mqtt_publishes",
+        "received_rate",
+        "processed_rate",
+        "decode_time",
+        "dispatch_time",
+    )
+
+    def __init__(self):
+        self.frames_received = 0
+        self.frames_processed = 0
+        self.frames_coalesced = 0
+        self.frames_dropped = 0
+        self.json_errors = 0
+        self.rejected_frames = 0
+        self.entities_notified = 0
+        self.state_writes = 0
+        self.mqtt_publishes = 0
+        self.received_rate = EventRate()
+        self.processed_rate = EventRate()
+        self.decode_time = Histogram(TIME_BUCKETS)
+        self.dispatch_time = Histogram(TIME_BUCKETS)
+
+    def as_dict(self, now):
+        """Return the metrics as plain data, rates at time now."""
+        return {
+            "frames_received": self.frames_received,
+            "frames_processed": self.frames_processed,
+            "frames_coalesced": self.frames_coalesced,
+            "frames_dropped": self.frames_dropped,
+            "json_errors": self.json_errors,
+            "rejected_frames": self.rejected_frames,
+            "entities_notified": self.entities_notified,
+            "state_writes": self.state_writes,
+            "mqtt_publishes": self.mqtt_publishes,
+            "received_per_s": self.received_rate.rate(now),
+            "processed_per_s": self.processed_rate.rate(now),
+            "decode_time_us": self.decode_time.as_dict(),
+            "dispatch_time_us": self.dispatch_time.as_dict(),
+        }
@@ -0,0 +1,14 @@
+"""Register and mode names, one module per language.
+
+Only the languages used by a configured heatpump are imported, each of
+them once per process.
+"""
+
+from functools import cache
+from importlib import import_module
+
+
+@cache
+def get_names(language):
+    """Return the reg_id name -> friendly name table of language."""
+    return import_module(f".{language}", __name__).id_names
@@ -0,0 +1,141 @@
+# ThermIQ generated register names, German
+id_names = {
+  'outdoor_t'                   : 'Außentemperatur',
+  'indoor_t'                    : 'Innentemperatur, Ist',
+  'indoor_dec_t'                : 'Innentemp., Ist, decimal',
+  'indoor_target_t'             : 'Innentemperatur, Soll',
+  'indoor_target_dec_t'         : 'Innentemp., Soll, decimal',
+  'supplyline_t'                : 'Vorlauftemperatur',
+  'returnline_t'                : 'Rücklauftemperatur',
+  'boiler_t'                    : 'Warmwassertemperatur',
+  'brine_out_t'                 : 'Soleablasstemperatur',
+  'brine_in_t'                  : 'Soleeinlasstemperatur',
+  'cooling_t'                   : 'Kühlung Temperatur',
+  'supply_shunt_t'              : 'Vorlauftemperatur, Mischer',
+  'current_consumed_a'          : 'Stromverbrauch',
+  'boiler_3kw_on'               : 'Elektrozusatz 3 kW',
+  'boiler_6kw_on'               : 'Elektrozusatz 6 kW',
+  'supplyline_target_t'         : 'Vorlauftemperatur, Soll',
+  'supplyline_shunt_target_t'   : 'Vorlauftemp., Mischer, Soll',
+  'brine_pump_on'               : 'Solepumpe',
+  'compressor_on'               : 'Kompressor',
+  'supply_pump_on'              : 'Umwälzpumpe',
+  'hotwaterproduction_on'       : 'Warmwasserbereitung',
+  'aux2_heating_on'             : 'Zusatzheizung 2',
+  'shunt1_n'                    : 'Mischer -',
+  'shunt1_p'                    : 'Mischer +',
+  'aux1_heating_on'             : 'Zusatzheizung 1',
+  'shunt2_n'                    : 'Mischergruppe -',
+  'shunt2_p'                    : 'Mischergruppe +',
+  'shunt_cooling_n'             : 'Mischer Kühlung -',
+  'shunt_cooling_p'             : 'Mischer Kühlung +',
+  'active_cooling_on'           : 'Aktive Kühlung',
+  'passive_cooling_on'          : 'Passive Külung',
+  'alarm_indication_on'         : 'Alarm',
+  'pwm_out_period'              : 'PWM Out',
+  'highpressure_alm'            : 'Alarm Hochdruckpressostat',
+  'lowpressure_alm'             : 'Alarm Niedrigdruckpressostat',
+  'motorbreaker_alm'            : 'Alarm Motorschutz',
+  'brine_flow_alm'              : 'Alarm Niedrigströmung, Sole',
+  'brine_temperature_alm'       : 'Alarm Niedrigtemperatur, Sole',
+  'outdoor_sensor_alm'          : 'Alarm Außenfühler',
+  'supplyline_sensor_alm'       : 'Alarm Vorlauffühler',
+  'returnline_sensor_alm'       : 'Alarm Rücklauffühler',
+  'boiler_sensor_alm'           : 'Alarm Warmwasserfühler',
+  'indoor_sensor_alm'           : 'Alarm Innenfühler',
+  'phase_order_alm'             : 'Alarm falsche Phasenfolge',
+  'overheating_alm'             : 'Alarm Überhitzungsschutz',
+  'demand1'                     : 'BEDARF1',
+  'demand2'                     : 'BEDARF2',
+  'pressurepipe_t'              : 'Druckrohrtemperatur',
+  'hgw_water_t'                 : 'Warmw.vorlauftemperatur',
+  'integral1'                   : 'Integral (A1)',
+  'integral1_a_step'            : 'Integral, A-Grenzschritte',
+  'defrost_time_m'              : 'Defrost',
+  'time_to_start_min_m'         : 'Mindestzeit bis Start',
+  'sw_version'                  : 'Programmversion',
+  'supply_pump_speed'           : 'Umwälzpumpengeschw.',
+  'brine_pump_speed'            : 'Solepumpengeschw.',
+  'status3_m'                   : 'STATUS3',
+  'indoor_requested_t'          : 'Innentemperatur, Soll',
+  'main_mode'                   : 'Betriebszustand',
+  'integral1_curve_slope'       : 'Heizkurve',
+  'integral1_curve_min'         : 'Kurve min',
+  'integral1_curve_max'         : 'Kurve max',
+  'integral1_curve_p5'          : 'Kurve +5',
+  'integral1_curve_0'           : 'Kurve 0',
+  'integral1_curve_n5'          : 'Kurve -5',
+  'heating_stop_t'              : 'Heizstopp',
+  'reduction_t'                 : 'Nachtabsenkung',
+  'room_factor'                 : 'Raumfaktor',
+  'integral2_curve_slope'       : 'Mischer Kurve',
+  'integral2_curve_min'         : 'Mischer Kurve min',
+  'integral2_curve_max'         : 'Mischer Kurve max',
+  'integral2_curve_target'      : 'Mischer Kurve, Soll',
+  'integral2_curve_actual'      : 'Mischer Kurve, Ist',
+  'outdoor_stop_t'              : 'Außentemp. Stop (20=-20C)',
+  'pressure_pipe_limit_t'       : 'Druckrohr, Temperaturgrenze',
+  'hotwater_start_t'            : 'Warmwasser, Starttemperatur',
+  'hotwater_runtime_m'          : 'Warmwasserzeit',
+  'heatpump_runtime_m'          : 'Heizzeit',
+  'legionella_interval_d'       : 'Legionella, Intervall',
+  'legionella_stop_t'           : 'Legionella, Stopptemperatur',
+  'integral1_a_limit'           : 'Integral A1',
+  'integral1_hysteresis_t'      : 'Hysterese A1',
+  'returnline_max_t'            : 'Rücklauftemperatur, Maxgrenze',
+  'start_interval_min_m'        : 'Minimum Startintervall',
+  'brine_min_t'                 : 'Soletemperatur, Mingrenze (-15=aus)',
+  'cooling_target_t'            : 'Kühlung, Soll',
+  'integral2_a_limit'           : 'Integral A2',
+  'integral2_hysteresis_t'      : 'Hysterese, Zusatz',
+  'elect_boiler_steps_max'      : 'Maximum Stufen, Zusatz',
+  'current_consumption_max_a'   : 'Stromverbrauch, Maxgrenze',
+  'shunt_time_s'                : 'Mischerzeit',
+  'hotwater_stop_t'             : 'Warmwasserstopptemperatur',
+  'manual_test_mode_on'         : 'Manueller Test',
+  'status7'                     : 'DT_LARMOFF',
+  'language'                    : 'Sprache',
+  'status8'                     : 'SERVFAS',
+  'factory_reset_req'           : 'Werkseinstellung',
+  'runtime_counters_reset_req'  : 'Nullstellung Laufzeiten',
+  'outdoor_sensor_offset_t'     : 'Kalibrierung Außenfühler',
+  'supplyline_sensor_offset_t'  : 'Kalibrierung Vorlauffühler',
+  'returnline_sensor_offset_t'  : 'Kalibrierung Rücklauffühler',
+  'boiler_sensor_offset_t'      : 'Kalibrierung Warmwasserfühler',
+  'brine_in_sensor_offset_t'    : 'Kalibrierung Soleablass',
+  'brine_out_sensor_offset_t'   : 'Kalibrierung Soleeinlass',
+  'heatingsystem_type'          : 'Heizsystemtyp 0=VL 4=D',
+  'opt_phasemeassure_installed' : 'Ergänzung Phasenmessung',
+  'opt_2_installed'             : 'TILL2',
+  'opt_hgw_installed'           : 'Ergänzung HGW',
+  'opt_4_installed'             : 'TILL4',
+  'opt_5_installed'             : 'TILL5',
+  'opt_6_installed'             : 'TILL6',
+  'opt_optimum_installed'       : 'Ergänzung Optimum',
+  'opt_flowguard_installed'     : 'Ergänzung Strömungswächter',
+  'internal_logging_t'          : 'Logdauer',
+  'brine_runout_t'              : 'Solepumpe Anlaufdauer',
+  'brine_run_in_t'              : 'Solepumpe Nachlaufdauer',
+  'legionella_run_on'           : 'Legionella Spitzenwärme aktiv',
+  'legionella_run_length_h'     : 'Legionella Spitzenwärmedauer',
+  'compressor_runtime_h'        : 'Betriebszeit Kompressor',
+  'msd1_dvp'                    : 'DVP_MSD1',
+  'boiler_3kw_runtime_h'        : 'Betriebszeit 3 kW',
+  'msd1_dts'                    : 'DTS_MSD1',
+  'hotwater_runtime_h'          : 'Betriebszeit Warmwasser',
+  'msd1_dvv'                    : 'DVV_MSD1',
+  'passive_cooling_runtime_h'   : 'Betriebszeit passive Kühlung',
+  'msd1_dpas'                   : 'DPAS_MSD1',
+  'active_cooling_runtime_h'    : 'Betriebszeit aktive Kühlung',
+  'msd1_dact'                   : 'DACT_MSD1',
+  'boiler_6kw_on_runtime_h'     : 'Betriebszeit 6 kW',
+  'msd1_dts2'                   : 'DTS2_MSD1',
+  'graph_display_offset'        : 'GrafCounterOffSet',
+  'room_sensor_set_t'           : 'Room sensor, Set',
+  'heatpump_evu_block'          : 'EVU Function, Set state',
+  'mode0'                       : 'Aus',
+  'mode1'                       : 'Auto',
+  'mode2'                       : 'Nur Wärmepumpe',
+  'mode3'                       : 'Nur Elektroheizung',
+  'mode4'                       : 'Nur Warmwasserbereiter',
+}
@@ -0,0 +1,141 @@
+# ThermIQ generated register names, English
+id_names = {
+  'outdoor_t'                   : 'Outdoor temp.',
+  'indoor_t'                    : 'Indoor temp.',
+  'indoor_dec_t'                : 'Indoor temp., decimal',
+  'indoor_target_t'             : 'Indoor target temp.',
+  'indoor_target_dec_t'         : 'Indoor target temp., decimal',
+  'supplyline_t'                : 'Supplyline temp.',
+  'returnline_t'                : 'Returnline temp.',
+  'boiler_t'                    : 'Hotwater temp.',
+  'brine_out_t'                 : 'Brine out temp.',
+  'brine_in_t'                  : 'Brine in temp.',
+  'cooling_t'                   : 'Cooling temp.',
+  'supply_shunt_t'              : 'Supplyline temp., shunt',
+  'current_consumed_a'          : 'Electrical Current',
+  'boiler_3kw_on'               : 'Aux. heater 3 kW',
+  'boiler_6kw_on'               : 'Aux. heater 6 kW',
+  'supplyline_target_t'         : 'Supplyline target temp.',
+  'supplyline_shunt_target_t'   : 'Supplyline target temp., shunt',
+  'brine_pump_on'               : 'Brinepump',
+  'compressor_on'               : 'Compressor',
+  'supply_pump_on'              : 'Flowlinepump',
+  'hotwaterproduction_on'       : 'Hotwater production.',
+  'aux2_heating_on'             : 'Auxilliary 2',
+  'shunt1_n'                    : 'Shunt -',
+  'shunt1_p'                    : 'Shunt +',
+  'aux1_heating_on'             : 'Auxilliary 1',
+  'shunt2_n'                    : 'Shuntgroup -',
+  'shunt2_p'                    : 'Shuntgroup +',
+  'shunt_cooling_n'             : 'Shunt cooling -',
+  'shunt_cooling_p'             : 'Shunt cooling +',
+  'active_cooling_on'           : 'Active cooling',
+  'passive_cooling_on'          : 'Passive cooling',
+  'alarm_indication_on'         : 'Alarm',
+  'pwm_out_period'              : 'PWM Out',
+  'highpressure_alm'            : 'Alarm highpr.pressostate',
+  'lowpressure_alm'             : 'Alarm lowpr.pressostate',
+  'motorbreaker_alm'            : 'Alarm motorcircuit breaker',
+  'brine_flow_alm'              : 'Alarm low flow brine',
+  'brine_temperature_alm'       : 'Alarm low temp. brine',
+  'outdoor_sensor_alm'          : 'Alarm outdoor t-sensor',
+  'supplyline_sensor_alm'       : 'Alarm supplyline t-sensor',
+  'returnline_sensor_alm'       : 'Alarm returnline t-sensor',
+  'boiler_sensor_alm'           : 'Alarm hotw. t-sensor',
+  'indoor_sensor_alm'           : 'Alarm indoor t-sensor',
+  'phase_order_alm'             : 'Alarm incorrect 3-phase order',
+  'overheating_alm'             : 'Alarm overheating',
+  'demand1'                     : 'DEMAND1',
+  'demand2'                     : 'DEMAND2',
+  'pressurepipe_t'              : 'Pressurepipe temp.',
+  'hgw_water_t'                 : 'Hotw. supplyline temp.',
+  'integral1'                   : 'Integral (A1)',
+  'integral1_a_step'            : 'Integral, reached A-limit',
+  'defrost_time_m'              : 'Defrost',
+  'time_to_start_min_m'         : 'Minimum time to start',
+  'sw_version'                  : 'Program version',
+  'supply_pump_speed'           : 'Flowlinepump speed',
+  'brine_pump_speed'            : 'Brinepump speed',
+  'status3_m'                   : 'STATUS3',
+  'indoor_requested_t'          : 'Indoor target temp.',
+  'main_mode'                   : 'Mode',
+  'integral1_curve_slope'       : 'Curve',
+  'integral1_curve_min'         : 'Curve min',
+  'integral1_curve_max'         : 'Curve max',
+  'integral1_curve_p5'          : 'Curve +5',
+  'integral1_curve_0'           : 'Curve 0',
+  'integral1_curve_n5'          : 'Curve -5',
+  'heating_stop_t'              : 'Heatstop',
+  'reduction_t'                 : 'Temp. reduction',
+  'room_factor'                 : 'Room factor',
+  'integral2_curve_slope'       : 'Curve 2',
+  'integral2_curve_min'         : 'Curve 2 min',
+  'integral2_curve_max'         : 'Curve 2 max',
+  'integral2_curve_target'      : 'Curve 2, Target',
+  'integral2_curve_actual'      : 'Curve 2, Actual',
+  'outdoor_stop_t'              : 'Outdoor stop temp. (20=-20C)',
+  'pressure_pipe_limit_t'       : 'Pressurepipe, temp. limit',
+  'hotwater_start_t'            : 'Hotwater starttemp.',
+  'hotwater_runtime_m'          : 'Hotwater operating time',
+  'heatpump_runtime_m'          : 'Heatpump operating time',
+  'legionella_interval_d'       : 'Legionella interval',
+  'legionella_stop_t'           : 'Legionella stop temp.',
+  'integral1_a_limit'           : 'Integral limit A1',
+  'integral1_hysteresis_t'      : 'Hysteresis A1',
+  'returnline_max_t'            : 'Returnline temp., max limit',
+  'start_interval_min_m'        : 'Minimum start interval',
+  'brine_min_t'                 : 'Brinetemp., min limit (-15=OFFV)',
+  'cooling_target_t'            : 'Cooling, target',
+  'integral2_a_limit'           : 'Integral limit A2',
+  'integral2_hysteresis_t'      : 'Hysteresis limit A2',
+  'elect_boiler_steps_max'      : 'Max Electric steps',
+  'current_consumption_max_a'   : 'Electrical current, max limit',
+  'shunt_time_s'                : 'Shunt time',
+  'hotwater_stop_t'             : 'Hotwater stop temp.',
+  'manual_test_mode_on'         : 'Manual test mode',
+  'status7'                     : 'DT_LARMOFF',
+  'language'                    : 'Language',
+  'status8'                     : 'SERVFAS',
+  'factory_reset_req'           : 'Reset to Factory settings',
+  'runtime_counters_reset_req'  : 'Reset runtime counters',
+  'outdoor_sensor_offset_t'     : 'Calibration outdoor sensor',
+  'supplyline_sensor_offset_t'  : 'Calibration supplyline sensor',
+  'returnline_sensor_offset_t'  : 'Calibration returnline sensor',
+  'boiler_sensor_offset_t'      : 'Calibration hotwater sensor',
+  'brine_in_sensor_offset_t'    : 'Calibration brine out sensor',
+  'brine_out_sensor_offset_t'   : 'Calibration brine in sensor',
+  'heatingsystem_type'          : 'Heating system type 0=VL 4=D',
+  'opt_phasemeassure_installed' : 'Add-on phase order measurement',
+  'opt_2_installed'             : 'TILL2',
+  'opt_hgw_installed'           : 'Add-on HGW',
+  'opt_4_installed'             : 'TILL4',
+  'opt_5_installed'             : 'TILL5',
+  'opt_6_installed'             : 'TILL6',
+  'opt_optimum_installed'       : 'Add-on Optimum',
+  'opt_flowguard_installed'     : 'Add-on flow guard',
+  'internal_logging_t'          : 'Logging time',
+  'brine_runout_t'              : 'Brine run-out duration',
+  'brine_run_in_t'              : 'Brine run-in duration',
+  'legionella_run_on'           : 'Legionella peak heating enable',
+  'legionella_run_length_h'     : 'Legionella peak heating duration',
+  'compressor_runtime_h'        : 'Runtime compressor',
+  'msd1_dvp'                    : 'DVP_MSD1',
+  'boiler_3kw_runtime_h'        : 'Runtime 3 kW',
+  'msd1_dts'                    : 'DTS_MSD1',
+  'hotwater_runtime_h'          : 'Runtime hotwater production',
+  'msd1_dvv'                    : 'DVV_MSD1',
+  'passive_cooling_runtime_h'   : 'Runtime passive cooling',
+  'msd1_dpas'                   : 'DPAS_MSD1',
+  'active_cooling_runtime_h'    : 'Runtime active cooling',
+  'msd1_dact'                   : 'DACT_MSD1',
+  'boiler_6kw_on_runtime_h'     : 'Runtime 6 kW',
+  'msd1_dts2'                   : 'DTS2_MSD1',
+  'graph_display_offset'        : 'GrafCounterOffSet',
+  'room_sensor_set_t'           : 'Room sensor, Set actual',
+  'heatpump_evu_block'          : 'EVU Function, Set state',
+  'mode0'                       : 'Off',
+  'mode1'                       : 'Auto',
+  'mode2'                       : 'Heatpump only',
+  'mode3'                       : 'Heater only',
+  'mode4'                       : 'Hot water only',
+}
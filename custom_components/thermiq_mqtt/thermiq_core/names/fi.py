@@ -0,0 +1,141 @@
+# ThermIQ generated register names, Finnish
+id_names = {
+  'outdoor_t'                   : 'Ulkolämpötila',
+  'indoor_t'                    : 'Huonelämpötila',
+  'indoor_dec_t'                : 'Huonelämpötila, desimaalit',
+  'indoor_target_t'             : 'Haluttu huonelämpötila',
+  'indoor_target_dec_t'         : 'Haluttu huonelämpötila, desimaalit',
+  'supplyline_t'                : 'Menovesi lämpötila',
+  'returnline_t'                : 'Paluuvesi lämpötila',
+  'boiler_t'                    : 'Käyttöveden lämpötila',
+  'brine_out_t'                 : 'Keruupiirin menolämpötila',
+  'brine_in_t'                  : 'Keruupiirin tulolämpötila',
+  'cooling_t'                   : 'Jäähdytys lämpötila',
+  'supply_shunt_t'              : 'Menovesi lämpötila, shuntti',
+  'current_consumed_a'          : 'Virran kulutus',
+  'boiler_3kw_on'               : 'Lisälämpö 3 kW',
+  'boiler_6kw_on'               : 'Lisälämpö 6 kW',
+  'supplyline_target_t'         : 'Haluttu menoveden lämpötila',
+  'supplyline_shunt_target_t'   : 'Haluttu menoveden lämpötila, shuntti',
+  'brine_pump_on'               : 'Keruupumppu',
+  'compressor_on'               : 'Kompressori',
+  'supply_pump_on'              : 'Kiertopumppu',
+  'hotwaterproduction_on'       : 'Lämminvesituotanto',
+  'aux2_heating_on'             : 'Lisälämpö 2',
+  'shunt1_n'                    : 'Shuntti -',
+  'shunt1_p'                    : 'Shuntti +',
+  'aux1_heating_on'             : 'Lisälämpö 1',
+  'shunt2_n'                    : 'Shunttiryhmä -',
+  'shunt2_p'                    : 'Shunttiryhmä +',
+  'shunt_cooling_n'             : 'Shuntin jäähdytys -',
+  'shunt_cooling_p'             : 'Shuntin jäähdytys +',
+  'active_cooling_on'           : 'Aktiivinen jäähdytys',
+  'passive_cooling_on'          : 'Passiivinen jäähdytys',
+  'alarm_indication_on'         : 'Hälytys',
+  'pwm_out_period'              : 'PWM Out',
+  'highpressure_alm'            : 'Hälytys korkeapainesäädin',
+  'lowpressure_alm'             : 'Hälytys matalapainesäädin',
+  'motorbreaker_alm'            : 'Hälytys moottorisuoja',
+  'brine_flow_alm'              : 'Hälytys heikkovirtaus keruuliuos',
+  'brine_temperature_alm'       : 'Hälytys keruuliuoksen matala lämpötila',
+  'outdoor_sensor_alm'          : 'Hälytys ulkoanturi',
+  'supplyline_sensor_alm'       : 'Hälytys lämmityksen menoanturi',
+  'returnline_sensor_alm'       : 'Hälytys lämmityksen paluuanturi',
+  'boiler_sensor_alm'           : 'Hälytys lämminvesianturi',
+  'indoor_sensor_alm'           : 'Hälytys huoneanturi',
+  'phase_order_alm'             : 'Hälytys väärä vaihejärjestys',
+  'overheating_alm'             : 'Hälytys ylikuumenemissuoja',
+  'demand1'                     : 'PYYNTÖ1',
+  'demand2'                     : 'PYYNTÖ2',
+  'pressurepipe_t'              : 'Paineputki lämpötila',
+  'hgw_water_t'                 : 'HGW menolämpötila',
+  'integral1'                   : 'Integraali (A1)',
+  'integral1_a_step'            : 'Integraali, A-raja-arvo saavutettu',
+  'defrost_time_m'              : 'Sulatus',
+  'time_to_start_min_m'         : 'Pienin aika käynnistymiseen',
+  'sw_version'                  : 'Ohjelmistoversio',
+  'supply_pump_speed'           : 'Kiertopumpun nopeus',
+  'brine_pump_speed'            : 'Keeruupumpun nopeus',
+  'status3_m'                   : 'STATUS3',
+  'indoor_requested_t'          : 'Haluttu huonelämpötila',
+  'main_mode'                   : 'Käyttötila',
+  'integral1_curve_slope'       : 'Käyrä',
+  'integral1_curve_min'         : 'Käyrä min',
+  'integral1_curve_max'         : 'Käyrä max',
+  'integral1_curve_p5'          : 'Käyrä +5',
+  'integral1_curve_0'           : 'Käyrä 0',
+  'integral1_curve_n5'          : 'Käyrä -5',
+  'heating_stop_t'              : 'Lämmitys pois',
+  'reduction_t'                 : 'Lämpötilan alennus',
+  'room_factor'                 : 'Huonekerroin',
+  'integral2_curve_slope'       : 'Shuntin käyrä',
+  'integral2_curve_min'         : 'Shuntin käyrä, min',
+  'integral2_curve_max'         : 'Shuntin käyrä, max',
+  'integral2_curve_target'      : 'Shuntin käyrä, haluttu',
+  'integral2_curve_actual'      : 'Shuntin käyrä, lämpötila',
+  'outdoor_stop_t'              : 'Ulkolämpötila pysäytys (20=-20C)',
+  'pressure_pipe_limit_t'       : 'Paineputki, lämpöraja',
+  'hotwater_start_t'            : 'Lämminvesituotanto alkulämpötila',
+  'hotwater_runtime_m'          : 'Lämminvesi aika',
+  'heatpump_runtime_m'          : 'Lämmitysaika',
+  'legionella_interval_d'       : 'Legionella toiminnon väli',
+  'legionella_stop_t'           : 'Legionellatoiminnon pysäytyslämpötila',
+  'integral1_a_limit'           : 'Integraaliraja A1',
+  'integral1_hysteresis_t'      : 'Hystereesiraja lämpöpumppu A1',
+  'returnline_max_t'            : 'Paluuveden lämpötilan ylänraja',
+  'start_interval_min_m'        : 'Pienin käynnistysväli',
+  'brine_min_t'                 : 'Keruulämpötilan alaraja (-15 pois päältä)',
+  'cooling_target_t'            : 'Jäähdytys haluttu lämpötila',
+  'integral2_a_limit'           : 'Integraaliraja A2',
+  'integral2_hysteresis_t'      : 'Hystereesiraja lisälämpö',
+  'elect_boiler_steps_max'      : 'Max. lisälämmön portaat',
+  'current_consumption_max_a'   : 'Virrankulutuksen yläraja',
+  'shunt_time_s'                : 'Shunttiaika',
+  'hotwater_stop_t'             : 'Lämminvesi pysäytyslämpötila',
+  'manual_test_mode_on'         : 'Manuaalinen testaus',
+  'status7'                     : 'DT_LARMOFF',
+  'language'                    : 'Kieli',
+  'status8'                     : 'SERVFAS',
+  'factory_reset_req'           : 'Palauta tehdasasetukset',
+  'runtime_counters_reset_req'  : 'Nollaa käyntiajat',
+  'outdoor_sensor_offset_t'     : 'Ulkoanturin kalibrointi',
+  'supplyline_sensor_offset_t'  : 'Menoanturin kalibrointi',
+  'returnline_sensor_offset_t'  : 'Paluuanturin kalibrointi',
+  'boiler_sensor_offset_t'      : 'Lämminvesianturin kalibrointi',
+  'brine_in_sensor_offset_t'    : 'Keruu menoanturin kalibrointi',
+  'brine_out_sensor_offset_t'   : 'Keruu paluuanturin kalibrointi',
+  'heatingsystem_type'          : 'Lämmitysjärjestelmän tyyppi 0=VL 4=D',
+  'opt_phasemeassure_installed' : 'Vaihejärjestysmittaus',
+  'opt_2_installed'             : 'TILL2',
+  'opt_hgw_installed'           : 'HGW lisätty',
+  'opt_4_installed'             : 'TILL4',
+  'opt_5_installed'             : 'TILL5',
+  'opt_6_installed'             : 'TILL6',
+  'opt_optimum_installed'       : 'Optimum lisätty',
+  'opt_flowguard_installed'     : 'Virtausvahti lisätty',
+  'internal_logging_t'          : 'Lokiaika',
+  'brine_runout_t'              : 'Keruupumpun käyntiaika',
+  'brine_run_in_t'              : 'Keruupumpun pysähdysaika',
+  'legionella_run_on'           : 'Legionella  toiminnon käynnistys',
+  'legionella_run_length_h'     : 'Legionella toiminnon huippulämmön aika',
+  'compressor_runtime_h'        : 'Kompressorin käyntiaika',
+  'msd1_dvp'                    : 'DVP_MSD1',
+  'boiler_3kw_runtime_h'        : 'Käyttöaika 3 kW',
+  'msd1_dts'                    : 'DTS_MSD1',
+  'hotwater_runtime_h'          : 'Käyttöaika lämminvesi (kompressorilla)',
+  'msd1_dvv'                    : 'DVV_MSD1',
+  'passive_cooling_runtime_h'   : 'Käyttöaika passiviseen viilennykseen',
+  'msd1_dpas'                   : 'DPAS_MSD1',
+  'active_cooling_runtime_h'    : 'Käyttöaika aktiviseen viilennykseen',
+  'msd1_dact'                   : 'DACT_MSD1',
+  'boiler_6kw_on_runtime_h'     : 'Käyttöaika 6 kW',
+  'msd1_dts2'                   : 'DTS2_MSD1',
+  'graph_display_offset'        : 'GrafCounterOffSet',
+  'room_sensor_set_t'           : 'Huoneanturin tavoitelämpötila',
+  'heatpump_evu_block'          : 'EVU toiminnon tila',
+  'mode0'                       : 'Pois päältä',
+  'mode1'                       : 'Auto',
+  'mode2'                       : 'Vain lämpöpumppu',
+  'mode3'                       : 'Vain lisälämpö',
+  'mode4'                       : 'Vain käyttövesituotanto',
+}
@@ -0,0 +1,141 @@
+# ThermIQ generated register names, Norwegian
+id_names = {
+  'outdoor_t'                   : 'Utendørstemp.',
+  'indoor_t'                    : 'Romstemp. er',
+  'indoor_dec_t'                : 'Romstemp. er, desimal',
+  'indoor_target_t'             : 'Romstemp. bør',
+  'indoor_target_dec_t'         : 'Romstemp. bør, desimal',
+  'supplyline_t'                : 'Turtemp.',
+  'returnline_t'                : 'Returtemp.',
+  'boiler_t'                    : 'Varmtvannstemp.',
+  'brine_out_t'                 : 'Brine ut temp.',
+  'brine_in_t'                  : 'Brine inn temp.',
+  'cooling_t'                   : 'Kjølings temp.',
+  'supply_shunt_t'              : 'Tur temp., shunt',
+  'current_consumed_a'          : 'Strømforbruk',
+  'boiler_3kw_on'               : 'Tilskudd 3 kW',
+  'boiler_6kw_on'               : 'Tilskudd 6 kW',
+  'supplyline_target_t'         : 'Turtemp., bør',
+  'supplyline_shunt_target_t'   : 'Tur temp., shunt, bør',
+  'brine_pump_on'               : 'Brinepumpe',
+  'compressor_on'               : 'Kompressor',
+  'supply_pump_on'              : 'Sirkulasjonspumpe',
+  'hotwaterproduction_on'       : 'Varmtvannsprod.',
+  'aux2_heating_on'             : 'Tilskudd 2',
+  'shunt1_n'                    : 'Shunt -',
+  'shunt1_p'                    : 'Shunt +',
+  'aux1_heating_on'             : 'Tilskudd 1',
+  'shunt2_n'                    : 'Shuntgruppe -',
+  'shunt2_p'                    : 'Shuntgruppe +',
+  'shunt_cooling_n'             : 'Shunt kjøling -',
+  'shunt_cooling_p'             : 'Shunt kjøling +',
+  'active_cooling_on'           : 'Aktiv kjøling',
+  'passive_cooling_on'          : 'Passiv kjøling',
+  'alarm_indication_on'         : 'Alarm',
+  'pwm_out_period'              : 'PWM Out',
+  'highpressure_alm'            : 'Alarmhøytr.pressostat',
+  'lowpressure_alm'             : 'Alarmlavtr.pressostat',
+  'motorbreaker_alm'            : 'Alarmmotorvern',
+  'brine_flow_alm'              : 'Alarmlavflyt brine',
+  'brine_temperature_alm'       : 'Alarmlavtemp. brine',
+  'outdoor_sensor_alm'          : 'Alarmutegiver',
+  'supplyline_sensor_alm'       : 'Alarmtur.giver',
+  'returnline_sensor_alm'       : 'Alarmretur.giver',
+  'boiler_sensor_alm'           : 'Alarmvarmtvannsgiver',
+  'indoor_sensor_alm'           : 'Alarmromgiver',
+  'phase_order_alm'             : 'Alarmfeilfasefølge',
+  'overheating_alm'             : 'Alarmoveropphetningsvern',
+  'demand1'                     : 'BEHOV1',
+  'demand2'                     : 'BEHOV2',
+  'pressurepipe_t'              : 'Trykkrørstemp.',
+  'hgw_water_t'                 : 'Varmtv.Tur temp',
+  'integral1'                   : 'Integral (A1)',
+  'integral1_a_step'            : 'Integral, oppnådd A-grense',
+  'defrost_time_m'              : 'Defrost',
+  'time_to_start_min_m'         : 'Minimum tid til start',
+  'sw_version'                  : 'Programversjon',
+  'supply_pump_speed'           : 'Sirk.pump fart',
+  'brine_pump_speed'            : 'Brinepumpe fart',
+  'status3_m'                   : 'STATUS3',
+  'indoor_requested_t'          : 'Romstemp., bør',
+  'main_mode'                   : 'Driftsmodus',
+  'integral1_curve_slope'       : 'Kurve',
+  'integral1_curve_min'         : 'Kurve min',
+  'integral1_curve_max'         : 'Kurve maks',
+  'integral1_curve_p5'          : 'Kurve +5',
+  'integral1_curve_0'           : 'Kurve 0',
+  'integral1_curve_n5'          : 'Kurve -5',
+  'heating_stop_t'              : 'Varmestopp',
+  'reduction_t'                 : 'Temp. senkning',
+  'room_factor'                 : 'Romfaktor',
+  'integral2_curve_slope'       : 'Shunt Kurve',
+  'integral2_curve_min'         : 'Shunt Kurve min',
+  'integral2_curve_max'         : 'Shunt Kurve maks',
+  'integral2_curve_target'      : 'Shunt Kurve, bør',
+  'integral2_curve_actual'      : 'Shunt kurve, er',
+  'outdoor_stop_t'              : 'Ute stop temp. (20=-20C)',
+  'pressure_pipe_limit_t'       : 'Trykkrør, temp.grense',
+  'hotwater_start_t'            : 'Varmtvann starttemp.',
+  'hotwater_runtime_m'          : 'Varmtvanntid',
+  'heatpump_runtime_m'          : 'Varmetid',
+  'legionella_interval_d'       : 'Legionella intervall',
+  'legionella_stop_t'           : 'Legionella stopptemp.',
+  'integral1_a_limit'           : 'Integralgrense A1',
+  'integral1_hysteresis_t'      : 'Hysteresegrense A1',
+  'returnline_max_t'            : 'Returtemp., maksgrense',
+  'start_interval_min_m'        : 'Minimum startintervall',
+  'brine_min_t'                 : 'Brinetemp., min.grense (-15',
+  'cooling_target_t'            : 'Kjøling, bør',
+  'integral2_a_limit'           : 'Integralgrense A2',
+  'integral2_hysteresis_t'      : 'Hysteresegrense, Tilskudd',
+  'elect_boiler_steps_max'      : 'Maks steg, Tilskudd',
+  'current_consumption_max_a'   : 'Strømforbrukn., maksgrense',
+  'shunt_time_s'                : 'Shunttid',
+  'hotwater_stop_t'             : 'Varmtvann stopptemp.',
+  'manual_test_mode_on'         : 'Manuell test modus',
+  'status7'                     : 'DT_LARMOFF',
+  'language'                    : 'Språk',
+  'status8'                     : 'SERVFAS',
+  'factory_reset_req'           : 'Fabrikks instillinger',
+  'runtime_counters_reset_req'  : 'Nullstill drifttider',
+  'outdoor_sensor_offset_t'     : 'Kalibrering utegiver',
+  'supplyline_sensor_offset_t'  : 'Kalibrering tur.giver',
+  'returnline_sensor_offset_t'  : 'Kalibrering retur.giver',
+  'boiler_sensor_offset_t'      : 'Kalibrering Varmtvanngiver',
+  'brine_in_sensor_offset_t'    : 'Kalibrering brine ut',
+  'brine_out_sensor_offset_t'   : 'Kalibrering Brine inn',
+  'heatingsystem_type'          : 'Varmesystemtype 0',
+  'opt_phasemeassure_installed' : 'Tillegg fasemåling',
+  'opt_2_installed'             : 'TILL2',
+  'opt_hgw_installed'           : 'Tillegg HGW',
+  'opt_4_installed'             : 'TILL4',
+  'opt_5_installed'             : 'TILL5',
+  'opt_6_installed'             : 'TILL6',
+  'opt_optimum_installed'       : 'Tillegg Optimum',
+  'opt_flowguard_installed'     : 'Tillegg flytvakt',
+  'internal_logging_t'          : 'Loggtid',
+  'brine_runout_t'              : 'Brinetid på',
+  'brine_run_in_t'              : 'Brinetid av',
+  'legionella_run_on'           : 'Legionella topptid aktiv',
+  'legionella_run_length_h'     : 'Legionella topptid',
+  'compressor_runtime_h'        : 'Drifttid kompressor',
+  'msd1_dvp'                    : 'DVP_MSD1',
+  'boiler_3kw_runtime_h'        : 'Drifttid 3 kW',
+  'msd1_dts'                    : 'DTS_MSD1',
+  'hotwater_runtime_h'          : 'Drifttid Varmtv.prod. med kompr.',
+  'msd1_dvv'                    : 'DVV_MSD1',
+  'passive_cooling_runtime_h'   : 'Drifttid passiv kjøling',
+  'msd1_dpas'                   : 'DPAS_MSD1',
+  'active_cooling_runtime_h'    : 'Drifttid aktiv kjøling',
+  'msd1_dact'                   : 'DACT_MSD1',
+  'boiler_6kw_on_runtime_h'     : 'Drifttid 6 kW',
+  'msd1_dts2'                   : 'DTS2_MSD1',
+  'graph_display_offset'        : 'GrafCounterOffSet',
+  'room_sensor_set_t'           : 'Room sensor, Set',
+  'heatpump_evu_block'          : 'EVU Function, Set state',
+  'mode0'                       : 'Off',
+  'mode1'                       : 'Auto',
+  'mode2'                       : 'Kun varmepumpe',
+  'mode3'                       : 'Kun elektrisk oppvarming',
+  'mode4'                       : 'Kun varmtvannsbereder',
+}
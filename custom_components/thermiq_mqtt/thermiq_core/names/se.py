@@ -0,0 +1,141 @@
+# ThermIQ generated register names, Swedish
+id_names = {
+  'outdoor_t'                   : 'Utomhustemp.',
+  'indoor_t'                    : 'Rumstemp. är',
+  'indoor_dec_t'                : 'Rumstemp. är, decimal',
+  'indoor_target_t'             : 'Rumstemp. bör',
+  'indoor_target_dec_t'         : 'Rumstemp. bör, decimal',
+  'supplyline_t'                : 'Framledningstemp.',
+  'returnline_t'                : 'Returledningstemp.',
+  'boiler_t'                    : 'Varmvattentemp.',
+  'brine_out_t'                 : 'Brine ut temp.',
+  'brine_in_t'                  : 'Brine in temp.',
+  'cooling_t'                   : 'Kylning temp.',
+  'supply_shunt_t'              : 'Framledn.temp., shunt',
+  'current_consumed_a'          : 'Strömförbrukning',
+  'boiler_3kw_on'               : 'Tillsats 3 kW',
+  'boiler_6kw_on'               : 'Tillsats 6 kW',
+  'supplyline_target_t'         : 'Framledningstemp., bör',
+  'supplyline_shunt_target_t'   : 'Framledn.temp., shunt, bör',
+  'brine_pump_on'               : 'Brinepump',
+  'compressor_on'               : 'Kompressor',
+  'supply_pump_on'              : 'Cirkulationspump',
+  'hotwaterproduction_on'       : 'Varmvattenprod.',
+  'aux2_heating_on'             : 'Tillsats 2',
+  'shunt1_n'                    : 'Shunt -',
+  'shunt1_p'                    : 'Shunt +',
+  'aux1_heating_on'             : 'Tillsats 1',
+  'shunt2_n'                    : 'Shuntgrupp -',
+  'shunt2_p'                    : 'Shuntgrupp +',
+  'shunt_cooling_n'             : 'Shunt kylning -',
+  'shunt_cooling_p'             : 'Shunt kylning +',
+  'active_cooling_on'           : 'Aktiv kyla',
+  'passive_cooling_on'          : 'Passiv kyla',
+  'alarm_indication_on'         : 'Larm',
+  'pwm_out_period'              : 'PWM Out',
+  'highpressure_alm'            : 'Larm högtr.pressostat',
+  'lowpressure_alm'             : 'Larm lågtr.pressostat',
+  'motorbreaker_alm'            : 'Larm motorskydd',
+  'brine_flow_alm'              : 'Larm lågflöde brine',
+  'brine_temperature_alm'       : 'Larm lågtemp. brine',
+  'outdoor_sensor_alm'          : 'Larm utegivare',
+  'supplyline_sensor_alm'       : 'Larm framledn.givare',
+  'returnline_sensor_alm'       : 'Larm returledn.givare',
+  'boiler_sensor_alm'           : 'Larm varmvattengivare',
+  'indoor_sensor_alm'           : 'Larm rumsgivare',
+  'phase_order_alm'             : 'Larm fel fasföljd',
+  'overheating_alm'             : 'Larm överhettningsskydd',
+  'demand1'                     : 'BEHOV1',
+  'demand2'                     : 'BEHOV2',
+  'pressurepipe_t'              : 'Tryckrörtemp.',
+  'hgw_water_t'                 : 'Varmv.framledn.temp',
+  'integral1'                   : 'Integral (A1)',
+  'integral1_a_step'            : 'Integral, uppnådd A-gräns',
+  'defrost_time_m'              : 'Avfrostning',
+  'time_to_start_min_m'         : 'Minimum tid till start',
+  'sw_version'                  : 'Programversion',
+  'supply_pump_speed'           : 'Cirk.pump fart',
+  'brine_pump_speed'            : 'Brinepump fart',
+  'status3_m'                   : 'STATUS3',
+  'indoor_requested_t'          : 'Rumstemp., bör',
+  'main_mode'                   : 'Driftläge',
+  'integral1_curve_slope'       : 'Kurva',
+  'integral1_curve_min'         : 'Kurva min',
+  'integral1_curve_max'         : 'Kurva max',
+  'integral1_curve_p5'          : 'Kurva +5',
+  'integral1_curve_0'           : 'Kurva 0',
+  'integral1_curve_n5'          : 'Kurva -5',
+  'heating_stop_t'              : 'Värmestopp',
+  'reduction_t'                 : 'Temp. sänkning',
+  'room_factor'                 : 'Rumfaktor',
+  'integral2_curve_slope'       : 'Shunt kurva',
+  'integral2_curve_min'         : 'Shunt kurva min',
+  'integral2_curve_max'         : 'Shunt kurva max',
+  'integral2_curve_target'      : 'Shunt kurva, bör',
+  'integral2_curve_actual'      : 'Shunt kurva, är',
+  'outdoor_stop_t'              : 'Utestopp temp, (20=-20C)',
+  'pressure_pipe_limit_t'       : 'Tryckrör, temp.gräns',
+  'hotwater_start_t'            : 'Varmvatten starttemp.',
+  'hotwater_runtime_m'          : 'Varmvattentid',
+  'heatpump_runtime_m'          : 'Värmetid',
+  'legionella_interval_d'       : 'Legionella intervall',
+  'legionella_stop_t'           : 'Legionella stopptemp.',
+  'integral1_a_limit'           : 'Integralgräns A1',
+  'integral1_hysteresis_t'      : 'Hysteresgräns A1',
+  'returnline_max_t'            : 'Returledningstemp., maxgräns',
+  'start_interval_min_m'        : 'Minimum startintervall',
+  'brine_min_t'                 : 'Brinetemp., min.gräns (-15=AV)',
+  'cooling_target_t'            : 'Kyla, bör',
+  'integral2_a_limit'           : 'Integralgräns A2',
+  'integral2_hysteresis_t'      : 'Hysteresgräns A2',
+  'elect_boiler_steps_max'      : 'Max steg, tillsats',
+  'current_consumption_max_a'   : 'Strömförbrukn., maxgräns',
+  'shunt_time_s'                : 'Shunttid',
+  'hotwater_stop_t'             : 'Varmvatten stopptemp.',
+  'manual_test_mode_on'         : 'Manuell test läge',
+  'status7'                     : 'DT_LARMOFF',
+  'language'                    : 'Språk',
+  'status8'                     : 'SERVFAS',
+  'factory_reset_req'           : 'Fabriksinställningar',
+  'runtime_counters_reset_req'  : 'Nollställ drifttider',
+  'outdoor_sensor_offset_t'     : 'Kalibrering utegivare',
+  'supplyline_sensor_offset_t'  : 'Kalibrering framledn.givare',
+  'returnline_sensor_offset_t'  : 'Kalibrering returledn.givare',
+  'boiler_sensor_offset_t'      : 'Kalibrering varmvattengivare',
+  'brine_in_sensor_offset_t'    : 'Kalibrering brine ut',
+  'brine_out_sensor_offset_t'   : 'Kalibrering brine in',
+  'heatingsystem_type'          : 'Värmesystemtyp 0=VL 4=D',
+  'opt_phasemeassure_installed' : 'Tillägg fasmätning',
+  'opt_2_installed'             : 'TILL2',
+  'opt_hgw_installed'           : 'Tillägg HGW',
+  'opt_4_installed'             : 'TILL4',
+  'opt_5_installed'             : 'TILL5',
+  'opt_6_installed'             : 'TILL6',
+  'opt_optimum_installed'       : 'Tillägg Optimum',
+  'opt_flowguard_installed'     : 'Tillägg flödesvakt',
+  'internal_logging_t'          : 'Loggtid',
+  'brine_runout_t'              : 'Brinetid på',
+  'brine_run_in_t'              : 'Brinetid av',
+  'legionella_run_on'           : 'Tillåt legionella körning',
+  'legionella_run_length_h'     : 'Legionella topptid',
+  'compressor_runtime_h'        : 'Drifttid kompressor',
+  'msd1_dvp'                    : 'DVP_MSD1',
+  'boiler_3kw_runtime_h'        : 'Drifttid 3 kW',
+  'msd1_dts'                    : 'DTS_MSD1',
+  'hotwater_runtime_h'          : 'Drifttid varmv.prod. med kompr.',
+  'msd1_dvv'                    : 'DVV_MSD1',
+  'passive_cooling_runtime_h'   : 'Drifttid passiv kyla',
+  'msd1_dpas'                   : 'DPAS_MSD1',
+  'active_cooling_runtime_h'    : 'Drifttid aktiv kyla',
+  'msd1_dact'                   : 'DACT_MSD1',
+  'boiler_6kw_on_runtime_h'     : 'Drifttid 6 kW',
+  'msd1_dts2'                   : 'DTS2_MSD1',
+  'graph_display_offset'        : 'GrafCounterOffSet',
+  'room_sensor_set_t'           : 'Rums sensor, Sätt nuvarande',
+  'heatpump_evu_block'          : 'EVU funktion, Läge',
+  'mode0'                       : 'Av',
+  'mode1'                       : 'Auto',
+  'mode2'                       : 'Bara värmepump',
+  'mode3'                       : 'Elvärme',
+  'mode4'                       : 'Bara varmvatten',
+}
@@ -0,0 +1,38 @@
+"""cProfile of a limited number of frames."""
+
+import cProfile
+
+
+class FrameProfiler:
+    """Profile of the code run inside a with block, for the next frames.
+
+    The profiler is only enabled inside the with blocks, so the rest of the
+    event loop is not measured. The stats are written in pstats format,
+    readable with python -m pstats or snakeviz.
+    """
+
+    def __init__(self, frames):
+        self.frames = frames
+        self.count = 0
+        self._profile = cProfile.Profile()
+        self._depth = 0
+
+    def __enter__(self):
+        if self._depth == 0:
+            self._profile.enable()
+        self._depth += 1
+        return self
+
+    def __exit__(self, *exc_info):
+        self._depth -= 1
+        if self._depth == 0:
+            self._profile.disable()
+
+    def frame_done(self):
+        """Count a profiled frame, return True when all frames are profiled."""
+        self.count += 1
+        return self.count >= self.frames
+
+    def write(self, path):
+        """Write the stats to path."""
+        self._profile.dump_stats(path)
@@ -0,0 +1,84 @@
+"""Register profiles for heatpumps without some of the optional hardware.
+
+A profile lists the registers a heatpump does not have, with the same
+items as the entity selection (reg_id names with wildcards, panel:N and
+type:TYPE). Those registers are not decoded and get no entity.
+
+User profiles are read from thermiq_profiles.json in the Home Assistant
+config directory, e.g.
+
+    {"villa": {"exclude": ["cooling_t", "*_cooling_*"], "app_info": "villa"}}
+
+A profile with app_info is chosen by the auto profile when the app_info of
+the first data frame contains it.
+"""
+
+import json
+import logging
+import os
+
+from .selection import parse_selection
+
+_LOGGER = logging.getLogger(__name__)
+
+PROFILE_AUTO = "auto"
+PROFILE_FULL = "full"
+PROFILES_FILE = "thermiq_profiles.json"
+
+_NO_COOLING = [
+    "cooling_t",
+    "cooling_target_t",
+    "shunt_cooling_*",
+    "*_cooling_on",
+    "*_cooling_runtime_h",
+]
+_NO_HGW = ["hgw_water_t"]
+_NO_6KW = ["boiler_6kw_*"]
+
+BUILTIN_PROFILES = {
+    PROFILE_FULL: {"exclude": []},
+    "no_cooling": {"exclude": _NO_COOLING},
+    "no_hgw": {"exclude": _NO_HGW},
+    "no_6kw": {"exclude": _NO_6KW},
+    "basic": {"exclude": _NO_COOLING + _NO_HGW + _NO_6KW},
+}
+AVAILABLE_PROFILES = [PROFILE_AUTO, *BUILTIN_PROFILES]
+
+# r62 option bits the auto profile looks at
+OPT_REGISTER = "r62"
+OPT_REGISTER_DEC = "d098"
+OPT_HGW_INSTALLED = 0x0004
+
+
+def load_user_profiles(path):
+    """Read the user profiles in path, an empty dict if there are none."""
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, encoding="utf-8") as file:
+            profiles = json.load(file)
+        for name, profile in profiles.items():
+            excluded_registers(profile)
+    except (OSError, ValueError, TypeError, AttributeError) as err:
+        _LOGGER.error("Invalid register profiles in %s: %s", path, err)
+        return {}
+    return profiles
+
+
+def excluded_registers(profile):
+    """Return the reg_id names excluded by profile."""
+    return parse_selection(",".join(profile.get("exclude", []))) or frozenset()
+
+
+def auto_profile(profiles, app_info, options):
+    """Choose a profile for a heatpump from its app_info and r62 option bits.
+
+    Returns the profile name and its excluded reg_id names.
+    """
+    if isinstance(app_info, str):
+        for name, profile in profiles.items():
+            if profile.get("app_info") and profile["app_info"] in app_info:
+                return name, excluded_registers(profile)
+    if isinstance(options, int) and not options & OPT_HGW_INSTALLED:
+        return "no_hgw", excluded_registers(BUILTIN_PROFILES["no_hgw"])
+    return PROFILE_FULL, frozenset()
@@ -0,0 +1,136 @@
+"""Compiled register specifications and their lookup indexes.
+
+The positional rows of thermiq_regs.reg_id are compiled once at import into
+RegisterSpec objects. The indexes below are shared by the heatpump and the
+platforms, so no one has to scan reg_id again.
+"""
+
+from types import MappingProxyType
+
+from .state import REGISTER_SLOTS
+from .thermiq_regs import (
+    FIELD_MAXVALUE,
+    FIELD_MINVALUE,
+    FIELD_PANEL,
+    FIELD_PANEL_ORDER,
+    FIELD_REGNUM,
+    FIELD_REGTYPE,
+    FIELD_UNIT,
+    reg_id,
+)
+
+TYPE_BINARY_SENSOR = "binary_sensor"
+
+# Same values as the PLATFORM_* constants of the integration
+PLATFORM_SENSOR = "sensor"
+PLATFORM_BINARY_SENSOR = "binary_sensor"
+PLATFORM_INPUT_NUMBER = "input_number"
+PLATFORM_INPUT_SELECT = "input_select"
+
+# Register types shown by each platform, a setting is both a sensor and an input
+PLATFORM_TYPES = {
+    PLATFORM_SENSOR: (
+        "temperature",
+        "temperature_input",
+        "time_input",
+        "sensor",
+        "sensor_input",
+        "generated_input",
+        "time",
+        "select_input",
+        "sensor_language",
+        "sensor_boolean",
+        "generated_sensor",
+    ),
+    PLATFORM_BINARY_SENSOR: (TYPE_BINARY_SENSOR,),
+    PLATFORM_INPUT_NUMBER: (
+        "temperature_input",
+        "time_input",
+        "sensor_input",
+        "generated_input",
+    ),
+    PLATFORM_INPUT_SELECT: ("select_input",),
+}
+
+
+class RegisterSpec:
+    """Read only specification of one reg_id entry.
+
+    reg_id keeps the bitmask of a binary sensor and the minimum value of an
+    input in the same column, here they are separate attributes.
+    """
+
+    __slots__ = (
+        "name",
+        "register",
+        "type",
+        "unit",
+        "bitmask",
+        "min_value",
+        "max_value",
+        "panel",
+        "panel_order",
+        "slot",
+    )
+
+    def __init__(self, name, row):
+        init = object.__setattr__
+        init(self, "name", name)
+        init(self, "register", row[FIELD_REGNUM])
+        init(self, "type", row[FIELD_REGTYPE])
+        init(self, "unit", row[FIELD_UNIT])
+        if row[FIELD_REGTYPE] == TYPE_BINARY_SENSOR:
+            init(self, "bitmask", row[FIELD_MINVALUE])
+            init(self, "min_value", None)
+            init(self, "max_value", None)
+        else:
+            init(self, "bitmask", None)
+            init(self, "min_value", row[FIELD_MINVALUE])
+            init(self, "max_value", row[FIELD_MAXVALUE])
+        init(self, "panel", row[FIELD_PANEL])
+        init(self, "panel_order", row[FIELD_PANEL_ORDER])
+        init(self, "slot", REGISTER_SLOTS.get(row[FIELD_REGNUM]))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"RegisterSpec {self.name} is read only")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"RegisterSpec {self.name} is read only")
+
+    def __repr__(self):
+        return f"RegisterSpec({self.name!r}, {self.register!r}, {self.type!r})"
+
+
+def _index(specs, key):
+    """Group specs by key into a read only mapping of tuples."""
+    index = {}
+    for spec in specs:
+        index.setdefault(key(spec), []).append(spec)
+    return MappingProxyType({k: tuple(v) for k, v in index.items()})
+
+
+REGISTERS = MappingProxyType(
+    {name: RegisterSpec(name, row) for name, row in reg_id.items()}
+)
+
+# Register key -> specs using it, several for a bitfield register
+BY_REGISTER = _index(REGISTERS.values(), lambda spec: spec.register)
+# Register key -> reg_id name, the last spec of a bitfield register
+REGISTER_NAMES = MappingProxyType(
+    {register: specs[-1].name for register, specs in BY_REGISTER.items()}
+)
+BY_TYPE = _index(REGISTERS.values(), lambda spec: spec.type)
+BY_PANEL = MappingProxyType(
+    {
+        panel: tuple(sorted(specs, key=lambda spec: spec.panel_order))
+        for panel, specs in _index(REGISTERS.values(), lambda spec: spec.panel).items()
+    }
+)
+# Bitfield register key -> the binary sensor bits in it
+BITFIELDS = _index(BY_TYPE.get(TYPE_BINARY_SENSOR, ()), lambda spec: spec.register)
+BY_PLATFORM = MappingProxyType(
+    {
+        platform: tuple(spec for spec in REGISTERS.values() if spec.type in types)
+        for platform, types in PLATFORM_TYPES.items()
+    }
+)
@@ -0,0 +1,38 @@
+"""Selection of the registers that get an entity."""
+
+from fnmatch import fnmatchcase
+
+from .registers import BY_PANEL, BY_TYPE, REGISTERS
+
+
+def parse_selection(text):
+    """Return the reg_id names selected by text, None if all are selected.
+
+    text is a comma separated list of reg_id names (wildcards allowed, like
+    msd1_*), panel:N and type:TYPE. An item starting with - is removed from
+    the selection, with only removals everything else stays selected.
+    Raises ValueError for an item that matches no register.
+    """
+    selected = set()
+    removed = set()
+    for item in text.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        names = removed if item.startswith("-") else selected
+        item = item.lstrip("-").strip()
+        kind, _, value = item.partition(":")
+        if kind == "panel" and value:
+            matches = {spec.name for spec in BY_PANEL.get(int(value), ())}
+        elif kind == "type" and value:
+            matches = {spec.name for spec in BY_TYPE.get(value, ())}
+        else:
+            matches = {name for name in REGISTERS if fnmatchcase(name, item)}
+        if not matches:
+            raise ValueError(f"No register matches {item}")
+        names |= matches
+    if not selected and not removed:
+        return None
+    if not selected:
+        selected = set(REGISTERS)
+    return frozenset(selected - removed)
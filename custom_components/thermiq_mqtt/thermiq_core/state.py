@@ -0,0 +1,113 @@
+"""Compact register state store for one heatpump."""
+
+from array import array
+
+# Fixed slot index for every register key r00-rff
+REGISTER_COUNT = 256
+REGISTER_SLOTS = {"r" + format(slot, "02x"): slot for slot in range(REGISTER_COUNT)}
+REGISTER_KEYS = list(REGISTER_SLOTS)
+
+# Slots of registers not received yet hold NaN
+_UNSET = float("nan")
+
+
+def register_value(value):
+    """Return a stored register value as received, None if it is not set."""
+    if value.is_integer():
+        return int(value)
+    if value != value:
+        return None
+    return value
+
+
+class HeatPumpState:
+    """Register values of one heatpump with a dict compatible interface.
+
+    Registers r00-rff are stored in a typed array at a fixed slot, so a
+    snapshot, copy or comparison is a bulk array operation. Generated and
+    string valued fields (indr_t, evu, time_str, mqtt_counter, app_info, ...)
+    are kept in a small side table.
+    """
+
+    __slots__ = ("registers", "fields")
+
+    def __init__(self, registers=None, fields=None):
+        if registers is None:
+            registers = array("d", [_UNSET]) * REGISTER_COUNT
+        self.registers = registers
+        self.fields = {} if fields is None else fields
+
+    def __getitem__(self, key):
+        slot = REGISTER_SLOTS.get(key)
+        if slot is None:
+            return self.fields[key]
+        value = self.registers[slot]
+        if value != value:
+            raise KeyError(key)
+        return register_value(value)
+
+    def __setitem__(self, key, value):
+        slot = REGISTER_SLOTS.get(key)
+        if slot is None:
+            self.fields[key] = value
+        else:
+            self.registers[slot] = value
+
+    def __contains__(self, key):
+        slot = REGISTER_SLOTS.get(key)
+        if slot is None:
+            return key in self.fields
+        value = self.registers[slot]
+        return value == value
+
+    def __iter__(self):
+        registers = self.registers
+        for slot, key in enumerate(REGISTER_KEYS):
+            value = registers[slot]
+            if value == value:
+                yield key
+        yield from self.fields
+
+    def __len__(self):
+        return sum(1 for value in self.registers if value == value) + len(self.fields)
+
+    def get(self, key, default=None):
+        """Return the value of key, default if it has not been set."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        return list(self)
+
+    def values(self):
+        return [self[key] for key in self]
+
+    def items(self):
+        return [(key, self[key]) for key in self]
+
+    def copy(self):
+        """Return an independent copy of the state."""
+        return HeatPumpState(array("d", self.registers), dict(self.fields))
+
+    def diff(self, other):
+        """Return the keys whose value differs from other."""
+        keys = []
+        if self.registers.tobytes() != other.registers.tobytes():
+            for slot, (mine, theirs) in enumerate(zip(self.registers, other.registers)):
+                # Compare NaN (unset) slots as equal
+                if mine != theirs and (mine == mine or theirs == theirs):
+                    keys.append(REGISTER_KEYS[slot])
+        fields = other.fields
+        for key, value in self.fields.items():
+            if key not in fields or fields[key] != value:
+                keys.append(key)
+        for key in fields:
+            if key not in self.fields:
+                keys.append(key)
+        return keys
+
+    def as_dict(self):
+        """Return the state as a plain dict."""
+        return dict(self.items())
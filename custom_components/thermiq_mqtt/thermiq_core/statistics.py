@@ -0,0 +1,84 @@
+"""Time weighted mean, min and max of registers over fixed windows."""
+
+from .decoder import UNSET_VALUE
+from .registers import BY_PLATFORM, PLATFORM_SENSOR
+
+# Register types of the measured values, aggregated into statistics
+STATISTICS_TYPES = ("temperature", "sensor")
+
+STATISTICS_REGISTERS = tuple(
+    spec for spec in BY_PLATFORM[PLATFORM_SENSOR] if spec.type in STATISTICS_TYPES
+)
+
+# Fields of a window
+_VALUE, _SINCE, _AREA, _HELD, _MIN, _MAX = range(6)
+
+
+def _number(value):
+    """Return value if it can be averaged, else None."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    return None
+
+
+class WindowStatistics:
+    """Mean, min and max of registers over the current window.
+
+    The mean is weighted by the time each value was held, like the
+    statistics the recorder compiles from states. Only the registers changed
+    by a frame cost work, a value held for the whole window is accounted for
+    when the window is closed.
+    """
+
+    def __init__(self, registers, state, now):
+        self._windows = {}
+        for register in registers:
+            value = _number(state.get(register))
+            # Registers not received yet hold UNSET_VALUE, while update() only
+            # gets registers a frame changed, where -1 is a real reading
+            if value == UNSET_VALUE:
+                value = None
+            self._windows[register] = [value, now, 0.0, 0.0, value, value]
+
+    def __contains__(self, register):
+        return register in self._windows
+
+    def update(self, changed, state, now):
+        """Account for the registers in changed getting their value in state."""
+        windows = self._windows
+        for register in changed:
+            window = windows.get(register)
+            if window is None:
+                continue
+            held = window[_VALUE]
+            if held is not None:
+                window[_AREA] += held * (now - window[_SINCE])
+                window[_HELD] += now - window[_SINCE]
+            window[_SINCE] = now
+            value = window[_VALUE] = _number(state.get(register))
+            if value is None:
+                continue
+            if window[_MIN] is None or value < window[_MIN]:
+                window[_MIN] = value
+            if window[_MAX] is None or value > window[_MAX]:
+                window[_MAX] = value
+
+    def close(self, now):
+        """Return {register: (mean, min, max)} and start a new window at now.
+
+        Registers without a value during the window are left out.
+        """
+        result = {}
+        for register, window in self._windows.items():
+            value = window[_VALUE]
+            if value is not None:
+                window[_AREA] += value * (now - window[_SINCE])
+                window[_HELD] += now - window[_SINCE]
+            if window[_HELD] > 0:
+                result[register] = (
+                    window[_AREA] / window[_HELD],
+                    window[_MIN],
+                    window[_MAX],
+                )
+            window[:] = [value, now, 0.0, 0.0, value, value]
+        return result
@@ -0,0 +1,158 @@
+# ThermIQ generated register definitions
+FIELD_REGNUM = 0
+FIELD_REGTYPE = 1
+FIELD_UNIT = 2
+FIELD_MINVALUE = 3
+FIELD_MAXVALUE = 4
+FIELD_BITMASK = 3
+FIELD_PANEL = 5
+FIELD_PANEL_ORDER = 6
+
+
+# Register as sensors
+reg_id = {
+#  reg_id          : ['reg#', 'type', 'unit', 'bitmask or min', 'max', 'panel', panel_order' ],
+  'outdoor_t'                    : ['r00', 'temperature',            'ºC',               '',      '',  2,  1  ],
+  'indoor_t'                     : ['r01', 'temperature',            'ºC',               '',      '',  2,  2  ],
+  'indoor_dec_t'                 : ['r02', 'temperature',            '0.1C',              '',      '',  0,  0  ],
+  'indoor_target_t'              : ['r03', 'temperature',            'ºC',               '',      '',  0,  0  ],
+  'indoor_target_dec_t'          : ['r04', 'temperature',            '0.1C',              '',      '',  0,  0  ],
+  'supplyline_t'                 : ['r05', 'temperature',            'ºC',               '',      '',  2,  3  ],
+  'returnline_t'                 : ['r06', 'temperature',            'ºC',               '',      '',  2,  4  ],
+  'boiler_t'                     : ['r07', 'temperature',            'ºC',               '',      '',  2,  5  ],
+  'brine_out_t'                  : ['r08', 'temperature',            'ºC',               '',      '',  2,  7  ],
+  'brine_in_t'                   : ['r09', 'temperature',            'ºC',               '',      '',  2,  8  ],
+  'cooling_t'                    : ['r0a', 'temperature',            'ºC',               '',      '',  2, 10  ],
+  'supply_shunt_t'               : ['r0b', 'temperature',            'ºC',               '',      '',  2,  9  ],
+  'current_consumed_a'           : ['r0c', 'sensor',                 'A',                 '',      '',  0,  0  ],
+  'boiler_3kw_on'                : ['r0d', 'binary_sensor',          '',             0x0001,     -1,  0,  0   ],
+  'boiler_6kw_on'                : ['r0d', 'binary_sensor',          '',             0x0002,     -1,  0,  0   ],
+  'supplyline_target_t'          : ['r0e', 'temperature',            'ºC',               '',      '',  0,  0  ],
+  'supplyline_shunt_target_t'    : ['r0f', 'temperature',            'ºC',               '',      '',  0,  0  ],
+  'brine_pump_on'                : ['r10', 'binary_sensor',          '',             0x0001,     -1,  0,  0   ],
+  'compressor_on'                : ['r10', 'binary_sensor',          '',             0x0002,     -1,  0,  0   ],
+  'supply_pump_on'               : ['r10', 'binary_sensor',          '',             0x0004,     -1,  0,  0   ],
+  'hotwaterproduction_on'        : ['r10', 'binary_sensor',          '',             0x0008,     -1,  0,  0   ],
+  'aux2_heating_on'              : ['r10', 'binary_sensor',          '',             0x0010,     -1,  0,  0   ],
+  'shunt1_n'                     : ['r10', 'binary_sensor',          '',             0x0020,     -1,  0,  0   ],
+  'shunt1_p'                     : ['r10', 'binary_sensor',          '',             0x0040,     -1,  0,  0   ],
+  'aux1_heating_on'              : ['r10', 'binary_sensor',          '',             0x0080,     -1,  0,  0   ],
+  'shunt2_n'                     : ['r11', 'binary_sensor',          '',             0x0001,     -1,  0,  0   ],
+  'shunt2_p'                     : ['r11', 'binary_sensor',          '',             0x0002,     -1,  0,  0   ],
+  'shunt_cooling_n'              : ['r11', 'binary_sensor',          '',             0x0004,     -1,  0,  0   ],
+  'shunt_cooling_p'              : ['r11', 'binary_sensor',          '',             0x0008,     -1,  0,  0   ],
+  'active_cooling_on'            : ['r11', 'binary_sensor',          '',             0x0010,     -1,  0,  0   ],
+  'passive_cooling_on'           : ['r11', 'binary_sensor',          '',             0x0020,     -1,  0,  0   ],
+  'alarm_indication_on'          : ['r11', 'binary_sensor',          '',             0x0040,     -1,  0,  0   ],
+  'pwm_out_period'               : ['r12', 'sensor',                 '%',                 '',      '',  0,  0  ],
+  'highpressure_alm'             : ['r13', 'binary_sensor',          '',             0x0001,     -1,  0,  0   ],
+  'lowpressure_alm'              : ['r13', 'binary_sensor',          '',             0x0002,     -1,  0,  0   ],
+  'motorbreaker_alm'             : ['r13', 'binary_sensor',          '',             0x0004,     -1,  0,  0   ],
+  'brine_flow_alm'               : ['r13', 'binary_sensor',          '',             0x0008,     -1,  0,  0   ],
+  'brine_temperature_alm'        : ['r13', 'binary_sensor',          '',             0x0010,     -1,  0,  0   ],
+  'outdoor_sensor_alm'           : ['r14', 'binary_sensor',          '',             0x0001,     -1,  0,  0   ],
+  'supplyline_sensor_alm'        : ['r14', 'binary_sensor',          '',             0x0002,     -1,  0,  0   ],
+  'returnline_sensor_alm'        : ['r14', 'binary_sensor',          '',             0x0004,     -1,  0,  0   ],
+  'boiler_sensor_alm'            : ['r14', 'binary_sensor',          '',             0x0008,     -1,  0,  0   ],
+  'indoor_sensor_alm'            : ['r14', 'binary_sensor',          '',             0x0010,     -1,  0,  0   ],
+  'phase_order_alm'              : ['r14', 'binary_sensor',          '',             0x0020,     -1,  0,  0   ],
+  'overheating_alm'              : ['r14', 'binary_sensor',          '',             0x0040,     -1,  0,  0   ],
+  'demand1'                      : ['r15', 'sensor',                 '',                  '',      '',  0,  0  ],
+  'demand2'                      : ['r16', 'sensor',                 '',                  '',      '',  0,  0  ],
+  'pressurepipe_t'               : ['r17', 'temperature',            'ºC',               '',      '',  0,  0  ],
+  'hgw_water_t'                  : ['r18', 'temperature',            'ºC',               '',      '',  0,  0  ],
+  'integral1'                    : ['r19', 'sensor',                 'Cmin',              '',      '',  2,  6  ],
+  'integral1_a_step'             : ['r1a', 'sensor',                 '',                  '',      '',  0,  0  ],
+  'defrost_time_m'               : ['r1b', 'time',                   '*10s',              '',      '',  0,  0  ],
+  'time_to_start_min_m'          : ['r1c', 'time',                   'min',               '',      '',  0,  0  ],
+  'sw_version'                   : ['r1d', 'sensor',                 '',                  '',      '',  0,  0  ],
+  'supply_pump_speed'            : ['r1e', 'sensor',                 '%',                 '',      '',  2, 12  ],
+  'brine_pump_speed'             : ['r1f', 'sensor',                 '%',                 '',      '',  2, 13  ],
+  'status3_m'                    : ['r20', 'sensor',                 '',                  '',      '',  0,  0  ],
+  'indoor_requested_t'           : ['r32', 'temperature_input',      'ºC',               0,     50,  4,  0  ],
+  'main_mode'                    : ['r33', 'select_input',           '',                  0,     16,  1,  0  ],
+  'integral1_curve_slope'        : ['r34', 'temperature_input',      'ºC',               0,    200,  4,  1  ],
+  'integral1_curve_min'          : ['r35', 'temperature_input',      'ºC',               0,    200,  4,  2  ],
+  'integral1_curve_max'          : ['r36', 'temperature_input',      'ºC',               0,    200,  4,  3  ],
+  'integral1_curve_p5'           : ['r37', 'temperature_input',      'ºC',              -5,      5,  4,  4  ],
+  'integral1_curve_0'            : ['r38', 'temperature_input',      'ºC',              -5,      5,  4,  5  ],
+  'integral1_curve_n5'           : ['r39', 'temperature_input',      'ºC',              -5,      5,  4,  8  ],
+  'heating_stop_t'               : ['r3a', 'temperature_input',      'ºC',               0,    200,  4,  8  ],
+  'reduction_t'                  : ['r3b', 'temperature_input',      'ºC',               0,    100,  4, 10  ],
+  'room_factor'                  : ['r3c', 'sensor_input',           'factor',            0,      4,  4, 11  ],
+  'integral2_curve_slope'        : ['r3d', 'temperature_input',      'ºC',               0,    200,  6,  0  ],
+  'integral2_curve_min'          : ['r3e', 'temperature_input',      'ºC',               0,    200,  6,  1  ],
+  'integral2_curve_max'          : ['r3f', 'temperature_input',      'ºC',               0,    200,  6,  2  ],
+  'integral2_curve_target'       : ['r40', 'temperature_input',      'ºC',               0,    200,  6,  3  ],
+  'integral2_curve_actual'       : ['r41', 'temperature_input',      'ºC',               0,    200,  6,  4  ],
+  'outdoor_stop_t'               : ['r42', 'temperature_input',      'ºC',               0,    100,  7,  6  ],
+  'pressure_pipe_limit_t'        : ['r43', 'temperature_input',      'ºC',               0,    200,  7,  5  ],
+  'hotwater_start_t'             : ['r44', 'temperature_input',      'ºC',               0,    100,  5,  0  ],
+  'hotwater_runtime_m'           : ['r45', 'time_input',             'min',               0,  32767,  5,  1  ],
+  'heatpump_runtime_m'           : ['r46', 'time_input',             'min',               0,  32767,  5,  2  ],
+  'legionella_interval_d'        : ['r47', 'time_input',             'days',              0,  32767,  5,  3  ],
+  'legionella_stop_t'            : ['r48', 'temperature_input',      'ºC',               0,    100,  5,  4  ],
+  'integral1_a_limit'            : ['r49', 'sensor_input',           'Cmin',         -32768,  32767,  7,  0  ],
+  'integral1_hysteresis_t'       : ['r4a', 'temperature_input',      'ºC',               0,    100,  7,  1  ],
+  'returnline_max_t'             : ['r4b', 'temperature_input',      'ºC',               0,    100,  7,  2  ],
+  'start_interval_min_m'         : ['r4c', 'time_input',             'min',               0,  32767,  7,  3  ],
+  'brine_min_t'                  : ['r4d', 'temperature_input',      'ºC',             -25,    100,  7,  4  ],
+  'cooling_target_t'             : ['r4e', 'temperature_input',      'ºC',               0,     50,  7,  7  ],
+  'integral2_a_limit'            : ['r4f', 'sensor_input',           '10 Cmin',           0,    200,  9,  0  ],
+  'integral2_hysteresis_t'       : ['r50', 'temperature_input',      'ºC',               0,    100,  9,  1  ],
+  'elect_boiler_steps_max'       : ['r51', 'sensor_input',           'steps',             0,      3,  9,  2  ],
+  'current_consumption_max_a'    : ['r52', 'sensor_input',           'A',                 0,    100,  9,  3  ],
+  'shunt_time_s'                 : ['r53', 'time_input',             's',                 0,  32767,  9,  4  ],
+  'hotwater_stop_t'              : ['r54', 'temperature_input',      'ºC',               0,    100,  9,  5  ],
+  'manual_test_mode_on'          : ['r55', 'sensor',                 '',                  '',      '', 10,  1  ],
+  'status7'                      : ['r56', 'sensor',                 '',                  '',      '',  0,  0  ],
+  'language'                     : ['r57', 'sensor_input',           '',                   0,     255, 10,  0  ],
+  'status8'                      : ['r58', 'sensor',                 '',                  '',      '',  0,  0  ],
+  'factory_reset_req'            : ['r59', 'sensor',                 'setting',           '',      '', 10,  2  ],
+  'runtime_counters_reset_req'   : ['r5a', 'sensor',                 '',                  '',      '', 10,  3  ],
+  'outdoor_sensor_offset_t'      : ['r5b', 'temperature_input',      'ºC',              -5,      5, 10,  4  ],
+  'supplyline_sensor_offset_t'   : ['r5c', 'temperature_input',      'ºC',              -5,      5, 10,  5  ],
+  'returnline_sensor_offset_t'   : ['r5d', 'temperature_input',      'ºC',              -5,      5, 10,  6  ],
+  'boiler_sensor_offset_t'       : ['r5e', 'temperature_input',      'ºC',              -5,      5, 10,  7  ],
+  'brine_in_sensor_offset_t'     : ['r5f', 'temperature_input',      'ºC',              -5,      5, 10,  8  ],
+  'brine_out_sensor_offset_t'    : ['r60', 'temperature_input',      'ºC',              -5,      5, 10,  9  ],
+  'heatingsystem_type'           : ['r61', 'sensor_input',           'type',         -32768,  32767, 10, 10  ],
+  'opt_phasemeassure_installed'  : ['r62', 'binary_sensor',          '',             0x0001,     -1,  0,  0   ],
+  'opt_2_installed'              : ['r62', 'binary_sensor',          '',             0x0002,     -1,  0,  0   ],
+  'opt_hgw_installed'            : ['r62', 'binary_sensor',          '',             0x0004,     -1,  0,  0   ],
+  'opt_4_installed'              : ['r62', 'binary_sensor',          '',             0x0008,     -1,  0,  0   ],
+  'opt_5_installed'              : ['r62', 'binary_sensor',          '',             0x0010,     -1,  0,  0   ],
+  'opt_6_installed'              : ['r62', 'binary_sensor',          '',             0x0020,     -1,  0,  0   ],
+  'opt_optimum_installed'        : ['r62', 'binary_sensor',          '',             0x0040,     -1,  0,  0   ],
+  'opt_flowguard_installed'      : ['r62', 'binary_sensor',          '',             0x0080,     -1,  0,  0   ],
+  'internal_logging_t'           : ['r63', 'time_input',             'min',               0,  32767, 10, 11  ],
+  'brine_runout_t'               : ['r64', 'time_input',             '*10s',              0,  32767, 10, 12  ],
+  'brine_run_in_t'               : ['r65', 'time_input',             '*10s',              0,  32767, 10, 13  ],
+  'legionella_run_on'            : ['r66', 'sensor_input',           '',                  0,      1, 10, 14  ],
+  'legionella_run_length_h'      : ['r67', 'time_input',             'h',                 0,  32767, 10, 15  ],
+  'compressor_runtime_h'         : ['r68', 'time',                   'h',                 '',      '',  3,  0  ],
+  'msd1_dvp'                     : ['r69', 'sensor',                 '',                  '',      '',  0,  0  ],
+  'boiler_3kw_runtime_h'         : ['r6a', 'time',                   'h',                 '',      '',  3,  1  ],
+  'msd1_dts'                     : ['r6b', 'sensor',                 '',                  '',      '',  0,  0  ],
+  'hotwater_runtime_h'           : ['r6c', 'time',                   'h',                 '',      '',  3,  3  ],
+  'msd1_dvv'                     : ['r6d', 'sensor',                 '',                  '',      '',  0,  0  ],
+  'passive_cooling_runtime_h'    : ['r6e', 'time',                   'h',                 '',      '',  3,  4  ],
+  'msd1_dpas'                    : ['r6f', 'sensor',                 '',                  '',      '',  0,  0  ],
+  'active_cooling_runtime_h'     : ['r70', 'time',                   'h',                 '',      '',  3,  5  ],
+  'msd1_dact'                    : ['r71', 'sensor',                 '',                  '',      '',  0,  0  ],
+  'boiler_6kw_on_runtime_h'      : ['r72', 'time',                   'h',                 '',      '',  3,  2  ],
+  'msd1_dts2'                    : ['r73', 'sensor',                 '',                  '',      '',  0,  0  ],
+  'graph_display_offset'         : ['r74', 'sensor',                 '',                  '',      '',  0,  0  ],
+  'room_sensor_set_t'            : ['indr_t', 'generated_input',        'ºC',                0,     50, 0, 0 ],
+  'time'                         : ['time', 'generated_sensor',       's',                 0,      0, 0, 0   ],
+  'heatpump_evu_block'           : ['evu', 'generated_input',        '',                   0,      1, 0, 0   ],
+  'mqtt_counter': ['mqtt_counter', 'generated_sensor', '', 0, 0, 0, 0],
+    'time_str': ['time_str', 'generated_sensor', '', 0, 0, 0, 0],
+    'timestamp': ['timestamp', 'generated_sensor', '', 0, 0, 0, 0],
+    'rssi': ['rssi', 'generated_sensor', '', 0, 0, 0, 0],
+    'app_info': ['app_info', 'generated_sensor', '', 0, 0, 0, 0],
+    'communication_status': ['communication_status','generated_sensor','',0,0,0,0],
+
+}
+
+# Translations of the names are in names/<language>.py
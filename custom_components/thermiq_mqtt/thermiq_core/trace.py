@@ -0,0 +1,90 @@
+"""Compressed, timestamped logs of ThermIQ-MQTT traffic.
+
+A trace is a gzip file of JSON lines. The first line is a header, every
+other line is one message as [milliseconds since start, topic, payload],
+where topic is data, write or set below the node topic:
+
+    {"trace": "thermiq", "version": 1, "node": "ThermIQ/room2", "start": 1705320000.0}
+    [0,"data","{\\"Client_Name\\":\\"ThermIQ_room2\\",...}"]
+    [10012,"data","{...}"]
+    [10480,"write","{\\"d050\\":21}"]
+
+Records are appended in batches, each batch a gzip member of its own, so a
+trace is readable even when the recording was not stopped cleanly.
+"""
+
+import gzip
+import json
+import os
+import time
+
+TRACE_MAGIC = "thermiq"
+TRACE_VERSION = 1
+TRACE_TOPICS = ("data", "write", "set")
+
+
+class TraceWriter:
+    """Recorder of the messages of one node, kept until take() is called."""
+
+    def __init__(self, node, clock=time.monotonic):
+        self.header = {
+            "trace": TRACE_MAGIC,
+            "version": TRACE_VERSION,
+            "node": node,
+            "start": time.time(),
+        }
+        self.count = 0
+        self._clock = clock
+        self._start = clock()
+        self._records = []
+
+    def __len__(self):
+        return len(self._records)
+
+    def record(self, topic, payload):
+        """Record a message on topic (data, write or set) at the current time."""
+        if isinstance(payload, (bytes, bytearray)):
+            payload = payload.decode("utf-8", "replace")
+        elapsed = round((self._clock() - self._start) * 1000)
+        self._records.append((elapsed, topic, payload))
+        self.count += 1
+
+    def take(self):
+        """Return the records kept and forget them."""
+        records = self._records
+        self._records = []
+        return records
+
+
+def append_trace(path, header, records):
+    """Append records to the trace in path, created with header if missing."""
+    new = not os.path.exists(path)
+    with gzip.open(path, "at", encoding="utf-8") as file:
+        if new:
+            file.write(json.dumps(header) + "\n")
+        for record in records:
+            file.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+
+def read_trace(path):
+    """Return the header of a trace and an iterator of (seconds, topic, payload).
+
+    Raises ValueError if path is not a ThermIQ trace.
+    """
+    file = gzip.open(path, "rt", encoding="utf-8")
+    try:
+        header = json.loads(file.readline())
+        if not isinstance(header, dict) or header.get("trace") != TRACE_MAGIC:
+            raise ValueError(f"{path} is not a ThermIQ trace")
+    except (OSError, ValueError):
+        file.close()
+        raise
+
+    def records():
+        with file:
+            for line in file:
+                if line.strip():
+                    elapsed, topic, payload = json.loads(line)
+                    yield elapsed / 1000, topic, payload
+
+    return header, records()
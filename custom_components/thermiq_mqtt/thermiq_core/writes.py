@@ -0,0 +1,104 @@
+"""Tracking of register writes until ThermIQ-MQTT echoes them back."""
+
+WRITE_CONFIRMED = "confirmed"
+WRITE_RETRY = "retry"
+WRITE_EXPIRED = "expired"
+
+
+class PendingWrite:
+    """A register write waiting for its value in a data frame."""
+
+    __slots__ = (
+        "register",
+        "topic",
+        "key",
+        "value",
+        "sent",
+        "first_sent",
+        "frames",
+        "retries",
+    )
+
+    def __init__(self, register, topic, key, value, now):
+        self.register = register
+        self.topic = topic
+        self.key = key
+        self.value = value
+        self.first_sent = now
+        self.sent = now
+        self.frames = 0
+        self.retries = 0
+
+
+class WriteTracker:
+    """Pending register writes, keyed by register.
+
+    check() is called for every data frame, and at deadline() when no frame
+    comes in. A write is confirmed when a decoded frame holds the written
+    value. It is retried when it has not been confirmed within max_frames
+    frames or timeout seconds, and expires when all retries are used.
+    """
+
+    def __init__(self, max_frames=3, timeout=60.0, retries=1):
+        self.max_frames = max_frames
+        self.timeout = timeout
+        self.retries = retries
+        self.pending = {}
+        self.confirmed = 0
+        self.expired = 0
+        self.retried = 0
+        self.last_latency = None
+
+    def __bool__(self):
+        return bool(self.pending)
+
+    def add(self, register, topic, key, value, now):
+        """Track a write, replacing an earlier write to the same register."""
+        self.pending[register] = PendingWrite(register, topic, key, value, now)
+
+    def deadline(self):
+        """Return the time the first pending write times out, None if none."""
+        if not self.pending:
+            return None
+        return min(write.sent for write in self.pending.values()) + self.timeout
+
+    def check(self, state, now, frame=True):
+        """Return (result, write, latency) for writes confirmed, retried or expired.
+
+        state is None for a frame that was not decoded, like a repeat of the
+        last one. The state may then hold a value set locally before it was
+        written, so that frame only counts towards a retry. frame is False
+        when checking for timeouts without a frame.
+        """
+        results = []
+        for register, write in list(self.pending.items()):
+            if frame:
+                write.frames += 1
+            if state is not None and state.get(register) == write.value:
+                del self.pending[register]
+                latency = now - write.first_sent
+                self.confirmed += 1
+                self.last_latency = latency
+                results.append((WRITE_CONFIRMED, write, latency))
+            elif write.frames >= self.max_frames or now - write.sent >= self.timeout:
+                if write.retries < self.retries:
+                    write.retries += 1
+                    write.frames = 0
+                    write.sent = now
+                    self.retried += 1
+                    results.append((WRITE_RETRY, write, now - write.first_sent))
+                else:
+                    del self.pending[register]
+                    self.expired += 1
+                    results.append((WRITE_EXPIRED, write, now - write.first_sent))
+        return results
+
+    def stats(self):
+        """Return the write counters."""
+        return {
+            "pending": len(self.pending),
+            "confirmed": self.confirmed,
+            "retried": self.retried,
+            "expired": self.expired,
+            "last_latency": self.last_latency,
+        }
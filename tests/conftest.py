@@ -0,0 +1,14 @@
+"""Tests of the thermiq_core package and the HeatPump adapter.
+
+The thermiq_core tests run without Home Assistant, the adapter tests are
+skipped when it is not installed.
+"""
+
+import os
+import sys
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+
+sys.path.insert(0, os.path.join(ROOT, "custom_components", "thermiq_mqtt"))
+# The adapter tests import the integration itself
+sys.path.insert(0, ROOT)
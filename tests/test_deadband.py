@@ -0,0 +1,52 @@
+"""Tests of the sensor deadbands."""
+
+import pytest
+
+from thermiq_core.deadband import Deadband, deadband_table, parse_deadbands
+
+
+def test_deadband():
+    deadband = Deadband(0.5)
+    assert deadband.accept(20)
+    assert not deadband.accept(20)
+    assert not deadband.accept(20.3)
+    assert deadband.accept(20.5)
+
+
+def test_hysteresis_on_turn():
+    deadband = Deadband(0.2, 0.1)
+    assert deadband.accept(20.0)
+    assert deadband.accept(20.2)
+    assert not deadband.accept(20.0)
+    assert deadband.accept(19.9)
+
+
+def test_non_numbers_pass():
+    deadband = Deadband(1)
+    assert deadband.accept(5)
+    assert deadband.accept("12:00")
+    assert deadband.accept(None)
+    assert deadband.accept(5.5)
+
+
+def test_parse_deadbands():
+    assert parse_deadbands("indoor_t=0.3/0.1, boiler_t=1") == {
+        "indoor_t": (0.3, 0.1),
+        "boiler_t": (1.0, 0),
+    }
+    assert parse_deadbands("") == {}
+
+
+@pytest.mark.parametrize(
+    "text", ["nothing=1", "time=1", "app_info=1", "indoor_t=-1", "indoor_t=x"]
+)
+def test_parse_deadbands_invalid(text):
+    with pytest.raises(ValueError):
+        parse_deadbands(text)
+
+
+def test_deadband_table():
+    table = deadband_table({"boiler_t": (1.0, 0)})
+    assert table["indoor_t"] == (0.2, 0.1)
+    assert table["boiler_t"] == (1.0, 0)
+    assert "indoor_dec_t" not in table
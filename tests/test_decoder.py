@@ -0,0 +1,86 @@
+"""Tests of the frame decoder."""
+
+import json
+
+import pytest
+
+from thermiq_core.decoder import (
+    UNSET_VALUE,
+    FrameDecoder,
+    flipped_bits,
+    is_thermiq_frame,
+)
+
+
+def frame(hex_format=False, **registers):
+    """Return a data frame with every register 0, except registers."""
+    data = {"Client_Name": "ThermIQ_room2", "time": "2024-01-01 12:00:00"}
+    for register in range(0x75):
+        key = f"r{register:02x}" if hex_format else f"d{register:03d}"
+        data[key] = registers.get(f"r{register:02x}", 0)
+    return data
+
+
+def apply(decoder, data):
+    return decoder.apply(data, json.dumps(data).encode())
+
+
+@pytest.mark.parametrize("hex_format", [False, True])
+def test_first_frame_changes_every_register(hex_format):
+    decoder = FrameDecoder()
+    changed = apply(decoder, frame(hex_format, r00=5, r62=8))
+    assert decoder.state["r00"] == 5
+    assert decoder.state["r62"] == 8
+    assert changed["r00"] == UNSET_VALUE
+    assert changed["r05"] == UNSET_VALUE
+
+
+def test_only_changed_registers_are_returned():
+    decoder = FrameDecoder()
+    apply(decoder, frame(r00=5))
+    changed = apply(decoder, frame(r00=6))
+    assert changed["r00"] == 5
+    assert "r05" not in changed
+
+
+def test_decimal_part_is_combined():
+    decoder = FrameDecoder()
+    apply(decoder, frame(r01=21, r02=5))
+    assert decoder.state["r01"] == 21.5
+
+
+def test_repeat_payload():
+    decoder = FrameDecoder()
+    data = frame()
+    payload = json.dumps(data).encode()
+    decoder.apply(data, payload)
+    assert decoder.is_repeat(payload)
+    decoder.reset()
+    assert not decoder.is_repeat(payload)
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        ({"Client_Name": "ThermIQ_room2"}, True),
+        ({"Client_Name": "other"}, False),
+        ({"foo": 1}, False),
+        ({"Client_Name": 3}, False),
+        ([1, 2], False),
+        (5, False),
+    ],
+)
+def test_is_thermiq_frame(data, expected):
+    assert is_thermiq_frame(data) is expected
+
+
+def test_flipped_bits():
+    assert flipped_bits(8, 9) == 1
+    assert flipped_bits(0b1100, 0b0110) == 0b1010
+
+
+def test_flipped_bits_without_previous_word():
+    # Every bit set in the first frame is notified
+    assert flipped_bits(UNSET_VALUE, 8) & 8
+    assert flipped_bits(None, 8) & 8
+    assert flipped_bits(2.5, 8) & 8
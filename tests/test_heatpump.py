@@ -0,0 +1,209 @@
+"""Tests of the HeatPump adapter on a minimal fake hass."""
+
+import asyncio
+import json
+import types
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.thermiq_mqtt.const import (
+    CONF_ID,
+    CONF_LANGUAGE,
+    CONF_MQTT_DBG,
+    CONF_MQTT_HEX,
+    CONF_MQTT_NODE,
+    CONF_WRITE_ACK_TIMEOUT,
+    CONF_WRITE_BATCH,
+    CONF_WRITE_DEBOUNCE,
+    CONF_WRITE_RETRIES,
+)
+from custom_components.thermiq_mqtt import heatpump as heatpump_module
+from custom_components.thermiq_mqtt import shared_topic
+from custom_components.thermiq_mqtt.heatpump import TRACE_FLUSH, HeatPump
+from custom_components.thermiq_mqtt.thermiq_core.trace import read_trace
+
+
+class FakeBus:
+    """Event bus keeping the events fired."""
+
+    def __init__(self):
+        self.fired = []
+
+    def fire(self, event_type, event_data=None):
+        self.fired.append((event_type, event_data))
+
+    def async_fire(self, event_type, event_data=None):
+        self.fired.append((event_type, event_data))
+
+    def async_listen(self, event_type, listener):
+        return lambda: None
+
+
+class FakeHass:
+    """The parts of HomeAssistant used by a heatpump."""
+
+    def __init__(self, loop, config_dir):
+        self.loop = loop
+        self.bus = FakeBus()
+        self.data = {}
+        self.config = types.SimpleNamespace(
+            components=set(), path=lambda *parts: str(config_dir.joinpath(*parts))
+        )
+
+    def async_create_task(self, target, *args, **kwargs):
+        return self.loop.create_task(target)
+
+    def async_create_background_task(self, target, *args, **kwargs):
+        return self.loop.create_task(target)
+
+    def async_add_executor_job(self, target, *args):
+        return self.loop.run_in_executor(None, target, *args)
+
+    def async_run_hass_job(self, job, *args):
+        return job.target(*args)
+
+
+def make_entry(**data):
+    """Return a config entry of heatpump vp1."""
+    return types.SimpleNamespace(
+        data={
+            CONF_ID: "vp1",
+            CONF_MQTT_NODE: "ThermIQ/room2",
+            CONF_LANGUAGE: "en",
+            CONF_MQTT_HEX: False,
+            CONF_MQTT_DBG: False,
+            **data,
+        },
+        options={},
+        entry_id="vp1",
+        title="thermiq_mqtt_vp1",
+    )
+
+
+@pytest.fixture
+def published(monkeypatch):
+    """The (topic, payload) of the MQTT messages published."""
+    messages = []
+
+    async def async_publish(hass, topic, payload, qos=0, retain=False):
+        messages.append((topic, json.loads(payload)))
+
+    monkeypatch.setattr(heatpump_module.mqtt, "async_publish", async_publish)
+    return messages
+
+
+def frame(**registers):
+    """Return a data frame payload with every register 0, except registers."""
+    data = {"Client_Name": "ThermIQ_room2", "time": "2024-01-01 12:00:00"}
+    for register in range(0x75):
+        data[f"d{register:03d}"] = registers.get(f"r{register:02x}", 0)
+    return json.dumps(data).encode()
+
+
+async def make_heatpump(config_dir, **data):
+    """Return a configured heatpump on a fake hass."""
+    hass = FakeHass(asyncio.get_running_loop(), config_dir)
+    heatpump = HeatPump(hass, make_entry(**data))
+    await heatpump.update_config(make_entry(**data))
+    return heatpump
+
+
+def test_invalid_frames_are_counted(tmp_path):
+    async def run():
+        heatpump = await make_heatpump(tmp_path)
+        heatpump.process_frame(b"{not json")
+        heatpump.process_frame(b'{"foo": 1}')
+        heatpump.process_frame(b"[1, 2]")
+        heatpump.process_frame(frame())
+        return heatpump
+
+    heatpump = asyncio.run(run())
+    metrics = heatpump.metrics
+    assert metrics["json_errors"] == 1
+    assert metrics["rejected_frames"] == 2
+    assert metrics["frames_processed"] == 1
+    assert [entry["result"] for entry in heatpump.recent_frames] == [
+        "invalid_json",
+        "rejected",
+        "rejected",
+        "ok",
+    ]
+
+
+@pytest.mark.parametrize("batch", [0, 500])
+def test_pending_writes_use_the_old_node(tmp_path, published, batch):
+    data = {CONF_WRITE_DEBOUNCE: 10000, CONF_WRITE_BATCH: batch}
+
+    async def run():
+        heatpump = await make_heatpump(tmp_path, **data)
+        heatpump.process_frame(frame())
+        heatpump.async_request_write("integral2_hysteresis_t", 42)
+        assert published == []
+        await heatpump.update_config(
+            make_entry(**{CONF_MQTT_NODE: "ThermIQ/other"}, **data)
+        )
+        await asyncio.sleep(0)
+
+    asyncio.run(run())
+    assert published == [("ThermIQ/room2/write", {"d080": 42})]
+
+
+def test_write_expires_without_frames(tmp_path, published):
+    data = {CONF_WRITE_DEBOUNCE: 0, CONF_WRITE_ACK_TIMEOUT: 0.01, CONF_WRITE_RETRIES: 1}
+
+    async def run():
+        heatpump = await make_heatpump(tmp_path, **data)
+        heatpump.process_frame(frame())
+        heatpump.async_request_write("integral2_hysteresis_t", 42)
+        await asyncio.sleep(0.1)
+        return heatpump
+
+    heatpump = asyncio.run(run())
+    assert published == [("ThermIQ/room2/write", {"d080": 42})] * 2
+    events = [data for _, data in heatpump._hass.bus.fired if data is not None]
+    assert [event["result"] for event in events if "result" in event] == ["expired"]
+    assert heatpump.write_stats["expired"] == 1
+    assert heatpump.metrics["mqtt_publishes"] == 2
+
+
+def test_shutdown_cancels_timers(tmp_path, published):
+    path = tmp_path / "trace.jsonl.gz"
+
+    async def run():
+        heatpump = await make_heatpump(tmp_path, **{CONF_WRITE_DEBOUNCE: 10})
+        heatpump.async_start_recording(str(path), 10)
+        heatpump.async_request_write("integral2_hysteresis_t", 42)
+        heatpump.async_shutdown()
+        await asyncio.sleep(0.05)
+        return heatpump
+
+    heatpump = asyncio.run(run())
+    assert published == []
+    assert not heatpump.recording
+    assert path.exists()
+
+
+def test_trace_appends_run_in_order(tmp_path):
+    path = tmp_path / "trace.jsonl.gz"
+    count = 2 * TRACE_FLUSH + 1
+
+    async def run():
+        heatpump = await make_heatpump(tmp_path)
+        heatpump.async_start_recording(str(path), 10)
+        for n in range(count):
+            heatpump.message_received(types.SimpleNamespace(payload=str(n)))
+        heatpump.async_stop_recording()
+        await heatpump._trace_append
+
+    asyncio.run(run())
+    header, records = read_trace(str(path))
+    assert [payload for _, _, payload in records] == [str(n) for n in range(count)]
+
+
+def test_shared_topic():
+    assert shared_topic("ThermIQ/room2/data") == "ThermIQ/+/data"
+    assert shared_topic("home/ThermIQ/room2/data") == "home/ThermIQ/+/data"
+    # +/data would match the data topic of any device
+    assert shared_topic("ThermIQ/data") == "ThermIQ/data"
@@ -0,0 +1,35 @@
+"""Tests of the entity selection."""
+
+import pytest
+
+from thermiq_core.registers import BY_PANEL, REGISTERS
+from thermiq_core.selection import parse_selection
+
+
+def test_empty_selects_all():
+    assert parse_selection("") is None
+    assert parse_selection(" , ") is None
+
+
+def test_names_and_wildcards():
+    selected = parse_selection("indoor_t, boiler_*")
+    assert "indoor_t" in selected
+    assert "boiler_t" in selected
+    assert "outdoor_t" not in selected
+
+
+def test_panel_and_type():
+    assert parse_selection("panel:2") == {spec.name for spec in BY_PANEL[2]}
+    selected = parse_selection("type:temperature")
+    assert all(REGISTERS[name].type == "temperature" for name in selected)
+
+
+def test_only_removals():
+    selected = parse_selection("-outdoor_t")
+    assert "outdoor_t" not in selected
+    assert len(selected) == len(REGISTERS) - 1
+
+
+def test_unknown_register():
+    with pytest.raises(ValueError):
+        parse_selection("nothing_like_this")
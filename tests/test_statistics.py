@@ -0,0 +1,49 @@
+"""Tests of the hourly register statistics."""
+
+from thermiq_core.decoder import UNSET_VALUE
+from thermiq_core.statistics import STATISTICS_REGISTERS, WindowStatistics
+
+
+def test_time_weighted_mean():
+    state = {"r00": 10}
+    statistics = WindowStatistics(["r00"], state, 0)
+    state["r00"] = 20
+    statistics.update({"r00": 10}, state, 30)
+    assert statistics.close(40) == {"r00": ((10 * 30 + 20 * 10) / 40, 10, 20)}
+
+
+def test_value_held_into_next_window():
+    state = {"r00": 10}
+    statistics = WindowStatistics(["r00"], state, 0)
+    statistics.close(10)
+    assert statistics.close(20) == {"r00": (10, 10, 10)}
+
+
+def test_registers_without_value_are_left_out():
+    state = {}
+    statistics = WindowStatistics(["r00", "r01"], state, 0)
+    state["r00"] = 5
+    statistics.update({"r00": None, "r05": 1}, state, 10)
+    assert statistics.close(20) == {"r00": (5, 5, 5)}
+    assert "r00" in statistics
+    assert "r05" not in statistics
+
+
+def test_non_numbers_are_ignored():
+    state = {"r00": "x"}
+    statistics = WindowStatistics(["r00"], state, 0)
+    assert statistics.close(10) == {}
+
+
+def test_measured_registers_only():
+    types = {spec.type for spec in STATISTICS_REGISTERS}
+    assert types == {"temperature", "sensor"}
+
+
+def test_unset_registers_are_not_seeded():
+    state = {"r00": UNSET_VALUE, "r05": 30}
+    statistics = WindowStatistics(["r00", "r05"], state, 0)
+    assert statistics.close(10) == {"r05": (30, 30, 30)}
+    state["r00"] = -1
+    statistics.update({"r00": 0}, state, 10)
+    assert statistics.close(20) == {"r00": (-1, -1, -1), "r05": (30, 30, 30)}
@@ -0,0 +1,62 @@
+"""Tests of the register write tracking."""
+
+from thermiq_core.writes import (
+    WRITE_CONFIRMED,
+    WRITE_EXPIRED,
+    WRITE_RETRY,
+    WriteTracker,
+)
+
+
+def results(tracker, state, now, frame=True):
+    return [result for result, _, _ in tracker.check(state, now, frame)]
+
+
+def test_confirmed_by_decoded_frame():
+    tracker = WriteTracker(max_frames=3, timeout=60, retries=1)
+    tracker.add("r50", "topic", "d080", 42, 0)
+    assert results(tracker, {"r50": 50}, 1) == []
+    assert results(tracker, {"r50": 42}, 2) == [WRITE_CONFIRMED]
+    assert not tracker
+    assert tracker.stats()["confirmed"] == 1
+    assert tracker.last_latency == 2
+
+
+def test_not_confirmed_by_repeat_frame():
+    # The local state already holds the value set from the UI
+    tracker = WriteTracker(max_frames=2, timeout=60, retries=1)
+    tracker.add("r50", "topic", "d080", 42, 0)
+    assert results(tracker, None, 1) == []
+    assert results(tracker, None, 2) == [WRITE_RETRY]
+    assert tracker.stats()["confirmed"] == 0
+
+
+def test_retried_then_expired():
+    tracker = WriteTracker(max_frames=1, timeout=60, retries=1)
+    tracker.add("r50", "topic", "d080", 42, 0)
+    assert results(tracker, {"r50": 50}, 1) == [WRITE_RETRY]
+    assert results(tracker, {"r50": 50}, 2) == [WRITE_EXPIRED]
+    assert tracker.stats() == {
+        "pending": 0,
+        "confirmed": 0,
+        "retried": 1,
+        "expired": 1,
+        "last_latency": None,
+    }
+
+
+def test_timeout():
+    tracker = WriteTracker(max_frames=10, timeout=5, retries=0)
+    tracker.add("r50", "topic", "d080", 42, 0)
+    assert results(tracker, {"r50": 50}, 6) == [WRITE_EXPIRED]
+
+
+def test_timeout_without_frames():
+    tracker = WriteTracker(max_frames=3, timeout=5, retries=1)
+    tracker.add("r50", "topic", "d080", 42, 0)
+    assert tracker.deadline() == 5
+    assert results(tracker, None, 4) == []
+    assert results(tracker, None, 6, frame=False) == [WRITE_RETRY]
+    assert tracker.deadline() == 11
+    assert results(tracker, None, 11, frame=False) == [WRITE_EXPIRED]
+    assert tracker.deadline() is None